@@ -0,0 +1,17 @@
+"""\
+Miroslava's Benchmarks
+======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Microbenchmarks for the hot paths of the framework. Every module named
+``bench_*`` exposes a ``run`` function returning a mapping of metric
+names to numbers and can be executed on its own, for example::
+
+    python -m benchmarks.bench_request
+
+The whole suite runs with ``python -m benchmarks``, which can save the
+results as JSON and compare them against a baseline.
+"""
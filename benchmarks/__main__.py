@@ -0,0 +1,152 @@
+"""\
+Benchmark Runner
+================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Run the whole benchmark suite, or a selection of it, and optionally
+save the results as JSON and compare them against a saved baseline::
+
+    python -m benchmarks --output baseline.json
+    python -m benchmarks --baseline baseline.json --threshold 0.1
+
+A metric regresses when it is worse than the baseline by more than the
+threshold, as a fraction of the baseline. Every metric is lower is
+better, except the throughputs ending in ``.rps``. The runner exits
+with status ``1`` if any metric regressed, so it can gate a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+import typing as t
+from datetime import UTC
+from datetime import datetime
+
+import benchmarks
+from benchmarks._common import report
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+type Suite = dict[str, dict[str, float]]
+
+
+def discover() -> list[str]:
+    """Return the names of the benchmark modules, without the prefix."""
+    return sorted(
+        module.name.removeprefix("bench_")
+        for module in pkgutil.iter_modules(benchmarks.__path__)
+        if module.name.startswith("bench_")
+    )
+
+
+def run(names: Sequence[str]) -> Suite:
+    """Run the named benchmark modules and return their results.
+
+    :param names: Benchmarks to run, for example ``dispatch``.
+    """
+    suite: Suite = {}
+    for name in names:
+        module = importlib.import_module(f"benchmarks.bench_{name}")
+        suite[name] = results = module.run()
+        report(name, results)
+        print()
+    return suite
+
+
+def compare(
+    suite: Suite,
+    baseline: Suite,
+    threshold: float,
+) -> list[str]:
+    """Print how the results changed and return the regressions.
+
+    :param suite: Results of this run.
+    :param baseline: Results to compare against.
+    :param threshold: Allowed slowdown as a fraction of the baseline.
+    """
+    regressions = []
+    print("Comparison")
+    print("==========")
+    for name, results in suite.items():
+        previous = baseline.get(name, {})
+        for metric, value in results.items():
+            before = previous.get(metric)
+            if before is None:
+                continue
+            if before:
+                change = value / before - 1
+            else:
+                change = float("inf") if value else 0.0
+            if metric.endswith(".rps"):
+                change = -change
+            key = f"{name}.{metric}"
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(key)
+            print(
+                f"{key:<40} {before:>14.1f} {value:>14.1f} "
+                f"{change:>+8.1%}{flag}"
+            )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the suite from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the benchmark suite."
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="name",
+        help=f"benchmarks to run, one of {', '.join(discover())}",
+    )
+    parser.add_argument("-o", "--output", help="save results to this file")
+    parser.add_argument("-b", "--baseline", help="compare to this file")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown as a fraction, defaults to 0.1",
+    )
+    args = parser.parse_args(argv)
+    available = discover()
+    unknown = set(args.names) - set(available)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    suite = run(args.names or available)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "created": datetime.now(UTC).isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": suite,
+                },
+                f,
+                indent=2,
+            )
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(suite, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} metrics regressed.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
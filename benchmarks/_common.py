@@ -0,0 +1,73 @@
+"""\
+Benchmark Helpers
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Small timing and allocation helpers shared by the benchmark modules.
+Timings are reported in nanoseconds per call using the best of several
+repeats, which is the least noisy estimate on a busy machine.
+"""
+
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+import typing as t
+
+type Results = dict[str, float]
+
+
+def time_ns(
+    func: t.Callable[[], object],
+    number: int = 10_000,
+    repeat: int = 5,
+) -> float:
+    """Return the best observed cost of calling ``func`` in ns.
+
+    :param func: Zero-argument callable to benchmark.
+    :param number: Calls per repeat, defaults to ``10_000``.
+    :param repeat: Number of repeats, defaults to ``5``.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def allocations(
+    func: t.Callable[[], object],
+    number: int = 1_000,
+) -> tuple[float, float]:
+    """Return the memory blocks and bytes retained per call.
+
+    Each result of ``func`` is kept alive until the snapshot is taken,
+    so the numbers reflect everything a single call allocates and
+    hands back to the caller.
+
+    :param func: Zero-argument callable to measure.
+    :param number: Calls to average over, defaults to ``1_000``.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = [func() for _ in range(number)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del kept
+    return blocks / number, size / number
+
+
+def report(title: str, results: Results) -> None:
+    """Print benchmark results as an aligned table."""
+    print(title)
+    print("=" * len(title))
+    width = max(map(len, results), default=0)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:>12.1f}")
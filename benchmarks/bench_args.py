@@ -0,0 +1,63 @@
+"""\
+Query Argument Benchmarks
+=========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of reading a handful of parameters out of a long search query
+string, comparing the old behaviour (``parse_qsl`` into a ``MultiDict``
+on every access) against the cached, lazily decoded ``QueryArgs``.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qsl
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.datastructures import MultiDict
+from miroslava.datastructures import QueryArgs
+
+QUERY_STRING = "&".join(
+    [
+        "q=red+running+shoes",
+        "limit=20",
+        "page=3",
+        "sort=price%3Aasc",
+        *(f"filter.{n}=brand%3Avalue{n}" for n in range(40)),
+        *(f"facet={n}" for n in range(20)),
+    ]
+)
+KEYS = ("q", "limit", "page", "sort", "missing")
+
+
+def eager() -> None:
+    """Re-parse the query string for every key, as before."""
+    for key in KEYS:
+        args = MultiDict(parse_qsl(QUERY_STRING, keep_blank_values=True))
+        args.getlist(key)
+
+
+def lazy() -> None:
+    """Parse once and decode only the requested keys."""
+    args = QueryArgs(QUERY_STRING)
+    args.get("q")
+    args.get("limit", 20, type_=int)
+    args.get("page", 1, type_=int)
+    args.get("sort")
+    args.get("missing")
+
+
+def run() -> Results:
+    """Run the query argument benchmarks."""
+    return {
+        "read5.eager.ns": time_ns(eager, number=1_000),
+        "read5.lazy.ns": time_ns(lazy, number=1_000),
+    }
+
+
+if __name__ == "__main__":
+    report("Query arguments", run())
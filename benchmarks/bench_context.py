@@ -0,0 +1,64 @@
+"""\
+Context Benchmarks
+==================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost and allocations of setting up the contexts for one request, either
+with a fresh ``AppContext`` and ``RequestContext`` pushed separately,
+or with a pooled request context pushed once.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import allocations
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+from miroslava.globals import AppContext
+from miroslava.globals import RequestContext
+from miroslava.globals import g
+
+app = Miroslava(__name__)
+ENVIRON = {"REQUEST_METHOD": "GET", "PATH_INFO": "/", "QUERY_STRING": ""}
+REQUEST = app.request_class(ENVIRON)
+
+
+def fresh() -> tuple[AppContext, RequestContext]:
+    """Previous behaviour: two new contexts and two pushes."""
+    app_ctx = AppContext(app)
+    request_ctx = RequestContext(app, ENVIRON, request=REQUEST)
+    app_ctx.push()
+    request_ctx.push()
+    g.user = "akshay"
+    request_ctx.pop()
+    app_ctx.pop()
+    return app_ctx, request_ctx
+
+
+def pooled() -> RequestContext:
+    """Pooled request context with a single push."""
+    request_ctx = app.request_context(REQUEST)
+    request_ctx.push()
+    g.user = "akshay"
+    request_ctx.pop()
+    app.release_context(request_ctx)
+    return request_ctx
+
+
+def run() -> Results:
+    """Run the context benchmarks."""
+    results: Results = {}
+    for name, func in (("fresh", fresh), ("pooled", pooled)):
+        results[f"{name}.ns"] = time_ns(func)
+        blocks, size = allocations(func)
+        results[f"{name}.blocks"] = blocks
+        results[f"{name}.bytes"] = size
+    return results
+
+
+if __name__ == "__main__":
+    report("Contexts", run())
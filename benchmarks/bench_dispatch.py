@@ -0,0 +1,65 @@
+"""\
+Dispatch Benchmarks
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of ``dispatch_request`` against synthetic route tables of 10, 100,
+and 1,000 routes. Half of the rules of every table are plain paths and
+the other half have a variable part. Requests are made to the first
+and to the last rule of each kind, and to a path which matches none,
+so the numbers show how matching scales with the size of the table.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+
+SIZES: tuple[int, ...] = (10, 100, 1_000)
+
+
+def view(**_kwargs: object) -> str:
+    """Return a short text body."""
+    return "ok"
+
+
+def build(size: int) -> Miroslava:
+    """Return an app with ``size`` routes."""
+    app = Miroslava(__name__)
+    for n in range(size // 2):
+        app.add_url_rule(f"/static/{n}/page", f"static_{n}", view)
+        app.add_url_rule(f"/users/{n}/<int:id>", f"dynamic_{n}", view)
+    return app
+
+
+def run() -> Results:
+    """Run the dispatch benchmarks."""
+    results: Results = {}
+    for size in SIZES:
+        app = build(size)
+        last = size // 2 - 1
+        paths = {
+            "static.first": "/static/0/page",
+            "static.last": f"/static/{last}/page",
+            "dynamic.first": "/users/0/42",
+            "dynamic.last": f"/users/{last}/42",
+            "miss": "/nowhere",
+        }
+        for name, path in paths.items():
+            request = app.request_class(
+                {"REQUEST_METHOD": "GET", "PATH_INFO": path}
+            )
+            results[f"{size}.{name}.ns"] = time_ns(
+                lambda r=request, app=app: app.dispatch_request(r),
+                number=100_000 // size,
+            )
+    return results
+
+
+if __name__ == "__main__":
+    report("Dispatch", run())
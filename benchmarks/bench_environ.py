@@ -0,0 +1,50 @@
+"""\
+Environ Benchmarks
+==================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of turning the raw head of a typical browser request into a
+WSGI-style environment with ``make_environ``, on its own and followed
+by the construction of the ``Request``.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import allocations
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+
+app = Miroslava(__name__)
+HEAD: bytes = (
+    b"GET /search?q=miroslava&limit=20&page=2 HTTP/1.1\r\n"
+    b"Host: localhost:9001\r\n"
+    b"User-Agent: Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101\r\n"
+    b"Accept: text/html,application/xhtml+xml,*/*;q=0.8\r\n"
+    b"Accept-Language: en-GB,en;q=0.5\r\n"
+    b"Accept-Encoding: gzip, deflate, br\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Cookie: session=abc123; theme=dark\r\n"
+    b"Cache-Control: max-age=0"
+)
+
+
+def run() -> Results:
+    """Run the environ benchmarks."""
+    results: Results = {}
+    results["make_environ.ns"] = time_ns(lambda: app.make_environ(HEAD))
+    results["make_environ+request.ns"] = time_ns(
+        lambda: app.request_class(app.make_environ(HEAD))
+    )
+    blocks, size = allocations(lambda: app.make_environ(HEAD))
+    results["alloc.blocks"] = blocks
+    results["alloc.bytes"] = size
+    return results
+
+
+if __name__ == "__main__":
+    report("Environ", run())
@@ -0,0 +1,57 @@
+"""\
+Context Global Benchmarks
+=========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Overhead of reading the current request and application through the
+``LocalProxy`` globals, compared with the direct accessors and with a
+bare ``ContextVar`` lookup.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+from miroslava.globals import AppContext
+from miroslava.globals import RequestContext
+from miroslava.globals import _cv_request
+from miroslava.globals import current_app
+from miroslava.globals import g
+from miroslava.globals import get_current_app
+from miroslava.globals import get_current_request
+from miroslava.globals import request
+
+app = Miroslava(__name__)
+ENVIRON = {"REQUEST_METHOD": "GET", "PATH_INFO": "/", "QUERY_STRING": ""}
+
+
+def run() -> Results:
+    """Run the context global benchmarks."""
+    results: Results = {}
+    with AppContext(app), RequestContext(app, ENVIRON):
+        g.user = "akshay"
+        results["proxy.request.method.ns"] = time_ns(lambda: request.method)
+        results["direct.request.method.ns"] = time_ns(
+            lambda: get_current_request().method
+        )
+        results["contextvar.request.method.ns"] = time_ns(
+            lambda: _cv_request.get().request.method
+        )
+        results["proxy.current_app.config.ns"] = time_ns(
+            lambda: current_app.config
+        )
+        results["direct.current_app.config.ns"] = time_ns(
+            lambda: get_current_app().config
+        )
+        results["proxy.g.attr.ns"] = time_ns(lambda: g.user)
+        results["proxy.bool.ns"] = time_ns(lambda: bool(request))
+    return results
+
+
+if __name__ == "__main__":
+    report("Context globals", run())
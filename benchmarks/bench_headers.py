@@ -0,0 +1,65 @@
+"""\
+Headers Benchmarks
+==================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of building and serialising a typical set of response headers,
+and of parsing a raw request header block, with ``Headers``.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.datastructures import Headers
+
+RAW = (
+    b"Host: localhost:9001\r\n"
+    b"User-Agent: Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101\r\n"
+    b"Accept: text/html,application/xhtml+xml,*/*;q=0.8\r\n"
+    b"Accept-Language: en-GB,en;q=0.5\r\n"
+    b"Accept-Encoding: gzip, deflate, br\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Cookie: session=abc123; theme=dark\r\n"
+)
+
+
+def build_and_serialise() -> bytes:
+    """Build the headers of a small response and serialise them."""
+    headers = Headers()
+    headers["Content-Type"] = "text/html; charset=utf-8"
+    headers["Cache-Control"] = "no-cache"
+    headers.add("Set-Cookie", "session=abc123; HttpOnly")
+    headers.add("Set-Cookie", "theme=dark")
+    return headers.to_wire()
+
+
+def parse_line_by_line() -> Headers:
+    """Parse a header block through the public ``add`` method."""
+    headers = Headers()
+    for line in RAW.decode("latin-1").split("\r\n"):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers.add(name, value.strip())
+    return headers
+
+
+def run() -> Results:
+    """Run the headers benchmarks."""
+    headers = Headers.from_bytes(RAW)
+    return {
+        "build+to_wire.ns": time_ns(build_and_serialise),
+        "parse.add.ns": time_ns(parse_line_by_line),
+        "parse.from_bytes.ns": time_ns(lambda: Headers.from_bytes(RAW)),
+        "getitem.common.ns": time_ns(lambda: headers["User-Agent"]),
+        "getitem.lower.ns": time_ns(lambda: headers["user-agent"]),
+        "contains.ns": time_ns(lambda: "Content-Type" in headers),
+    }
+
+
+if __name__ == "__main__":
+    report("Headers", run())
@@ -0,0 +1,65 @@
+"""\
+JSON Benchmarks
+===============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of turning large payloads into JSON responses with the default
+provider, in both its compact and pretty-printed forms, and with the
+``CompactJSONProvider``.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.utils import CompactJSONProvider
+from miroslava.utils import DefaultJSONProvider
+
+ROWS: list[dict[str, t.Any]] = [
+    {
+        "id": n,
+        "name": f"user-{n}",
+        "email": f"user{n}@example.com",
+        "active": n % 3 == 0,
+        "score": n * 1.5,
+        "tags": ["alpha", "beta", "γάμμα"],
+    }
+    for n in range(10_000)
+]
+SMALL: dict[str, t.Any] = {"status": "ok", "id": 42, "items": [1, 2, 3]}
+
+
+class PrettyJSONProvider(DefaultJSONProvider):
+    compact = False
+
+
+class CompactDefaultJSONProvider(DefaultJSONProvider):
+    compact = True
+
+
+def run() -> Results:
+    """Run the JSON benchmarks."""
+    results: Results = {}
+    providers = {
+        "default.pretty": PrettyJSONProvider(),
+        "default.compact": CompactDefaultJSONProvider(),
+        "compact": CompactJSONProvider(),
+    }
+    for name, provider in providers.items():
+        results[f"large.{name}.ns"] = time_ns(
+            lambda p=provider: p.response(ROWS), number=5, repeat=3
+        )
+        results[f"small.{name}.ns"] = time_ns(
+            lambda p=provider: p.response(SMALL)
+        )
+    return results
+
+
+if __name__ == "__main__":
+    report("JSON", run())
@@ -0,0 +1,74 @@
+"""\
+make_response Benchmarks
+========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of converting common view return values into responses with the
+type-dispatch table, compared against the previous ``isinstance``
+chain.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+from miroslava.wrappers import Response
+
+app = Miroslava(__name__)
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@app.response_converter(Point)
+def point_response(point: Point) -> Response:
+    return Response(f"{point.x},{point.y}")
+
+
+def chain(rv: t.Any) -> Response:
+    """Previous ``isinstance`` chain, without tuple handling."""
+    if isinstance(rv, Response):
+        return rv
+    if isinstance(rv, (dict, list)):
+        return app.json.response(rv)
+    if isinstance(rv, (str, bytes)):
+        return Response(rv, status=200)
+    if isinstance(rv, Point):
+        return point_response(rv)
+    return Response(str(rv), status=200)
+
+
+VALUES: dict[str, t.Any] = {
+    "str": "<h1>Hello</h1>",
+    "bytes": b"<h1>Hello</h1>",
+    "dict": {"id": 1, "name": "miroslava"},
+    "response": Response("ok"),
+    "custom": Point(1, 2),
+    "fallback": 42,
+}
+
+
+def run() -> Results:
+    """Run the make_response benchmarks."""
+    results: Results = {}
+    for name, value in VALUES.items():
+        results[f"{name}.chain.ns"] = time_ns(lambda v=value: chain(v))
+        results[f"{name}.table.ns"] = time_ns(
+            lambda v=value: app.make_response(v)
+        )
+    return results
+
+
+if __name__ == "__main__":
+    report("make_response", run())
@@ -0,0 +1,53 @@
+"""\
+Metrics Benchmarks
+==================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Per-request cost of recording metrics, which is paid by every request
+while ``METRICS_ENABLED`` is on, the extra cost of timing each phase
+with ``PHASE_TIMING``, and the cost of rendering a scrape of the
+Prometheus endpoint.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import allocations
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.metrics import PHASES
+from miroslava.metrics import Metrics
+from miroslava.metrics import PhaseTimer
+
+
+def run() -> Results:
+    """Run the metrics benchmarks."""
+    results: Results = {}
+    metrics = Metrics()
+
+    def record() -> None:
+        metrics.request_started()
+        metrics.request_finished("index", 200, 1_234_567, 512, 2048)
+
+    def phases() -> None:
+        timer = PhaseTimer()
+        for phase in PHASES:
+            timer.mark(phase)
+        timer.server_timing()
+        metrics.record_phases("index", timer)
+
+    for n in range(20):
+        metrics.request_started()
+        metrics.request_finished(f"endpoint-{n}", 200, n * 100_000, 1, 1)
+    results["record.ns"] = time_ns(record)
+    results["record.blocks"], results["record.bytes"] = allocations(record)
+    results["phases.ns"] = time_ns(phases)
+    results["render.ns"] = time_ns(metrics.render_prometheus, number=100)
+    return results
+
+
+if __name__ == "__main__":
+    report("Metrics", run())
@@ -0,0 +1,86 @@
+"""\
+MultiDict Benchmarks
+====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Allocation and lookup cost of ``MultiDict`` with inline single values,
+compared against the previous storage which wrapped every value in a
+list of its own.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from benchmarks._common import Results
+from benchmarks._common import allocations
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.datastructures import MultiDict
+
+PAIRS: list[tuple[str, str]] = [
+    ("q", "miroslava"),
+    ("limit", "20"),
+    ("page", "2"),
+    ("sort", "price"),
+    ("tag", "python"),
+    ("tag", "web"),
+    ("lang", "en"),
+    ("theme", "dark"),
+    ("ref", "home"),
+    ("utm_source", "newsletter"),
+]
+
+
+class ListMultiDict(dict[str, t.Any]):
+    """Previous list-per-key ``MultiDict`` storage, kept for comparison."""
+
+    def __init__(self, pairs: list[tuple[str, str]]) -> None:
+        super().__init__()
+        for key, value in pairs:
+            self.add(key, value)
+
+    def __getitem__(self, key: str) -> t.Any:
+        """Return the first value for a key."""
+        if key in self:
+            return super().__getitem__(key)[0]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        """Set the values of a key, wrapping a single value in a list."""
+        super().__setitem__(
+            key, [value] if not isinstance(value, list) else value
+        )
+
+    def add(self, key: str, value: t.Any) -> None:
+        if key in self:
+            super().__getitem__(key).append(value)
+        else:
+            self[key] = [value]
+
+    def getlist(self, key: str) -> list[t.Any]:
+        try:
+            return list(super().__getitem__(key))
+        except KeyError:
+            return []
+
+
+def run() -> Results:
+    """Run the multidict benchmarks."""
+    results: Results = {}
+    for label, cls in (("list", ListMultiDict), ("inline", MultiDict)):
+        results[f"build.{label}.ns"] = time_ns(lambda c=cls: c(PAIRS))
+        blocks, size = allocations(lambda c=cls: c(PAIRS))
+        results[f"alloc.{label}.blocks"] = blocks
+        results[f"alloc.{label}.bytes"] = size
+        md = cls(PAIRS)
+        results[f"getitem.{label}.ns"] = time_ns(lambda m=md: m["limit"])
+        results[f"getlist.{label}.ns"] = time_ns(lambda m=md: m.getlist("tag"))
+    return results
+
+
+if __name__ == "__main__":
+    report("MultiDict", run())
@@ -0,0 +1,89 @@
+"""\
+Request Benchmarks
+==================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Construction cost and per-request allocations of ``Request`` compared
+against the previous eager implementation, which copied every header
+out of the environment into a ``Headers`` object up front.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from benchmarks._common import Results
+from benchmarks._common import allocations
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.datastructures import Headers
+from miroslava.wrappers import Request
+
+ENVIRON: dict[str, t.Any] = {
+    "REQUEST_METHOD": "GET",
+    "PATH_INFO": "/search",
+    "QUERY_STRING": "q=miroslava&limit=20&page=2",
+    "SERVER_NAME": "localhost",
+    "SERVER_PORT": "9001",
+    "wsgi.url_scheme": "http",
+    "HTTP_HOST": "localhost:9001",
+    "HTTP_USER_AGENT": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101",
+    "HTTP_ACCEPT": "text/html,application/xhtml+xml,*/*;q=0.8",
+    "HTTP_ACCEPT_LANGUAGE": "en-GB,en;q=0.5",
+    "HTTP_ACCEPT_ENCODING": "gzip, deflate, br",
+    "HTTP_CONNECTION": "keep-alive",
+    "HTTP_COOKIE": "session=abc123; theme=dark",
+    "HTTP_CACHE_CONTROL": "max-age=0",
+}
+
+
+class EagerRequest:
+    """Previous ``Request`` constructor, kept for comparison."""
+
+    def __init__(self, environ: dict[str, t.Any]) -> None:
+        self.environ = environ
+        self.method = environ.get("REQUEST_METHOD", "GET").upper()
+        self.scheme = environ.get("wsgi.url_scheme", "http")
+        name = environ.get("SERVER_NAME")
+        self.server = (
+            None
+            if name is None
+            else (name, int(environ.get("SERVER_PORT", 9001)))
+        )
+        self.root_path = environ.get("SCRIPT_NAME", "")
+        self.path = environ.get("PATH_INFO", "/")
+        self.query_string = environ.get("QUERY_STRING", "")
+        self.headers = Headers()
+        for key, value in environ.items():
+            if key.startswith("HTTP_"):
+                self.headers[key[5:].replace("_", "-").title()] = value
+            elif key in ("CONTENT_LENGTH", "CONTENT_TYPE"):
+                self.headers[key.replace("_", "-").title()] = value
+        self.remote_addr = environ.get("REMOTE_ADDR")
+        self.data = environ.get("miroslava.request_body", b"")
+        self._form = None
+        self._json = None
+
+
+def run() -> Results:
+    """Run the request benchmarks."""
+    results: Results = {}
+    for label, cls in (("eager", EagerRequest), ("lean", Request)):
+        results[f"construct.{label}.ns"] = time_ns(lambda c=cls: c(ENVIRON))
+        results[f"construct+header.{label}.ns"] = time_ns(
+            lambda c=cls: c(ENVIRON).headers.get("User-Agent")
+        )
+        blocks, size = allocations(lambda c=cls: c(ENVIRON))
+        results[f"alloc.{label}.blocks"] = blocks
+        results[f"alloc.{label}.bytes"] = size
+    request = Request(ENVIRON)
+    results["args.cached.ns"] = time_ns(lambda: request.args)
+    results["url.cached.ns"] = time_ns(lambda: request.url)
+    return results
+
+
+if __name__ == "__main__":
+    report("Request", run())
@@ -0,0 +1,51 @@
+"""\
+Response Benchmarks
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Construction cost, allocations, and serialisation of a typical ``200``
+text response, which is what most views return.
+"""
+
+from __future__ import annotations
+
+from benchmarks._common import Results
+from benchmarks._common import allocations
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.serving import serialise_head
+from miroslava.wrappers import Response
+
+BODY = "<h1>Hello hello, good morning!!</h1>"
+
+
+def make_text() -> Response:
+    """Build the response a view returning a string ends up with."""
+    return Response(BODY, status=200)
+
+
+def serialise() -> tuple[bytes, bytes]:
+    """Build a response and everything that is written to the socket."""
+    response = Response(BODY, status=200)
+    return serialise_head(response, response.content_length), response.data
+
+
+def run() -> Results:
+    """Run the response benchmarks."""
+    response = make_text()
+    blocks, size = allocations(make_text)
+    return {
+        "construct.ns": time_ns(make_text),
+        "construct+serialise.ns": time_ns(serialise),
+        "data.ns": time_ns(lambda: response.data),
+        "repr.ns": time_ns(lambda: repr(response)),
+        "alloc.blocks": blocks,
+        "alloc.bytes": size,
+    }
+
+
+if __name__ == "__main__":
+    report("Response", run())
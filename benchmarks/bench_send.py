@@ -0,0 +1,63 @@
+"""\
+Send Benchmarks
+===============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of ``send_response``, which serialises a response and writes it to
+the client socket, for a small text body, a 64 KiB body, and a body
+streamed in chunks. The responses are written to one end of a socket
+pair while a thread drains the other end.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+
+app = Miroslava(__name__)
+SMALL: str = "<h1>Hello hello, good morning!!</h1>"
+LARGE: bytes = b"x" * 65_536
+CHUNKS: tuple[bytes, ...] = (b"y" * 4_096,) * 16
+
+
+def drain(sock: socket.socket) -> None:
+    """Read from a socket until it is closed."""
+    while sock.recv(262_144):
+        pass
+
+
+def run() -> Results:
+    """Run the send benchmarks."""
+    results: Results = {}
+    writer, reader = socket.socketpair()
+    thread = threading.Thread(target=drain, args=(reader,), daemon=True)
+    thread.start()
+    try:
+        results["small.ns"] = time_ns(
+            lambda: app.send_response(writer, app.response_class(SMALL))
+        )
+        results["64k.ns"] = time_ns(
+            lambda: app.send_response(writer, app.response_class(LARGE)),
+            number=1_000,
+        )
+        results["stream.ns"] = time_ns(
+            lambda: app.send_response(writer, app.response_class(iter(CHUNKS))),
+            number=1_000,
+        )
+    finally:
+        writer.close()
+        thread.join()
+        reader.close()
+    return results
+
+
+if __name__ == "__main__":
+    report("Send", run())
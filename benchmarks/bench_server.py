@@ -0,0 +1,116 @@
+"""\
+Server Benchmarks
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+End-to-end load test of the development server over loopback. The app
+is started with ``Miroslava.run`` on a free port in a child process,
+which is terminated once the load test is over, and a few client
+threads send requests back to back for a fixed time, each over a new
+connection since the server closes it after every response. Reports
+the throughput in requests per second and the latency percentiles as
+seen by the clients. The access log is discarded while it runs.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import multiprocessing
+import socket
+import threading
+import time
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from miroslava.app import Miroslava
+
+CONCURRENCY: int = 4
+DURATION: float = 2.0
+
+app = Miroslava(__name__)
+
+
+@app.route("/")
+def index() -> str:
+    """Return a short text body."""
+    return "<h1>Hello hello, good morning!!</h1>"
+
+
+@app.route("/json/<int:n>")
+def numbers(n: int) -> dict[str, list[int]]:
+    """Return a small JSON document."""
+    return {"numbers": list(range(n))}
+
+
+def free_port() -> int:
+    """Return a port on loopback nobody is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(port: int) -> None:
+    """Run the app on ``port`` with the access log discarded."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        app.run(port=port)
+
+
+def fetch(port: int, raw: bytes) -> None:
+    """Send one request and read the response until the server closes."""
+    with socket.create_connection(("127.0.0.1", port)) as sock:
+        sock.sendall(raw)
+        while sock.recv(65_536):
+            pass
+
+
+def load(port: int, path: str) -> list[int]:
+    """Request ``path`` from several threads and return the latencies."""
+    raw = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    latencies: list[int] = []
+    deadline = time.perf_counter() + DURATION
+
+    def client() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter_ns()
+            fetch(port, raw)
+            latencies.append(time.perf_counter_ns() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(CONCURRENCY)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def run() -> Results:
+    """Run the server benchmarks."""
+    results: Results = {}
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    try:
+        for _ in range(500):
+            try:
+                fetch(port, b"GET / HTTP/1.1\r\n\r\n")
+                break
+            except OSError:
+                time.sleep(0.01)
+        for name, path in (("text", "/"), ("json", "/json/100")):
+            latencies = sorted(load(port, path))
+            count = len(latencies)
+            results[f"{name}.rps"] = count / DURATION
+            results[f"{name}.p50.ns"] = latencies[count // 2]
+            results[f"{name}.p99.ns"] = latencies[int(count * 0.99)]
+    finally:
+        server.terminate()
+        server.join()
+    return results
+
+
+if __name__ == "__main__":
+    report("Server", run())
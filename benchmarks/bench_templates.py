@@ -0,0 +1,84 @@
+"""\
+Template Benchmarks
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Cost of rendering a table page through ``render_template``, which
+serves a compiled template from the application's cache, compared with
+calling the compiled template directly. The streaming variant is
+measured both to the first chunk and to the end of the page.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import typing as t
+
+from benchmarks._common import Results
+from benchmarks._common import report
+from benchmarks._common import time_ns
+from miroslava.app import Miroslava
+from miroslava.globals import AppContext
+from miroslava.templating import Template
+from miroslava.utils import render_template
+
+SOURCE: str = """\
+<html><head><title>{{ title }}</title></head><body>
+<table>
+{% for row in rows %}
+<tr class="{% if row.active %}on{% else %}off{% endif %}">
+<td>{{ row.id }}</td><td>{{ row.name }}</td><td>{{ row.email }}</td>
+</tr>
+{% endfor %}
+</table>
+</body></html>
+"""
+CONTEXT: dict[str, t.Any] = {
+    "title": "Users & Groups",
+    "rows": [
+        {
+            "id": n,
+            "name": f"<user-{n}>",
+            "email": f"user{n}@example.com",
+            "active": n % 3 == 0,
+        }
+        for n in range(1000)
+    ],
+}
+
+
+def run() -> Results:
+    """Run the template benchmarks."""
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as root:
+        os.mkdir(os.path.join(root, "templates"))
+        with open(os.path.join(root, "templates", "table.html"), "w") as f:
+            f.write(SOURCE)
+        app = Miroslava(__name__, root_path=root)
+        template = Template(SOURCE, autoescape=True)
+        with AppContext(app):
+            results["render_template.ns"] = time_ns(
+                lambda: render_template("table.html", **CONTEXT),
+                number=100,
+            )
+        results["template.render.ns"] = time_ns(
+            lambda: template.render(CONTEXT), number=100
+        )
+        results["stream.first_chunk.ns"] = time_ns(
+            lambda: next(template.generate(CONTEXT)), number=100
+        )
+        results["stream.full.ns"] = time_ns(
+            lambda: "".join(template.generate(CONTEXT)), number=100
+        )
+        results["compile.ns"] = time_ns(
+            lambda: Template(SOURCE, autoescape=True), number=100
+        )
+    return results
+
+
+if __name__ == "__main__":
+    report("Templates", run())
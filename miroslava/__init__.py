@@ -4,7 +4,7 @@ Miroslava
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 26 January, 2026
-Last updated on: 03 February, 2026
+Last updated on: 18 October, 2026
 
 Miroslava is a ultra-lightweight, risky, and non-production ready WSGI
 (micro) web framework modelled after ``Flask`` and ``Werkzeug``.
@@ -19,12 +19,18 @@ from __future__ import annotations
 from miroslava.app import Miroslava as Miroslava
 from miroslava.globals import current_app as current_app
 from miroslava.globals import g as g
+from miroslava.globals import get_current_app as get_current_app
+from miroslava.globals import get_current_request as get_current_request
 from miroslava.globals import request as request
 from miroslava.globals import session as session
+from miroslava.templating import Markup as Markup
+from miroslava.templating import Template as Template
 from miroslava.utils import abort as abort
 from miroslava.utils import jsonify as jsonify
+from miroslava.utils import jsonify_stream as jsonify_stream
 from miroslava.utils import make_response as make_response
 from miroslava.utils import render_template as render_template
+from miroslava.utils import stream_template as stream_template
 from miroslava.wrappers import Request as Request
 from miroslava.wrappers import Response as Response
 
@@ -4,7 +4,7 @@ Miroslava's Application
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 31 January, 2026
-Last updated on: 04 February, 2026
+Last updated on: 18 October, 2026
 
 The primary application classes which ties together routing, configs,
 and the server loop.
@@ -26,7 +26,10 @@ import re
 import socket
 import sys
 import threading
+import time
+import types
 import typing as t
+from collections import deque
 from collections.abc import Mapping
 from datetime import datetime
 from http import HTTPStatus
@@ -34,18 +37,34 @@ from urllib.parse import unquote
 
 from miroslava.globals import AppContext
 from miroslava.globals import RequestContext
+from miroslava.globals import get_current_request
+from miroslava.metrics import Metrics
+from miroslava.metrics import PhaseTimer
+from miroslava.profiling import AllocationProfiler
+from miroslava.profiling import RequestProfiler
+from miroslava.profiling import StackSampler
+from miroslava.serving import send_buffers
+from miroslava.serving import send_chunked
+from miroslava.serving import serialise_head
+from miroslava.templating import TemplateCache
+from miroslava.templating import TemplateLoader
+from miroslava.templating import TemplateSyntaxError
 from miroslava.utils import DefaultJSONProvider
 from miroslava.utils import HTTPExceptionError
+from miroslava.utils import LimitedStream
 from miroslava.utils import Map
 from miroslava.utils import Rule
 from miroslava.utils import get_root_path
 from miroslava.utils import show_server_banner
+from miroslava.watchdog import Watchdog
 from miroslava.wrappers import Request
 from miroslava.wrappers import Response
 
 if t.TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from miroslava.replay import TrafficRecorder
+    from miroslava.testing import TestClient
     from miroslava.wrappers import Headers
 
 type HeaderValue = str | list[str] | tuple[str, ...]
@@ -61,7 +80,22 @@ type ResponseReturnValue = (
 )
 type WSGIEnvironment = dict[str, t.Any]
 RouteCallable = t.Callable[..., ResponseReturnValue]
+ResponseConverter = t.Callable[[t.Any], Response]
+BeforeRequestCallable = t.Callable[[], ResponseReturnValue | None]
+AfterRequestCallable = t.Callable[[Response], Response]
+TeardownCallable = t.Callable[[BaseException | None], None]
+RequestTimingCallable = t.Callable[[Request, PhaseTimer], None]
 T_route = t.TypeVar("T_route", bound=RouteCallable)
+T_converter = t.TypeVar("T_converter", bound=ResponseConverter)
+T_before_request = t.TypeVar("T_before_request", bound=BeforeRequestCallable)
+T_after_request = t.TypeVar("T_after_request", bound=AfterRequestCallable)
+T_teardown = t.TypeVar("T_teardown", bound=TeardownCallable)
+T_request_timing = t.TypeVar("T_request_timing", bound=RequestTimingCallable)
+
+
+def _identity[T](o: T) -> T:
+    """Return itself."""
+    return o
 
 
 class Scaffold:
@@ -98,6 +132,11 @@ class Scaffold:
             root_path = get_root_path(self.import_name)
         self.root_path = root_path
         self.view_functions: dict[str, RouteCallable] = {}
+        self.before_request_funcs: list[BeforeRequestCallable] = []
+        self.after_request_funcs: list[AfterRequestCallable] = []
+        self.teardown_request_funcs: list[TeardownCallable] = []
+        self._view_chains: dict[str, RouteCallable] | None = None
+        self._after_request_chain: tuple[AfterRequestCallable, ...] = ()
 
     def __repr__(self) -> str:
         """Human-readable representation of the application object."""
@@ -179,6 +218,46 @@ class Scaffold:
         """
         raise NotImplementedError
 
+    def before_request(self, f: T_before_request) -> T_before_request:
+        """Register a function to run before each request.
+
+        The function is called without arguments before the view. If
+        it returns a value other than ``None``, that value is used as
+        the response and the view is not called.
+
+        .. code-block:: python
+
+            @app.before_request
+            def require_login():
+                if "user" not in session:
+                    return "Unauthorised", 401
+        """
+        self.before_request_funcs.append(f)
+        self._view_chains = None
+        return f
+
+    def after_request(self, f: T_after_request) -> T_after_request:
+        """Register a function to run after each request.
+
+        The function is passed the response and must return a response,
+        either the same object or a new one. Functions run in the
+        reverse order of registration.
+        """
+        self.after_request_funcs.append(f)
+        self._view_chains = None
+        return f
+
+    def teardown_request(self, f: T_teardown) -> T_teardown:
+        """Register a function to run when the request context ends.
+
+        The function is passed the unhandled exception, or ``None``,
+        and is called even when the request failed. Functions run in
+        the reverse order of registration and their return values are
+        ignored.
+        """
+        self.teardown_request_funcs.append(f)
+        return f
+
 
 class App(Scaffold):
     """Base application object which implements a WSGI application.
@@ -208,7 +287,8 @@ class App(Scaffold):
     default_config: t.ClassVar[dict[str, t.Any]]
     url_rule_class: Rule = Rule
     url_map_class: Map = Map
-    response_class: type[Response]
+    response_class: type[Response] = Response
+    context_pool_size: int = 64
 
     def __init__(
         self,
@@ -238,7 +318,31 @@ class App(Scaffold):
         self.static_host = static_host
         self.host_matching = host_matching
         self.url_map = self.url_map_class()
-        self.response_class: type[Response] = Response
+        self.response_converters: dict[type[t.Any], ResponseConverter] = {
+            Response: _identity,
+            str: self._make_body_response,
+            bytes: self._make_body_response,
+            bytearray: self._make_buffer_response,
+            memoryview: self._make_buffer_response,
+            dict: self._make_json_response,
+            list: self._make_json_response,
+            types.GeneratorType: self._make_body_response,
+        }
+        self._response_converter_cache: dict[
+            type[t.Any], ResponseConverter
+        ] = {}
+        self.template_loader = self.create_template_loader()
+        self.template_cache = TemplateCache()
+        self.metrics = Metrics()
+        self.request_timing_funcs: list[RequestTimingCallable] = []
+        self.stack_sampler: StackSampler | None = None
+        self.request_profiler: RequestProfiler | None = None
+        self.allocation_profiler: AllocationProfiler | None = None
+        self.watchdog: Watchdog | None = None
+        self.traffic_recorder: TrafficRecorder | None = None
+        self._context_pool: deque[RequestContext] = deque(
+            maxlen=self.context_pool_size
+        )
 
     @property
     def name(self) -> str:
@@ -268,6 +372,9 @@ class App(Scaffold):
             name, defaults to `None`.
         :param provide_automatic_options: Add ``OPTIONS`` method,
             defaults to ``None``.
+
+        A ``timeout`` option overrides ``WATCHDOG_TIMEOUT`` for
+        requests to this rule.
         """
         converters: dict[str, t.Callable[[str], t.Any]] = {}
         if endpoint is None:
@@ -300,16 +407,161 @@ class App(Scaffold):
                 )
                 + "$"
             )
-        rule_obj = self.url_rule_class(rule, defaults, methods, endpoint)
+        rule_obj = self.url_rule_class(
+            rule, defaults, methods, endpoint, options.pop("timeout", None)
+        )
         rule_obj.pattern = pattern
         rule_obj.converters = converters
         self.url_map.add(rule_obj)
         if view_func is not None:
             self.view_functions[endpoint] = view_func
+        self._view_chains = None
+
+    def build_view_chains(self) -> dict[str, RouteCallable]:
+        """Combine each view with the request hooks into one callable.
+
+        The registered ``before_request`` functions are flattened into
+        a single function per endpoint, and the ``after_request``
+        functions into a tuple which ``dispatch_request`` applies to
+        the converted response, so dispatching does not walk the hook
+        registries on every request. When no hooks are registered, the
+        chain of an endpoint is its view function itself and hooks cost
+        nothing. The chains are built on the first request and rebuilt
+        after a rule or hook is registered. The chains of the endpoints
+        chosen for ``request_profiler`` and ``allocation_profiler`` are
+        wrapped so sampled calls are profiled.
+        """
+        before = tuple(self.before_request_funcs)
+        if not before:
+            chains = dict(self.view_functions)
+        else:
+            chains = {
+                endpoint: self._chain_view(view_func, before)
+                for endpoint, view_func in self.view_functions.items()
+            }
+        allocations = self.allocation_profiler
+        if allocations is not None:
+            for endpoint in allocations.endpoints & chains.keys():
+                chains[endpoint] = allocations.wrap(endpoint, chains[endpoint])
+        profiler = self.request_profiler
+        if profiler is not None and profiler.endpoint in chains:
+            chains[profiler.endpoint] = profiler.wrap(chains[profiler.endpoint])
+        self._after_request_chain = tuple(reversed(self.after_request_funcs))
+        self._view_chains = chains
+        return chains
+
+    def _chain_view(
+        self,
+        view_func: RouteCallable,
+        before: tuple[BeforeRequestCallable, ...],
+    ) -> RouteCallable:
+        """Wrap a view so the ``before_request`` hooks run before it."""
+
+        def chain(**kwargs: t.Any) -> ResponseReturnValue:
+            for func in before:
+                rv = func()
+                if rv is not None:
+                    return rv
+            return view_func(**kwargs)
+
+        return chain
+
+    def do_teardown_request(self, exc: BaseException | None = None) -> None:
+        """Call the ``teardown_request`` functions.
+
+        :param exc: Unhandled exception raised while handling the
+            request, defaults to ``None``.
+        """
+        for func in reversed(self.teardown_request_funcs):
+            func(exc)
+
+    def add_response_converter(
+        self,
+        type_: type[t.Any],
+        converter: ResponseConverter,
+    ) -> None:
+        """Register a function that turns view return values of a type
+        into a ``Response``.
+
+        Converters are looked up by the exact type of the value first
+        and then along its MRO, so registering a base class covers its
+        subclasses as well. Registering ``str`` or ``dict`` replaces
+        the built-in handling of those types.
+
+        :param type_: Type of the view return value.
+        :param converter: Callable taking the value and returning a
+            ``Response``.
+        """
+        self.response_converters[type_] = converter
+        self._response_converter_cache.clear()
+
+    def response_converter(
+        self, type_: type[t.Any]
+    ) -> t.Callable[[T_converter], T_converter]:
+        """Decorator that registers a response converter for a type.
+
+        .. code-block:: python
+
+            @app.response_converter(Point)
+            def point_response(point):
+                return app.json.response({"x": point.x, "y": point.y})
+
+        :param type_: Type of the view return value.
+        """
+
+        def decorator(f: T_converter) -> T_converter:
+            self.add_response_converter(type_, f)
+            return f
+
+        return decorator
+
+    def _resolve_response_converter(
+        self, type_: type[t.Any]
+    ) -> ResponseConverter:
+        """Find the converter for a type along its MRO and cache it.
+
+        Types without a converter anywhere along their MRO are turned
+        into text with ``str``.
+        """
+        converters = self.response_converters
+        for base in type_.__mro__:
+            if base in converters:
+                converter = converters[base]
+                break
+        else:
+            converter = self._make_text_response
+        self._response_converter_cache[type_] = converter
+        return converter
+
+    def _make_body_response(self, rv: t.Any) -> Response:
+        """Convert a body the response class accepts as is.
+
+        ``response_class`` is looked up on every call, so replacing it
+        on the app after ``__init__`` still takes effect.
+        """
+        return self.response_class(rv)
+
+    def _make_json_response(
+        self, rv: dict[str, t.Any] | list[t.Any]
+    ) -> Response:
+        """Convert a ``dict`` or ``list`` using the app's JSON provider."""
+        return self.json.response(rv)
+
+    def _make_text_response(self, rv: t.Any) -> Response:
+        """Convert an arbitrary object to a response using ``str``."""
+        return self.response_class(str(rv))
+
+    def _make_buffer_response(self, rv: bytearray | memoryview) -> Response:
+        """Convert a bytes-like buffer into a response."""
+        return self.response_class(bytes(rv))
 
     def make_response(self, rv: ResponseReturnValue) -> Response:
         """Convert a view return value into a ``Response`` instance.
 
+        The body is converted by the converter registered for its
+        type, see ``add_response_converter``. The lookup is a single
+        dictionary access for any type that has been seen before.
+
         :param rv: Return value from a view function.
         :raises TypeError: If the return value shape cannot be
             understood.
@@ -328,22 +580,13 @@ class App(Scaffold):
                     headers = second
             else:
                 raise TypeError("A response tuple must be of length 2 or 3")
-        if isinstance(body, self.response_class):
-            response = body
-            if status is not None:
-                response.status_code, response.status_phrase = (
-                    response._parse_status(status)
-                )
-        elif isinstance(body, (dict, list)):
-            response = self.json.response(body)
-            if status is not None:
-                response.status_code, response.status_phrase = (
-                    response._parse_status(status)
-                )
-        elif isinstance(body, (str, bytes)):
-            response = self.response_class(body, status=status or 200)
-        else:
-            response = self.response_class(str(body), status=status or 200)
+        try:
+            converter = self._response_converter_cache[type(body)]
+        except KeyError:
+            converter = self._resolve_response_converter(type(body))
+        response = converter(body)
+        if status is not None:
+            response.status = status
         if headers:
             if isinstance(headers, Mapping):
                 for key, value in headers.items():
@@ -379,6 +622,217 @@ class App(Scaffold):
         """Set debug value."""
         self.config["DEBUG"] = value
 
+    @property
+    def templates_auto_reload(self) -> bool:
+        """Return ``True`` if changed templates should be recompiled.
+
+        Uses ``TEMPLATES_AUTO_RELOAD`` when set, otherwise follows the
+        debug mode.
+        """
+        auto_reload = self.config.get("TEMPLATES_AUTO_RELOAD")
+        return self.debug if auto_reload is None else auto_reload
+
+    def app_context(self) -> AppContext:
+        """Create an application context for this app.
+
+        .. code-block:: python
+
+            with app.app_context():
+                render_template("index.html")
+        """
+        return AppContext(self)
+
+    def request_context(self, request: Request) -> RequestContext:
+        """Return a request context for a request, reusing a pooled one.
+
+        Contexts handed back with ``release_context`` are reset and
+        reused, so a request normally allocates neither an
+        ``AppContext`` nor a ``RequestContext``.
+
+        :param request: Request the context should hold.
+        """
+        try:
+            ctx = self._context_pool.pop()
+        except IndexError:
+            return RequestContext(self, request.environ, request=request)
+        ctx.reset(request)
+        return ctx
+
+    def release_context(self, ctx: RequestContext) -> None:
+        """Return a popped request context to the pool for reuse.
+
+        :param ctx: Request context which is no longer active.
+        """
+        ctx.reset(None)
+        self._context_pool.append(ctx)
+
+    def test_client(self, use_cookies: bool = True) -> TestClient:
+        """Create a client which sends requests to this app in-process.
+
+        .. code-block:: python
+
+            client = app.test_client()
+            assert client.get("/").status_code == 200
+
+        :param use_cookies: Store cookies set by responses and send
+            them with later requests, defaults to ``True``.
+        """
+        from miroslava.testing import TestClient
+
+        return TestClient(self, use_cookies)
+
+    def request_timing(self, f: T_request_timing) -> T_request_timing:
+        """Register a function to receive the phase timings of requests.
+
+        Only called while ``PHASE_TIMING`` is enabled, after the
+        response has been sent. The function is passed the request and
+        its ``PhaseTimer``, whose ``spans`` can be exported to a
+        tracing system.
+
+        .. code-block:: python
+
+            @app.request_timing
+            def export(request, timer):
+                for phase, start, end in timer.spans:
+                    tracer.record(request.endpoint, phase, start, end)
+        """
+        self.request_timing_funcs.append(f)
+        return f
+
+    def metrics_view(self) -> Response:
+        """Serve the collected metrics in the Prometheus text format.
+
+        Registered at ``METRICS_ENDPOINT`` when the server starts, if
+        that option is set.
+        """
+        return self.response_class(
+            self.metrics.render_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    def start_profiling(self) -> None:
+        """Start the CPU profilers configured for this app.
+
+        A ``StackSampler`` samples every request at
+        ``PROFILING_INTERVAL`` seconds. If ``PROFILING_TARGET`` names
+        an endpoint, one in every ``PROFILING_SAMPLE_RATE`` calls to it
+        is also run under ``cProfile``. Allocations of the endpoints
+        listed in ``MEMORY_PROFILING_TARGETS`` are traced for one in
+        every ``MEMORY_PROFILING_SAMPLE_RATE`` calls with
+        ``tracemalloc``, and reported on ``MEMORY_PROFILING_SIGNAL``
+        when it is set and this is the main thread.
+        """
+        if self.stack_sampler is None:
+            self.stack_sampler = StackSampler(self.config["PROFILING_INTERVAL"])
+        self.stack_sampler.start()
+        target = self.config["PROFILING_TARGET"]
+        if target and self.request_profiler is None:
+            self.request_profiler = RequestProfiler(
+                target, self.config["PROFILING_SAMPLE_RATE"]
+            )
+            self._view_chains = None
+        targets = self.config["MEMORY_PROFILING_TARGETS"]
+        if targets and self.allocation_profiler is None:
+            self.allocation_profiler = AllocationProfiler(
+                targets, self.config["MEMORY_PROFILING_SAMPLE_RATE"]
+            )
+            self.allocation_profiler.start()
+            signum = self.config["MEMORY_PROFILING_SIGNAL"]
+            if (
+                signum is not None
+                and threading.current_thread() is threading.main_thread()
+            ):
+                self.allocation_profiler.dump_on_signal(signum)
+            self._view_chains = None
+
+    def profiling_view(self) -> Response:
+        """Serve the collected CPU profiles as a download.
+
+        Registered at ``PROFILING_ENDPOINT`` when the server starts in
+        debug mode with ``PROFILING_ENABLED`` set. By default, the
+        samples are returned as collapsed stacks, which can be turned
+        into a flame graph with ``flamegraph.pl`` or opened in
+        speedscope. The ``endpoint`` query argument limits the stacks
+        to an endpoint, ``format=pstats`` returns the ``cProfile``
+        report instead, ``format=memory`` returns the allocation report,
+        and ``reset=1`` discards the data once it has been read.
+        """
+        args = get_current_request().args
+        reset = args.get("reset") in ("1", "true")
+        fmt = args.get("format")
+        if fmt == "memory":
+            allocations = self.allocation_profiler
+            if allocations is None:
+                return self.response_class(
+                    "No MEMORY_PROFILING_TARGETS are configured.", status=404
+                )
+            body = allocations.report(args.get("endpoint"))
+            filename = "memory.txt"
+            if reset:
+                allocations.clear()
+        elif fmt == "pstats":
+            profiler = self.request_profiler
+            if profiler is None:
+                return self.response_class(
+                    "No PROFILING_TARGET is configured.", status=404
+                )
+            body = profiler.report()
+            filename = "profile.txt"
+            if reset:
+                profiler.clear()
+        else:
+            sampler = self.stack_sampler
+            if sampler is None:
+                return self.response_class(
+                    "Profiling is not running.", status=404
+                )
+            body = sampler.collapsed(args.get("endpoint"))
+            filename = "profile.collapsed"
+            if reset:
+                sampler.clear()
+        return self.response_class(
+            body,
+            content_type="text/plain; charset=utf-8",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"'
+            },
+        )
+
+    def create_template_loader(self) -> TemplateLoader:
+        """Create the loader used to find this application's templates.
+
+        The application's template folder takes precedence over
+        ``templates`` in the working directory. More folders can be
+        added with ``template_loader.add_searchpath``.
+        """
+        searchpath: list[str | os.PathLike[str]] = []
+        if self.template_folder:
+            searchpath.append(
+                os.path.join(self.root_path, self.template_folder)
+            )
+        searchpath.append("templates")
+        return TemplateLoader(searchpath)
+
+    def preload_templates(self) -> int:
+        """Index and compile every template ahead of time.
+
+        This rescans the template search path and warms the template
+        cache, so the first request for each page does not pay for
+        locating, reading, and compiling its template. Files which are
+        not UTF-8 text or do not compile, such as images kept next to
+        the templates, are reported and skipped; they still fail when
+        rendered. Returns the number of templates compiled.
+        """
+        compiled = 0
+        for path in sorted(set(self.template_loader.scan().values())):
+            try:
+                self.template_cache.get(path)
+            except (UnicodeDecodeError, TemplateSyntaxError) as err:
+                print(f"Skipping template {path!r}: {err}")
+            else:
+                compiled += 1
+        return compiled
+
 
 class Miroslava(App):
     """Main class which implements a WSGI application.
@@ -408,6 +862,32 @@ class Miroslava(App):
         "DEBUG": False,
         "APPLICATION_ROOT": "/",
         "SERVER_NAME": None,
+        "MAX_CONTENT_LENGTH": None,
+        "MAX_FORM_PART_SIZE": None,
+        "MAX_FORM_MEMORY_SIZE": 500_000,
+        "MAX_FORM_PARTS": 1000,
+        "FORM_SPILL_THRESHOLD": 512 * 1024,
+        "TEMPLATES_AUTO_RELOAD": None,
+        "TEMPLATES_PRELOAD": False,
+        "METRICS_ENABLED": True,
+        "METRICS_ENDPOINT": None,
+        "PHASE_TIMING": False,
+        "SERVER_TIMING_HEADER": True,
+        "PROFILING_ENABLED": False,
+        "PROFILING_ENDPOINT": None,
+        "PROFILING_INTERVAL": 0.005,
+        "PROFILING_TARGET": None,
+        "PROFILING_SAMPLE_RATE": 100,
+        "MEMORY_PROFILING_TARGETS": (),
+        "MEMORY_PROFILING_SAMPLE_RATE": 10,
+        "MEMORY_PROFILING_SIGNAL": None,
+        "WATCHDOG_ENABLED": False,
+        "WATCHDOG_TIMEOUT": 30.0,
+        "WATCHDOG_INTERVAL": 1.0,
+        "WATCHDOG_ABORT": False,
+        "TRAFFIC_RECORD_FILE": None,
+        "TRAFFIC_RECORD_EVERY": 1,
+        "TRAFFIC_RECORD_MAX_BYTES": 64 * 1024 * 1024,
     }
     request_class: type[Request] = Request
     response_class: type[Response] = Response
@@ -438,6 +918,23 @@ class Miroslava(App):
             instance_relative_config=instance_relative_config,
             root_path=root_path,
         )
+        self._static_chain: RouteCallable = self.send_static_file
+
+    def build_view_chains(self) -> dict[str, RouteCallable]:
+        """Build the view chains, and the chain serving static files.
+
+        Static files go through the ``before_request`` hooks like any
+        other endpoint, so a hook which refuses a request also covers
+        them.
+        """
+        chains = super().build_view_chains()
+        before = tuple(self.before_request_funcs)
+        self._static_chain = (
+            self._chain_view(self.send_static_file, before)
+            if before
+            else self.send_static_file
+        )
+        return chains
 
     def run(
         self,
@@ -473,7 +970,7 @@ class Miroslava(App):
         if server_name:
             sn_host, _, sn_port = server_name.partition(":")
         if not host:
-            host = sn_host if sn_host else "127.0.0.1"
+            host = sn_host or "127.0.0.1"
         if port or port == 0:
             port = int(port)
         elif sn_port:
@@ -488,6 +985,45 @@ class Miroslava(App):
             print(f"Couldn't bind to {host}:{port} due to {err}")
             return
         server.listen(5)
+        if (
+            self.config["METRICS_ENDPOINT"]
+            and "miroslava.metrics" not in self.view_functions
+        ):
+            self.add_url_rule(
+                self.config["METRICS_ENDPOINT"],
+                "miroslava.metrics",
+                self.metrics_view,
+            )
+        if self.config["PROFILING_ENABLED"] and self.debug:
+            self.start_profiling()
+            if (
+                self.config["PROFILING_ENDPOINT"]
+                and "miroslava.profiling" not in self.view_functions
+            ):
+                self.add_url_rule(
+                    self.config["PROFILING_ENDPOINT"],
+                    "miroslava.profiling",
+                    self.profiling_view,
+                )
+        if self.config["WATCHDOG_ENABLED"] and self.watchdog is None:
+            self.watchdog = Watchdog(
+                self.config["WATCHDOG_TIMEOUT"],
+                self.config["WATCHDOG_INTERVAL"],
+                self.config["WATCHDOG_ABORT"],
+            )
+            self.watchdog.start()
+        if self.config["TRAFFIC_RECORD_FILE"] and self.traffic_recorder is None:
+            from miroslava.replay import TrafficRecorder
+
+            self.traffic_recorder = TrafficRecorder(
+                self.config["TRAFFIC_RECORD_FILE"],
+                self.config["TRAFFIC_RECORD_EVERY"],
+                self.config["TRAFFIC_RECORD_MAX_BYTES"],
+            )
+        if self.config["TEMPLATES_PRELOAD"]:
+            self.preload_templates()
+        else:
+            self.template_loader.scan()
         show_server_banner(debug, self.name, host=host, port=port)
         try:
             while True:
@@ -511,11 +1047,23 @@ class Miroslava(App):
 
         This method reads the raw request bytes from the socket,
         constructs a WSGI-style environment mapping, and instantiates a
-        Request object. It then sets up the application and request
-        contexts, dispatches the request to a view function, logs the
-        outcome, and finally sends the resulting Response back to the
-        client. Errors are reported to stdout, and tracebacks are shown
-        when debug mode is enabled.
+        Request object. Multipart bodies are left on the socket behind
+        a ``LimitedStream`` so uploads are parsed as they arrive, and
+        bodies larger than ``MAX_CONTENT_LENGTH`` are refused with a
+        ``413`` before any of them is read. It then pushes a pooled
+        request context, dispatches the request to a view function,
+        logs the outcome, and finally sends the resulting Response back
+        to the client. The ``teardown_request`` hooks run before the
+        context is popped. Unless ``METRICS_ENABLED`` is turned off,
+        the latency, status, and size of every request are recorded in
+        ``metrics``. With ``PHASE_TIMING`` enabled, each phase of the
+        request is timed as well, and while profiling is running the
+        request thread is sampled. With ``WATCHDOG_ENABLED``, requests
+        running past their timeout are reported by the ``watchdog``,
+        and with ``TRAFFIC_RECORD_FILE`` set, sampled requests are
+        appended to the recording of the ``traffic_recorder``.
+        Errors are reported to stdout, and tracebacks are shown when
+        debug mode is enabled.
 
         :param client: The client socket connection.
         :param client_address: The client address tuple (host, port).
@@ -530,30 +1078,109 @@ class Miroslava(App):
             if b"\r\n\r\n" not in buffer:
                 return
             headers_data, body_data = buffer.split(b"\r\n\r\n", 1)
-            environ = self.make_environ(headers_data)
-            cl = environ.get("CONTENT_LENGTH")
-            if cl:
-                length = int(cl)
-                while len(body_data) < length:
-                    chunk = client.recv(1024)
-                    if not chunk:
-                        break
-                    body_data += chunk
-                environ["miroslava.request_body"] = body_data
-
-            request = self.request_class(environ)
-            request_ctx = RequestContext(self, environ, request=request)
-            app_ctx = AppContext(self)
-
-            app_ctx.push()
-            request_ctx.push()
+            metrics = self.metrics if self.config["METRICS_ENABLED"] else None
+            if metrics is not None:
+                metrics.request_started()
+                start = time.perf_counter_ns()
+            timer = PhaseTimer() if self.config["PHASE_TIMING"] else None
+            request: Request | None = None
+            status = 500
+            received = len(buffer)
+            sent = 0
             try:
-                response = self.dispatch_request(request)
-                self.log_request(client_address, request, response)
-                self.send_response(client, response)
+                environ = self.make_environ(headers_data)
+                cl = environ.get("CONTENT_LENGTH")
+                if cl:
+                    length = int(cl)
+                    received = len(headers_data) + 4 + length
+                    max_length = self.config["MAX_CONTENT_LENGTH"]
+                    if max_length is not None and length > max_length:
+                        status = 413
+                        sent = self.send_response(
+                            client,
+                            self.response_class(
+                                "Request Entity Too Large", status=413
+                            ),
+                        )
+                        return
+                    if environ.get("CONTENT_TYPE", "").startswith(
+                        "multipart/form-data"
+                    ):
+                        environ["wsgi.input"] = LimitedStream(
+                            client, body_data, length
+                        )
+                    else:
+                        while len(body_data) < length:
+                            chunk = client.recv(1024)
+                            if not chunk:
+                                break
+                            body_data += chunk
+                        environ["miroslava.request_body"] = body_data
+
+                recorder = self.traffic_recorder
+                if recorder is not None and "wsgi.input" not in environ:
+                    recorder.record(headers_data, body_data)
+                request = self.request_class(environ)
+                if timer is not None:
+                    request.timer = timer
+                    timer.mark("parse")
+                request_ctx = self.request_context(request)
+                sampler = self.stack_sampler
+                if sampler is not None:
+                    sampler.track(request)
+                watchdog = self.watchdog
+                if watchdog is not None:
+                    watchdog.watch(request, client)
+                request_ctx.push()
+                error: BaseException | None = None
+                try:
+                    response = self.dispatch_request(request)
+                    if (
+                        timer is not None
+                        and self.config["SERVER_TIMING_HEADER"]
+                    ):
+                        response.headers["Server-Timing"] = (
+                            timer.server_timing()
+                        )
+                    status = response.status_code
+                    self.log_request(client_address, request, response)
+                    stream = environ.get("wsgi.input")
+                    if stream is not None:
+                        stream.exhaust()
+                    if watchdog is not None:
+                        watchdog.sending()
+                    sent = self.send_response(client, response)
+                    if timer is not None:
+                        timer.mark("send")
+                        self.metrics.record_phases(request.endpoint, timer)
+                        for func in self.request_timing_funcs:
+                            func(request, timer)
+                except BaseException as err:
+                    error = err
+                    raise
+                finally:
+                    # A failing teardown function must not leave the
+                    # context pushed or the request tracked.
+                    try:
+                        if self.teardown_request_funcs:
+                            self.do_teardown_request(error)
+                    finally:
+                        request.close()
+                        request_ctx.pop()
+                        self.release_context(request_ctx)
+                        if sampler is not None:
+                            sampler.untrack()
+                        if watchdog is not None:
+                            watchdog.unwatch()
             finally:
-                request_ctx.pop()
-                app_ctx.pop()
+                if metrics is not None:
+                    metrics.request_finished(
+                        request.endpoint if request is not None else None,
+                        status,
+                        time.perf_counter_ns() - start,
+                        received,
+                        sent,
+                    )
         except Exception as err:
             print(f"Internal Server Error: {err}")
             if self.config["DEBUG"]:
@@ -603,39 +1230,39 @@ class Miroslava(App):
                     environ[f"HTTP_{key}"] = value.strip()
         return environ
 
-    def dispatch_request(self, request: Request) -> Response:
-        """Match route and return a response object.
-
-        The dispatcher matches the incoming path against the
-        ``url_map``, validates the HTTP method, and invokes the
-        registered view function.
-
-        View return values are normalised with make_response so tuples,
-        mappings, and ``Response`` objects are handled consistently.
-
-        Static file requests containing a period in the path are served
-        from the configured ``static_folder``. Missing routes yield a
-        ``404`` response.
-
-        :param request: The request object to dispatch.
-        :return: Response object.
+    def match_request(
+        self, request: Request
+    ) -> tuple[RouteCallable, dict[str, t.Any]]:
+        """Find the view for a request and the arguments to call it with.
+
+        The request path is matched against the ``url_map``, plain
+        rules first and then rules with variable parts, and the HTTP
+        method is validated. On a match, ``request.url_rule`` is set
+        and the view's chain from ``build_view_chains`` is returned.
+        Paths containing a period are mapped to ``send_static_file``,
+        chained with the ``before_request`` hooks.
+
+        :param request: The request object to match.
+        :raises HTTPExceptionError: With a ``404`` response when no rule
+            matches, or a ``405`` response when the method is not
+            allowed.
         """
+        chains = self._view_chains
+        if chains is None:
+            chains = self.build_view_chains()
         if "." in request.path and not request.path.endswith("/"):
-            return self.send_static_file(request.path)
+            return self._static_chain, {"path": request.path}
         for rule in self.url_map:
             if rule.pattern is not None:
                 continue
             if request.path != rule.rule:
                 continue
             if request.method not in rule.methods:
-                return self.response_class("Method Not Allowed", status=405)
-            view_func = self.view_functions[rule.endpoint]
-            kwargs = dict(rule.defaults)
-            try:
-                rv = view_func(**kwargs)
-            except HTTPExceptionError as err:
-                return err.response
-            return self.make_response(rv)
+                raise HTTPExceptionError(
+                    self.response_class("Method Not Allowed", status=405)
+                )
+            request.url_rule = rule
+            return chains[rule.endpoint], dict(rule.defaults)
         for rule in self.url_map:
             if rule.pattern is None:
                 continue
@@ -643,20 +1270,71 @@ class Miroslava(App):
             if not match:
                 continue
             if request.method not in rule.methods:
-                return self.response_class("Method Not Allowed", status=405)
-            view_func = self.view_functions[rule.endpoint]
+                raise HTTPExceptionError(
+                    self.response_class("Method Not Allowed", status=405)
+                )
             kwargs = dict(rule.defaults)
             for key, value in match.groupdict().items():
                 try:
                     kwargs[key] = rule.converters.get(key, str)(value)
                 except Exception:
-                    return self.response_class("Not Found", status=404)
+                    raise HTTPExceptionError(
+                        self.response_class("Not Found", status=404)
+                    ) from None
+            request.url_rule = rule
+            return chains[rule.endpoint], kwargs
+        raise HTTPExceptionError(self.response_class("Not Found", status=404))
+
+    def dispatch_request(self, request: Request) -> Response:
+        """Match route and return a response object.
+
+        The dispatcher matches the incoming request with
+        ``match_request`` and invokes the registered view function.
+
+        View return values are normalised with make_response so tuples,
+        mappings, and ``Response`` objects are handled consistently.
+        Views are called through the chains from ``build_view_chains``,
+        which run the ``before_request`` hooks ahead of them, and the
+        ``after_request`` hooks are applied to the converted response.
+
+        Static file requests containing a period in the path are served
+        from the configured ``static_folder``. Missing routes yield a
+        ``404`` response and disallowed methods a ``405`` one; these go
+        through the ``after_request`` hooks too, but not through the
+        ``before_request`` hooks since no view was matched.
+
+        When the request carries a ``PhaseTimer``, the ``route``,
+        ``view``, and ``serialise`` phases are marked on it. The
+        ``view`` phase includes the ``before_request`` hooks, and
+        ``serialise`` covers ``make_response`` and the
+        ``after_request`` hooks.
+
+        :param request: The request object to dispatch.
+        :return: Response object.
+        """
+        timer = request.timer
+        rv: ResponseReturnValue
+        try:
+            view_func, kwargs = self.match_request(request)
+        except HTTPExceptionError as err:
+            rv = err.response
+            if timer is not None:
+                timer.mark("route")
+        else:
+            if timer is not None:
+                timer.mark("route")
             try:
                 rv = view_func(**kwargs)
             except HTTPExceptionError as err:
-                return err.response
-            return self.make_response(rv)
-        return self.response_class("Not Found", status=404)
+                rv = err.response
+            if timer is not None:
+                timer.mark("view")
+        response = self.make_response(rv)
+        for func in self._after_request_chain:
+            response = func(response)
+        if timer is not None:
+            timer.mark("serialise")
+        return response
 
     def send_static_file(self, path: str) -> Response:
         """Serve static files.
@@ -706,18 +1384,26 @@ class Miroslava(App):
             f"{response.status_code} -"
         )
 
-    def send_response(self, client: socket.socket, response: Response) -> None:
+    def send_response(self, client: socket.socket, response: Response) -> int:
         """Send a Response object to the client socket.
 
+        The head is built from pre-encoded status lines and a cached
+        ``Date`` block, then written along with the body buffer in a
+        single scatter-gather call, so the body is never copied.
+        Streamed responses are written chunk by chunk as they are
+        produced. Returns the number of bytes written.
+
         :param client: The client socket.
         :param response: The response object to send.
         """
-        status_line = f"HTTP/1.1 {response.status}\r\n"
-        headers = "".join(f"{k}: {v}\r\n" for k, v in response.headers.items())
-        full_response = (
-            status_line.encode("latin-1")
-            + headers.encode("latin-1")
-            + f"Content-Length: {len(response.data)}\r\n\r\n".encode("latin-1")
-            + response.data
-        )
-        client.sendall(full_response)
+        if response.is_streamed:
+            try:
+                return send_chunked(
+                    client,
+                    serialise_head(response, None),
+                    response.iter_encoded(),
+                )
+            finally:
+                response.close()
+        head = serialise_head(response, response.content_length)
+        return send_buffers(client, (head, response.get_data()))
@@ -0,0 +1,507 @@
+"""\
+Miroslava's Load Generator
+==========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module is a small HTTP load generator for measuring a running
+server, usually a local ``Miroslava.run``. It needs nothing but the
+standard library and talks to the server over raw sockets, one thread
+per connection::
+
+    python -m miroslava.bench http://127.0.0.1:9001/ -c 8 -d 10
+    python -m miroslava.bench http://127.0.0.1:9001/ --rate 500 -k
+    python -m miroslava.bench http://127.0.0.1:9001 --mix requests.txt
+
+In the default closed loop, every connection sends its next request as
+soon as the previous response has arrived. With ``--rate``, the load is
+open loop instead: requests are due at a fixed rate, spread over the
+connections, whether or not earlier ones have completed.
+
+A closed loop hides stalls, as a slow response also delays the requests
+that would have been sent while waiting for it. This is known as
+coordinated omission. In the open loop, latencies are measured from the
+time a request was due rather than from when it was sent, which counts
+that waiting time. In the closed loop, the corrected latencies
+backfill the requests a stall held up, assuming they would have been
+sent at the median latency apart. Both the raw and corrected
+percentiles are reported.
+
+A mix file lists the requests to send, one per line, as a method, a
+path, and an optional integer weight. Blank lines and lines starting
+with ``#`` are ignored. Requests are sent in a fixed, weighted order,
+so runs are repeatable::
+
+    GET /           5
+    GET /users/42   3
+    POST /login     1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+#: Percentiles included in the report.
+PERCENTILES: t.Final[tuple[float, ...]] = (50.0, 90.0, 99.0, 99.9)
+
+
+class RequestSpec:
+    """A request of the mix.
+
+    :param method: HTTP method of the request.
+    :param path: Path and query string of the request.
+    :param weight: Relative number of times the request is sent,
+        defaults to ``1``.
+    """
+
+    __slots__ = ("method", "path", "weight")
+
+    def __init__(self, method: str, path: str, weight: int = 1) -> None:
+        """Initialise a request of the mix."""
+        self.method = method.upper()
+        self.path = path
+        self.weight = weight
+
+    def __repr__(self) -> str:
+        """Human-readable representation of the request."""
+        return f"<RequestSpec {self.method} {self.path} x{self.weight}>"
+
+    def encode(self, host: str, keep_alive: bool) -> bytes:
+        """Return the request as bytes ready to be sent.
+
+        :param host: Value of the ``Host`` header.
+        :param keep_alive: Ask the server to keep the connection open.
+        """
+        connection = "keep-alive" if keep_alive else "close"
+        return (
+            f"{self.method} {self.path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            f"User-Agent: miroslava-bench\r\n"
+            f"Connection: {connection}\r\n"
+            f"Content-Length: 0\r\n\r\n"
+        ).encode("latin-1")
+
+
+def load_mix(filename: str) -> list[RequestSpec]:
+    """Read a request mix from a file.
+
+    :param filename: Path of the mix file.
+    :raises ValueError: If a line cannot be parsed or has a weight
+        below ``1``.
+    """
+    specs = []
+    with open(filename) as f:
+        for lineno, line in enumerate(f, 1):
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            if len(fields) not in (2, 3) or not fields[1].startswith("/"):
+                raise ValueError(
+                    f"{filename}:{lineno}: expected 'METHOD /path [WEIGHT]'"
+                )
+            try:
+                weight = int(fields[2]) if len(fields) == 3 else 1
+            except ValueError:
+                weight = 0
+            if weight < 1:
+                raise ValueError(
+                    f"{filename}:{lineno}: weight must be a positive integer"
+                )
+            specs.append(RequestSpec(fields[0], fields[1], weight))
+    if not specs:
+        raise ValueError(f"{filename} contains no requests")
+    return specs
+
+
+def read_response(sock: socket.socket, buffer: bytearray) -> tuple[int, bool]:
+    """Read one response from a socket.
+
+    Bytes received past the end of the response are left in
+    ``buffer`` for the next one. Returns the status code and whether
+    the connection can be reused.
+
+    :param sock: Connected socket to read from.
+    :param buffer: Bytes already received on this connection.
+    :raises ConnectionError: If the connection is closed early.
+    """
+
+    def fill(size: int) -> None:
+        while len(buffer) < size:
+            chunk = sock.recv(65_536)
+            if not chunk:
+                raise ConnectionError("connection closed mid-response")
+            buffer.extend(chunk)
+
+    while (end := buffer.find(b"\r\n\r\n")) < 0:
+        chunk = sock.recv(65_536)
+        if not chunk:
+            raise ConnectionError("connection closed before a response")
+        buffer.extend(chunk)
+    lines = bytes(buffer[:end]).decode("latin-1").split("\r\n")
+    del buffer[: end + 4]
+    version, status = lines[0].split(None, 2)[:2]
+    headers = {}
+    for line in lines[1:]:
+        key, _, value = line.partition(":")
+        headers[key.strip().lower()] = value.strip().lower()
+    reuse = headers.get("connection") != "close" and version == "HTTP/1.1"
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        fill(length)
+        del buffer[:length]
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            while (end := buffer.find(b"\r\n")) < 0:
+                fill(len(buffer) + 1)
+            size = int(buffer[:end].split(b";")[0], 16)
+            fill(end + 2 + size + 2)
+            del buffer[: end + 2 + size + 2]
+            if not size:
+                break
+    else:
+        while sock.recv(65_536):
+            pass
+        reuse = False
+    return int(status), reuse
+
+
+class Results:
+    """Outcome of a load test.
+
+    :param latencies: Latency of every completed request in ns.
+    :param corrected: Latencies corrected for coordinated omission.
+    :param statuses: Number of responses per status code.
+    :param errors: Number of requests which failed.
+    :param elapsed: Duration of the test in seconds.
+    """
+
+    def __init__(
+        self,
+        latencies: list[int],
+        corrected: list[int],
+        statuses: dict[int, int],
+        errors: int,
+        elapsed: float,
+    ) -> None:
+        """Initialise the results, sorting the latencies."""
+        self.latencies = sorted(latencies)
+        self.corrected = sorted(corrected)
+        self.statuses = statuses
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    @staticmethod
+    def percentile(values: list[int], percent: float) -> float:
+        """Return a percentile of sorted values in milliseconds.
+
+        :param values: Sorted latencies in ns.
+        :param percent: Percentile between ``0`` and ``100``.
+        """
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(len(values) * percent / 100))
+        return values[index] / 1e6
+
+    def summary(self) -> dict[str, t.Any]:
+        """Return the results as a JSON serialisable mapping."""
+        return {
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "latency_ms": {
+                f"p{p:g}": self.percentile(self.latencies, p)
+                for p in PERCENTILES
+            }
+            | {"max": self.percentile(self.latencies, 100)},
+            "corrected_latency_ms": {
+                f"p{p:g}": self.percentile(self.corrected, p)
+                for p in PERCENTILES
+            }
+            | {"max": self.percentile(self.corrected, 100)},
+        }
+
+    def format(self) -> str:
+        """Return the results as a human-readable report."""
+        statuses = ", ".join(
+            f"{status}: {count}"
+            for status, count in sorted(self.statuses.items())
+        )
+        lines = [
+            (
+                f"Requests:    {len(self.latencies)} in {self.elapsed:.2f}s, "
+                f"{self.errors} errors"
+            ),
+            f"Throughput:  {self.throughput:.1f} requests/s",
+            f"Statuses:    {statuses or '-'}",
+            "",
+            f"{'Latency (ms)':<14}{'raw':>12}{'corrected':>12}",
+        ]
+        for p in (*PERCENTILES, 100.0):
+            name = "max" if p == 100.0 else f"p{p:g}"
+            lines.append(
+                f"{name:<14}{self.percentile(self.latencies, p):>12.3f}"
+                f"{self.percentile(self.corrected, p):>12.3f}"
+            )
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """Send requests to a server and measure the latencies.
+
+    .. code-block:: python
+
+        results = LoadGenerator("http://127.0.0.1:9001/", 8).run()
+        print(results.format())
+
+    :param url: URL of the server. Its path is requested unless a
+        ``mix`` is given, whose paths are then relative to the host.
+    :param concurrency: Number of connections sending requests,
+        defaults to ``8``.
+    :param duration: Seconds to send requests for, defaults to
+        ``10.0``.
+    :param rate: Requests per second across all connections for an
+        open loop test, defaults to ``None`` for a closed loop.
+    :param keep_alive: Reuse connections for several requests if the
+        server allows it, defaults to ``False``.
+    :param mix: Requests to send in turn, defaults to ``None``.
+    :param timeout: Seconds to wait on a socket, defaults to ``10.0``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        concurrency: int = 8,
+        duration: float = 10.0,
+        rate: float | None = None,
+        keep_alive: bool = False,
+        mix: Sequence[RequestSpec] | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """Initialise a load test."""
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Only http:// URLs are supported, not {url!r}")
+        self.address = (parts.hostname, parts.port or 80)
+        self.concurrency = concurrency
+        self.duration = duration
+        self.rate = rate
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        if not mix:
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+            mix = [RequestSpec("GET", path)]
+        self.requests = [
+            spec.encode(parts.netloc, keep_alive)
+            for spec in mix
+            for _ in range(spec.weight)
+        ]
+
+    def run(self) -> Results:
+        """Run the load test and return its results."""
+        workers = [_Worker(self, n) for n in range(self.concurrency)]
+        threads = [
+            threading.Thread(target=worker.run, daemon=True)
+            for worker in workers
+        ]
+        start = time.perf_counter_ns()
+        for worker in workers:
+            worker.start_ns = start
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        latencies = [value for w in workers for value in w.latencies]
+        statuses: dict[int, int] = {}
+        for worker in workers:
+            for status, count in worker.statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+        if self.rate:
+            corrected = latencies
+            latencies = [value for w in workers for value in w.service]
+        else:
+            corrected = backfill(latencies)
+        return Results(
+            latencies,
+            corrected,
+            statuses,
+            sum(worker.errors for worker in workers),
+            elapsed,
+        )
+
+
+class _Worker:
+    """Connection of a ``LoadGenerator`` sending requests in a loop."""
+
+    def __init__(self, generator: LoadGenerator, index: int) -> None:
+        """Initialise a worker."""
+        self.generator = generator
+        self.index = index
+        self.start_ns = 0
+        self.latencies: list[int] = []
+        self.service: list[int] = []
+        self.statuses: dict[int, int] = {}
+        self.errors = 0
+        self.sock: socket.socket | None = None
+        self.buffer = bytearray()
+
+    def run(self) -> None:
+        """Send requests until the test is over."""
+        generator = self.generator
+        requests = generator.requests
+        concurrency = generator.concurrency
+        end = self.start_ns + int(generator.duration * 1e9)
+        interval = int(1e9 / generator.rate) if generator.rate else 0
+        n = self.index
+        try:
+            while True:
+                now = time.perf_counter_ns()
+                due = now
+                if interval:
+                    due = self.start_ns + n * interval
+                    if due >= end:
+                        break
+                    if due > now:
+                        time.sleep((due - now) / 1e9)
+                elif now >= end:
+                    break
+                sent = time.perf_counter_ns()
+                status = self.send(requests[n % len(requests)])
+                done = time.perf_counter_ns()
+                if status is not None:
+                    self.statuses[status] = self.statuses.get(status, 0) + 1
+                    self.latencies.append(done - due)
+                    self.service.append(done - sent)
+                n += concurrency
+        finally:
+            self.close()
+
+    def send(self, raw: bytes) -> int | None:
+        """Send a request and return its status, or ``None`` on error.
+
+        A reused connection which the server has closed in the meantime
+        is reopened once.
+        """
+        generator = self.generator
+        for attempt in (0, 1):
+            reused = self.sock is not None
+            try:
+                if self.sock is None:
+                    self.sock = socket.create_connection(
+                        generator.address, generator.timeout
+                    )
+                self.sock.sendall(raw)
+                status, reuse = read_response(self.sock, self.buffer)
+            except (OSError, ValueError) as err:
+                self.close()
+                if reused and not attempt and isinstance(err, OSError):
+                    continue
+                self.errors += 1
+                return None
+            if not (reuse and generator.keep_alive):
+                self.close()
+            return status
+        return None
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        self.buffer.clear()
+
+
+def backfill(latencies: list[int]) -> list[int]:
+    """Correct closed loop latencies for coordinated omission.
+
+    Requests are assumed to be sent the median latency apart. For every
+    latency spanning more than one such interval, the requests which
+    would have been sent while waiting are added, each with the part
+    of the wait it would have seen.
+
+    :param latencies: Latencies in ns.
+    """
+    if not latencies:
+        return []
+    expected = sorted(latencies)[len(latencies) // 2]
+    corrected = list(latencies)
+    if expected <= 0:
+        return corrected
+    for latency in latencies:
+        missed = latency - expected
+        while missed >= expected:
+            corrected.append(missed)
+            missed -= expected
+    return corrected
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m miroslava.bench",
+        description="Generate HTTP load against a server.",
+    )
+    parser.add_argument("url", help="URL to request")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=8, help="connections"
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, default=10.0, help="seconds"
+    )
+    parser.add_argument(
+        "-r", "--rate", type=float, help="requests/s for an open loop test"
+    )
+    parser.add_argument(
+        "-k", "--keep-alive", action="store_true", help="reuse connections"
+    )
+    parser.add_argument("-m", "--mix", help="file with the requests to send")
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=10.0, help="socket timeout"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as JSON"
+    )
+    args = parser.parse_args(argv)
+    try:
+        generator = LoadGenerator(
+            args.url,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            rate=args.rate,
+            keep_alive=args.keep_alive,
+            mix=load_mix(args.mix) if args.mix else None,
+            timeout=args.timeout,
+        )
+    except (OSError, ValueError) as err:
+        parser.error(str(err))
+    results = generator.run()
+    if args.json:
+        print(json.dumps(results.summary(), indent=2))
+    else:
+        print(results.format())
+    return 1 if results.errors and not results.latencies else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,24 +4,42 @@ Miroslava's Werkzeug-style Datastructures
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 26 January, 2026
-Last updated on: 01 February, 2026
+Last updated on: 18 October, 2026
 
 This module provides lightweight stand-ins for Werkzeug's ``MultiDict``
 and ``Headers`` classes. The ``MultiDict`` can hold multiple values for
 the same key, which is essential when handling form submissions and
-query strings.
+query strings. The ``EnvironHeaders`` is a read-only view over the
+``HTTP_*`` keys of a WSGI environment, so requests never have to copy
+their headers unless asked to. ``Headers`` itself preserves the casing
+of header names for the wire and can be parsed from, and serialised
+to, raw bytes directly. Similarly, ``QueryArgs`` is a read-only
+view over a raw query string which only percent-decodes the values of
+the keys that are actually looked up. Finally, ``FileStorage`` wraps a
+file uploaded through a multipart form.
 """
 
 from __future__ import annotations
 
+import os
+import shutil
 import typing as t
 from collections.abc import Iterable
 from collections.abc import Mapping
+from urllib.parse import unquote_plus
 
 K = t.TypeVar("K")
 V = t.TypeVar("V")
 T = t.TypeVar("T")
 
+_missing: t.Any = object()
+
+
+class _ValueList(list[V]):
+    """Marker list holding every value of a key with duplicates."""
+
+    __slots__: tuple[()] = ()
+
 
 class MultiDict(dict[K, V]):
     """A dictionary variant that stores multiple values for each key.
@@ -37,8 +55,17 @@ class MultiDict(dict[K, V]):
         order and accessed using the first item by default. All the
         common accessing methods return the earliest value unless a
         list is explicitly requested.
+
+    .. note::
+
+        Keys holding a single value store it inline. The storage is
+        only upgraded to a list the first time a duplicate is added,
+        so the common case costs no extra allocation and lookups do
+        not have to index into a list.
     """
 
+    __slots__: tuple[()] = ()
+
     def __init__(
         self,
         mapping: (
@@ -56,7 +83,7 @@ class MultiDict(dict[K, V]):
                 self.add(key, value)
         elif isinstance(mapping, Mapping):
             for key, value in mapping.items():
-                self[key] = [value] if not isinstance(value, list) else value
+                self[key] = value
         else:
             for key, value in mapping:
                 self.add(key, value)
@@ -67,15 +94,19 @@ class MultiDict(dict[K, V]):
         :param key: Lookup key.
         :raises KeyError: When the key does not exist.
         """
-        if key in self:
-            return super().__getitem__(key)[0]
-        raise KeyError(key)
+        value = dict.__getitem__(self, key)
+        if type(value) is _ValueList:
+            return value[0]
+        return value
 
     def __setitem__(self, key: K, value: V) -> None:
-        """Set or replace all values for the key with a single value."""
-        super().__setitem__(
-            key, [value] if not isinstance(value, list) else value
-        )
+        """Set or replace all values for the key with a single value.
+
+        A list is treated as the full list of values for the key.
+        """
+        if isinstance(value, list):
+            value = value[0] if len(value) == 1 else _ValueList(value)
+        super().__setitem__(key, value)
 
     def add(self, key: K, value: V) -> None:
         """Append a new value for the key, preserving existing ones.
@@ -83,10 +114,48 @@ class MultiDict(dict[K, V]):
         :param key: Target key to append to.
         :param value: Value to append.
         """
-        if key in self:
-            super().__getitem__(key).append(value)
+        current = dict.get(self, key, _missing)
+        if current is _missing:
+            super().__setitem__(key, value)
+        elif type(current) is _ValueList:
+            current.append(value)
         else:
-            self[key] = [value]
+            super().__setitem__(key, _ValueList((current, value)))
+
+    @t.overload
+    def get(self, key: K) -> V | None: ...
+    @t.overload
+    def get(self, key: K, default: V) -> V: ...
+    @t.overload
+    def get(self, key: K, default: T) -> V | T: ...
+    @t.overload
+    def get(self, key: K, type_: t.Callable[[V], T]) -> T | None: ...
+    @t.overload
+    def get(self, key: K, default: T, type_: t.Callable[[V], T]) -> T: ...
+
+    def get(
+        self,
+        key: K,
+        default: V | T | None = None,
+        type_: t.Callable[[V], T] | None = None,
+    ) -> V | T | None:
+        """Return the first value for the key or a default.
+
+        When a converter is given and it fails with a ``ValueError``
+        or ``TypeError``, the default is returned instead, so that
+        ``args.get("limit", 20, type_=int)`` never raises.
+
+        :param key: Lookup key.
+        :param default: Value returned when the key is missing,
+            defaults to ``None``.
+        :param type_: Optional converter applied to the fetched value,
+            defaults to ``None``.
+        """
+        try:
+            value = self[key]
+            return type_(value) if type_ is not None else value
+        except (KeyError, ValueError, TypeError):
+            return default
 
     @t.overload
     def getlist(self, key: K) -> list[V]: ...
@@ -104,12 +173,15 @@ class MultiDict(dict[K, V]):
         :param type_: Optional converter applied element-wise, defaults
             to ``None``.
         """
-        try:
-            values = super().__getitem__(key)
-        except KeyError:
+        value = dict.get(self, key, _missing)
+        if type(value) is _ValueList:
+            values = value.copy()
+        elif value is _missing:
             return []
+        else:
+            values = [value]
         if type_ is None:
-            return list(values)
+            return values
         result: list[T] = []
         for value in values:
             try:
@@ -125,32 +197,287 @@ class MultiDict(dict[K, V]):
             separately; otherwise yield only the first value per key,
             defaults to ``False``.
         """
-        for key in super().__iter__():
-            values = super().__getitem__(key)
-            if multi:
-                for value in values:
-                    yield key, value
+        for key, value in super().items():
+            if type(value) is not _ValueList:
+                yield key, value
+            elif multi:
+                for item in value:
+                    yield key, item
             else:
-                yield key, values[0]
+                yield key, value[0]
+
+    def values(self) -> t.Iterator[V]:
+        """Iterate over the first value of every key."""
+        for value in super().values():
+            yield value[0] if type(value) is _ValueList else value
+
+    def lists(self) -> t.Iterator[tuple[K, list[V]]]:
+        """Iterate over keys and the list of all their values."""
+        for key, value in super().items():
+            yield key, value.copy() if type(value) is _ValueList else [value]
+
+
+_lowercase: dict[str, str] = {
+    name: name.lower()
+    for name in (
+        "Accept",
+        "Accept-Encoding",
+        "Accept-Language",
+        "Authorization",
+        "Cache-Control",
+        "Connection",
+        "Content-Disposition",
+        "Content-Encoding",
+        "Content-Length",
+        "Content-Type",
+        "Cookie",
+        "Date",
+        "ETag",
+        "Host",
+        "If-Modified-Since",
+        "If-None-Match",
+        "Last-Modified",
+        "Location",
+        "Referer",
+        "Server",
+        "Set-Cookie",
+        "Transfer-Encoding",
+        "User-Agent",
+        "Vary",
+        "X-Forwarded-For",
+        "X-Requested-With",
+    )
+}
+_lowercase.update({lower: lower for lower in list(_lowercase.values())})
+_LOWERCASE_CACHE_SIZE: t.Final[int] = 512
+
+
+def _lower(name: str) -> str:
+    """Return the lookup key for a header name.
+
+    Common names are precomputed and others are remembered as they are
+    seen, up to a fixed number of entries so arbitrary client-supplied
+    names cannot grow the cache without bound.
+    """
+    lower = _lowercase.get(name)
+    if lower is None:
+        lower = name.lower()
+        if len(_lowercase) < _LOWERCASE_CACHE_SIZE:
+            _lowercase[name] = lower
+    return lower
 
 
 class Headers(MultiDict[str, str]):
-    """HTTP header container that stores some header."""
+    """HTTP header container that stores some header.
+
+    Lookups are case-insensitive, but the casing a header was first
+    set with is preserved and used when the headers are written out
+    with ``to_wire``. Entries are stored under lowercase keys, which
+    for common header names come from a precomputed table rather than
+    calling ``str.lower`` on every access.
+
+    :param mapping: Initial headers, defaults to ``None``.
+    """
+
+    __slots__: tuple[str] = ("_names",)
+
+    def __init__(
+        self,
+        mapping: (
+            MultiDict[str, str]
+            | Mapping[str, str | list[str] | tuple[str, ...]]
+            | Iterable[tuple[str, str]]
+            | None
+        ) = None,
+    ) -> None:
+        """Initialise headers with optional mapping data."""
+        self._names: dict[str, str] = {}
+        super().__init__(mapping)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> t.Self:
+        """Parse a raw header block into a ``Headers`` object.
+
+        The block must not include the request or status line. Lines
+        without a colon are skipped and values are stripped of
+        surrounding whitespace.
+
+        :param raw: Header lines separated by ``CRLF``, as received
+            on the wire.
+        """
+        headers = cls()
+        names = headers._names
+        for line in raw.decode("latin-1").split("\r\n"):
+            name, sep, value = line.partition(":")
+            if not sep or not name:
+                continue
+            lower = _lower(name)
+            value = value.strip()
+            current = dict.get(headers, lower, _missing)
+            if current is _missing:
+                names[lower] = name
+                dict.__setitem__(headers, lower, value)
+            elif type(current) is _ValueList:
+                current.append(value)
+            else:
+                dict.__setitem__(headers, lower, _ValueList((current, value)))
+        return headers
 
     def __getitem__(self, key: str) -> str:
         """Return the first header value matching the name."""
-        return super().__getitem__(key.lower())
+        value: str | _ValueList[str] = dict.__getitem__(self, _lower(key))
+        if isinstance(value, _ValueList):
+            return value[0]
+        return value
 
     def __setitem__(self, key: str, value: str) -> None:
         """Store a header value under a case-insensitive name."""
-        super().__setitem__(key.lower(), value)
+        lower = _lower(key)
+        self._names[lower] = key
+        super().__setitem__(lower, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove every value of a header, ignoring case."""
+        lower = _lower(key)
+        super().__delitem__(lower)
+        self._names.pop(lower, None)
 
     def __contains__(self, key: object) -> bool:
         """Return True when the header name exists, ignoring case."""
         if isinstance(key, str):
-            return super().__contains__(key.lower())
+            return dict.__contains__(self, _lower(key))
         return False
 
+    def __iter__(self) -> t.Iterator[str]:
+        """Iterate over header names in their original casing."""
+        names = self._names
+        for lower in super().__iter__():
+            yield names.get(lower, lower)
+
+    def keys(self) -> t.Iterator[str]:
+        """Iterate over header names in their original casing."""
+        return iter(self)
+
+    def add(self, key: str, value: str) -> None:
+        """Append a header value under a case-insensitive name."""
+        lower = _lower(key)
+        if lower not in self._names:
+            self._names[lower] = key
+        super().add(lower, value)
+
+    def pop(self, key: str, default: t.Any = _missing) -> t.Any:
+        """Remove a header and return its first value.
+
+        :param key: Header name, matched case-insensitively.
+        :param default: Value returned when the header is missing.
+        :raises KeyError: When missing and no default is given.
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            if default is _missing:
+                raise
+            return default
+        del self[key]
+        return value
+
+    @t.overload
+    def getlist(self, key: str) -> list[str]: ...
+    @t.overload
+    def getlist(self, key: str, type_: t.Callable[[str], T]) -> list[T]: ...
+
+    def getlist(
+        self,
+        key: str,
+        type_: t.Callable[[str], T] | None = None,
+    ) -> list[str] | list[T]:
+        """Return all header values matching the name."""
+        return super().getlist(_lower(key), type_)
+
+    def items(self, multi: bool = False) -> t.Iterator[tuple[str, str]]:
+        """Iterate over header names in original casing and values.
+
+        :param multi: When ``True``, yield each stored value
+            separately; otherwise yield only the first value per name,
+            defaults to ``False``.
+        """
+        names = self._names
+        for lower, value in super().items(multi):
+            yield names.get(lower, lower), value
+
+    def to_wire(self, exclude: str | None = None) -> bytes:
+        """Return the headers serialised for an HTTP message.
+
+        Every value is written on its own ``Name: value`` line using
+        the original casing of the name, encoded as ``latin-1``. The
+        blank line terminating the header block is not included.
+
+        :param exclude: Name of a header to leave out, defaults to
+            ``None``.
+        """
+        items = self.items(multi=True)
+        if exclude is not None:
+            exclude = exclude.lower()
+            items = (item for item in items if item[0].lower() != exclude)
+        return "".join(
+            [f"{name}: {value}\r\n" for name, value in items]
+        ).encode("latin-1")
+
+
+class EnvironHeaders(Mapping[str, str]):
+    """Read-only, case-insensitive header view over a WSGI environment.
+
+    Unlike ``Headers``, nothing is copied when the view is created.
+    Lookups translate the header name into its CGI-style key, for
+    example ``Content-Type`` into ``CONTENT_TYPE`` and ``User-Agent``
+    into ``HTTP_USER_AGENT``, and read straight from the environment.
+
+    :param environ: The WSGI environment to read the headers from.
+    """
+
+    __slots__: tuple[str] = ("environ",)
+
+    def __init__(self, environ: Mapping[str, t.Any]) -> None:
+        """Initialise the view with the environment mapping."""
+        self.environ = environ
+
+    def __repr__(self) -> str:
+        """Human-readable representation of the headers view."""
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __getitem__(self, key: str) -> str:
+        """Return the header value matching the name.
+
+        :param key: Header name, matched case-insensitively.
+        :raises KeyError: When the header is not present.
+        """
+        if not isinstance(key, str):
+            raise KeyError(key)
+        name = key.upper().replace("-", "_")
+        if name in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            return self.environ[name]
+        return self.environ[f"HTTP_{name}"]
+
+    def __contains__(self, key: object) -> bool:
+        """Return ``True`` when the header exists, ignoring case."""
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> t.Iterator[str]:
+        """Iterate over the title-cased header names."""
+        for key in self.environ:
+            if key.startswith("HTTP_"):
+                yield key[5:].replace("_", "-").title()
+            elif key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                yield key.replace("_", "-").title()
+
+    def __len__(self) -> int:
+        """Return count of headers in the environment."""
+        return sum(1 for _ in self)
+
     @t.overload
     def get(self, key: str) -> str | None: ...
     @t.overload
@@ -164,11 +491,11 @@ class Headers(MultiDict[str, str]):
 
     def get(
         self,
-        key: K,
+        key: str,
         default: str | T | None = None,
         type_: t.Callable[[str], T] | None = None,
     ) -> str | T | None:
-        """Return the first header value matching name  or a default.
+        """Return the header value matching name or a default.
 
         :param key: Lookup key.
         :param default: Value returned when the key is missing,
@@ -179,7 +506,7 @@ class Headers(MultiDict[str, str]):
         try:
             value = self[key]
             return type_(value) if type_ is not None else value
-        except (KeyError, ValueError):
+        except (KeyError, ValueError, TypeError):
             return default
 
     @t.overload
@@ -192,5 +519,283 @@ class Headers(MultiDict[str, str]):
         key: str,
         type_: t.Callable[[str], T] | None = None,
     ) -> list[str] | list[T]:
-        """Return all header values matching the name."""
-        return super().getlist(key.lower(), type_)
+        """Return all header values matching the name.
+
+        The environment folds repeated headers into a single entry, so
+        the result holds at most one value.
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            return []
+        if type_ is None:
+            return [value]
+        try:
+            return [type_(value)]
+        except (ValueError, TypeError):
+            return []
+
+
+def _unquote(value: str) -> str:
+    """Percent-decode a query string component only when needed."""
+    if "%" in value or "+" in value:
+        return unquote_plus(value)
+    return value
+
+
+class QueryArgs(Mapping[str, str]):
+    """Read-only, lazily decoded multi-value view over a query string.
+
+    The query string is split into raw key-value pairs on first access
+    only. Values stay percent-encoded until their key is requested and
+    are decoded and cached at that point, so a view reading two values
+    out of a long filter query string never decodes the rest of it.
+
+    The interface mirrors ``MultiDict``; the first value is returned by
+    default and ``getlist`` returns every value for a key.
+
+    :param query_string: Raw query string, without the leading ``?``.
+    """
+
+    __slots__: tuple[str, ...] = ("_decoded", "_raw", "query_string")
+
+    def __init__(self, query_string: str = "") -> None:
+        """Initialise the view with a raw query string."""
+        self.query_string = query_string
+        self._raw: dict[str, list[str]] | None = None
+        self._decoded: dict[str, list[str]] = {}
+
+    def __repr__(self) -> str:
+        """Human-readable representation of the arguments."""
+        return f"{type(self).__name__}({list(self.items(multi=True))!r})"
+
+    def _pairs(self) -> dict[str, list[str]]:
+        """Split the query string into raw values indexed by key.
+
+        Keys are kept as they appear on the wire. Only when at least
+        one of them is percent-encoded is the index rebuilt with every
+        key decoded, so plain queries never pay for unquoting keys.
+        """
+        raw = self._raw
+        if raw is None:
+            raw = {}
+            escaped = False
+            for pair in self.query_string.split("&"):
+                if not pair:
+                    continue
+                key, _, value = pair.partition("=")
+                if "%" in key or "+" in key:
+                    escaped = True
+                if key in raw:
+                    raw[key].append(value)
+                else:
+                    raw[key] = [value]
+            if escaped:
+                decoded: dict[str, list[str]] = {}
+                for key, values in raw.items():
+                    decoded.setdefault(_unquote(key), []).extend(values)
+                raw = decoded
+            self._raw = raw
+        return raw
+
+    def _values(self, key: str) -> list[str] | None:
+        """Return the decoded values for a key, decoding on demand."""
+        values = self._decoded.get(key)
+        if values is None:
+            raw = self._pairs().get(key)
+            if raw is None:
+                return None
+            values = self._decoded[key] = [_unquote(value) for value in raw]
+        return values
+
+    def __getitem__(self, key: str) -> str:
+        """Return the first value associated with the key.
+
+        :param key: Lookup key.
+        :raises KeyError: When the key does not exist.
+        """
+        values = self._values(key)
+        if values is None:
+            raise KeyError(key)
+        return values[0]
+
+    def __contains__(self, key: object) -> bool:
+        """Return ``True`` when the key is present in the query."""
+        return key in self._pairs()
+
+    def __iter__(self) -> t.Iterator[str]:
+        """Iterate over the decoded keys in order of appearance."""
+        return iter(self._pairs())
+
+    def __len__(self) -> int:
+        """Return count of distinct keys."""
+        return len(self._pairs())
+
+    @t.overload
+    def get(self, key: str) -> str | None: ...
+    @t.overload
+    def get(self, key: str, default: str) -> str: ...
+    @t.overload
+    def get(self, key: str, default: T) -> str | T: ...
+    @t.overload
+    def get(self, key: str, type_: t.Callable[[str], T]) -> T | None: ...
+    @t.overload
+    def get(self, key: str, default: T, type_: t.Callable[[str], T]) -> T: ...
+
+    def get(
+        self,
+        key: str,
+        default: str | T | None = None,
+        type_: t.Callable[[str], T] | None = None,
+    ) -> str | T | None:
+        """Return the first value for the key or a default.
+
+        :param key: Lookup key.
+        :param default: Value returned when the key is missing or the
+            conversion fails, defaults to ``None``.
+        :param type_: Optional converter applied to the fetched value,
+            defaults to ``None``.
+        """
+        values = self._values(key)
+        if values is None:
+            return default
+        if type_ is None:
+            return values[0]
+        try:
+            return type_(values[0])
+        except (ValueError, TypeError):
+            return default
+
+    @t.overload
+    def getlist(self, key: str) -> list[str]: ...
+    @t.overload
+    def getlist(self, key: str, type_: t.Callable[[str], T]) -> list[T]: ...
+
+    def getlist(
+        self,
+        key: str,
+        type_: t.Callable[[str], T] | None = None,
+    ) -> list[str] | list[T]:
+        """Return all values for the key.
+
+        :param key: Lookup key.
+        :param type_: Optional converter applied element-wise; values
+            that fail to convert are skipped, defaults to ``None``.
+        """
+        values = self._values(key)
+        if values is None:
+            return []
+        if type_ is None:
+            return list(values)
+        result: list[T] = []
+        for value in values:
+            try:
+                result.append(type_(value))
+            except (ValueError, TypeError):
+                pass
+        return result
+
+    def items(self, multi: bool = False) -> t.Iterator[tuple[str, str]]:
+        """Iterate over key-value pairs.
+
+        :param multi: When ``True``, yield each stored value
+            separately; otherwise yield only the first value per key,
+            defaults to ``False``.
+        """
+        for key in self._pairs():
+            values = self._values(key)
+            if multi:
+                for value in values:
+                    yield key, value
+            else:
+                yield key, values[0]
+
+    def to_dict(
+        self, flat: bool = True
+    ) -> dict[str, str] | dict[str, list[str]]:
+        """Return the arguments as a regular dictionary.
+
+        :param flat: When ``True``, keep only the first value per key;
+            otherwise map every key to the list of its values, defaults
+            to ``True``.
+        """
+        if flat:
+            return dict(self.items())
+        return {key: self.getlist(key) for key in self._pairs()}
+
+
+class FileStorage:
+    """Thin wrapper over an uploaded file.
+
+    The underlying stream is usually a ``SpooledTemporaryFile`` which
+    keeps small uploads in memory and moves larger ones to disk.
+    Attribute access that is not defined here, like ``read`` or
+    ``seek``, is forwarded to that stream.
+
+    :param stream: Readable binary stream holding the file contents.
+    :param filename: Filename sent by the client, defaults to ``None``.
+    :param name: Name of the form field, defaults to ``None``.
+    :param content_type: Content type sent by the client, defaults to
+        ``None``.
+    :param content_length: Size of the file in bytes, defaults to
+        ``0``.
+    :param headers: Headers of the multipart part, defaults to
+        ``None``.
+    """
+
+    def __init__(
+        self,
+        stream: t.BinaryIO,
+        filename: str | None = None,
+        name: str | None = None,
+        content_type: str | None = None,
+        content_length: int = 0,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialise the upload wrapper."""
+        self.stream = stream
+        self.filename = filename
+        self.name = name
+        self.content_type = content_type
+        self.content_length = content_length
+        self.headers = dict(headers or {})
+
+    def __repr__(self) -> str:
+        """Human-readable representation of the uploaded file."""
+        return (
+            f"<{type(self).__name__}: {self.filename!r} "
+            f"({self.content_type!r})>"
+        )
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Delegate attribute access to the underlying stream."""
+        return getattr(self.stream, name)
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        """Iterate over the lines of the underlying stream."""
+        return iter(self.stream)
+
+    def __bool__(self) -> bool:
+        """Return ``True`` when a file was actually uploaded."""
+        return bool(self.filename)
+
+    def save(
+        self,
+        dst: str | os.PathLike[str] | t.BinaryIO,
+        buffer_size: int = 16384,
+    ) -> None:
+        """Save the file to a path or a writable binary stream.
+
+        :param dst: Destination path or file object.
+        :param buffer_size: Size of the copy buffer in bytes, defaults
+            to ``16384``.
+        """
+        if isinstance(dst, (str, os.PathLike)):
+            with open(dst, "wb") as f:
+                shutil.copyfileobj(self.stream, f, buffer_size)
+        else:
+            shutil.copyfileobj(self.stream, dst, buffer_size)
+
+    def close(self) -> None:
+        """Close the underlying stream, removing any temporary file."""
+        self.stream.close()
@@ -0,0 +1,305 @@
+"""\
+Miroslava's Form Parser
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module implements an incremental ``multipart/form-data`` parser.
+
+Unlike URL-encoded forms, multipart bodies may carry file uploads of
+arbitrary size, so they are never buffered as a whole. The parser pulls
+fixed-size chunks from the request stream, scans them for the boundary
+delimiter, and hands the bytes of each part to its destination as they
+arrive. Text fields are collected in memory, up to a limit of their
+own which applies even when no other limit is configured, while file
+parts are written to a ``SpooledTemporaryFile`` which transparently
+spills to disk once it grows beyond a threshold.
+
+Size limits are checked while reading, so an oversized part or body is
+rejected as soon as the limit is crossed rather than after the whole
+upload has been received. A body which ends before the closing
+boundary is rejected with a ``400``, and any temporary files created
+for it are closed.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import typing as t
+
+from miroslava.datastructures import FileStorage
+from miroslava.datastructures import MultiDict
+from miroslava.utils import HTTPExceptionError
+
+if t.TYPE_CHECKING:
+    from miroslava.utils import LimitedStream
+
+CHUNK_SIZE: t.Final[int] = 64 * 1024
+MAX_HEADER_SIZE: t.Final[int] = 8 * 1024
+
+
+class RequestEntityTooLargeError(HTTPExceptionError):
+    """Error raised when the request body exceeds a configured limit.
+
+    It is an ``HTTPExceptionError``, so raising it while a view reads
+    ``request.form`` or ``request.files`` short-circuits dispatch with
+    a ``413`` response.
+
+    :param description: Body of the ``413`` response, defaults to
+        ``Request Entity Too Large``.
+    """
+
+    def __init__(self, description: str = "Request Entity Too Large") -> None:
+        """Initialise the error with a prepared ``413`` response."""
+        from miroslava.wrappers import Response
+
+        super().__init__(Response(description, status=413))
+
+
+class BadRequestError(HTTPExceptionError):
+    """Error raised when a request body is malformed or cut short.
+
+    Like ``RequestEntityTooLargeError``, it short-circuits dispatch,
+    here with a ``400`` response.
+
+    :param description: Body of the ``400`` response, defaults to
+        ``Bad Request``.
+    """
+
+    def __init__(self, description: str = "Bad Request") -> None:
+        """Initialise the error with a prepared ``400`` response."""
+        from miroslava.wrappers import Response
+
+        super().__init__(Response(description, status=400))
+
+
+def parse_options_header(value: str) -> tuple[str, dict[str, str]]:
+    """Split a header like ``Content-Type`` into value and options.
+
+    :param value: Raw header value, for example
+        ``multipart/form-data; boundary=xyz``.
+    :return: Lowercased main value and a mapping of its parameters.
+    """
+    main, *params = value.split(";")
+    options: dict[str, str] = {}
+    for param in params:
+        key, sep, val = param.strip().partition("=")
+        if not sep:
+            continue
+        val = val.strip()
+        if len(val) >= 2 and val[0] == val[-1] == '"':
+            val = val[1:-1].replace('\\"', '"')
+        options[key.strip().lower()] = val
+    return main.strip().lower(), options
+
+
+class MultiPartParser:
+    """Incremental parser for ``multipart/form-data`` request bodies.
+
+    :param max_part_size: Maximum size in bytes of a single part, file
+        or text, defaults to ``None`` (unlimited).
+    :param max_parts: Maximum number of parts, defaults to ``1000``.
+    :param max_memory_size: Maximum size in bytes of a text part, which
+        is held in memory, defaults to ``500 KB``. A smaller
+        ``max_part_size`` takes precedence.
+    :param spill_threshold: Size in bytes after which a file part is
+        moved from memory to a temporary file on disk, defaults to
+        ``512 KiB``.
+    :param chunk_size: Number of bytes read from the stream at once,
+        defaults to ``64 KiB``.
+    """
+
+    def __init__(
+        self,
+        max_part_size: int | None = None,
+        max_parts: int | None = 1000,
+        spill_threshold: int = 512 * 1024,
+        chunk_size: int = CHUNK_SIZE,
+        max_memory_size: int | None = 500_000,
+    ) -> None:
+        """Initialise the parser with its limits."""
+        self.max_part_size = max_part_size
+        self.max_parts = max_parts
+        self.max_memory_size = max_memory_size
+        self.spill_threshold = spill_threshold
+        self.chunk_size = chunk_size
+
+    def parse(
+        self,
+        stream: LimitedStream | t.BinaryIO,
+        boundary: str,
+        charset: str = "utf-8",
+    ) -> tuple[MultiDict[str, str], MultiDict[str, FileStorage]]:
+        """Parse a multipart body into form fields and files.
+
+        Memory use is bounded by the chunk size plus
+        ``max_memory_size`` for every text field; file contents never
+        accumulate in memory beyond the spill threshold.
+
+        :param stream: Readable binary stream positioned at the start
+            of the body.
+        :param boundary: Boundary from the ``Content-Type`` header.
+        :param charset: Charset used for decoding text fields, defaults
+            to ``utf-8``.
+        :raises BadRequestError: When the body ends before the closing
+            boundary.
+        :raises RequestEntityTooLargeError: When a part or the number
+            of parts exceeds the configured limits.
+        :return: A tuple of form fields and uploaded files.
+        """
+        files: MultiDict[str, FileStorage] = MultiDict()
+        # Temporary files are tracked from creation, so an error halfway
+        # through a part closes them too, not only the finished uploads.
+        spooled: list[tempfile.SpooledTemporaryFile[bytes]] = []
+        try:
+            form = self._parse(stream, boundary, charset, files, spooled)
+        except BaseException:
+            for container in spooled:
+                container.close()
+            raise
+        return form, files
+
+    def _parse(
+        self,
+        stream: LimitedStream | t.BinaryIO,
+        boundary: str,
+        charset: str,
+        files: MultiDict[str, FileStorage],
+        spooled: list[tempfile.SpooledTemporaryFile[bytes]],
+    ) -> MultiDict[str, str]:
+        """Parse the parts of a body, adding uploads to ``files``.
+
+        :param stream: Readable binary stream of the body.
+        :param boundary: Boundary from the ``Content-Type`` header.
+        :param charset: Charset used for decoding text fields.
+        :param files: Container the uploaded files are added to.
+        :param spooled: List every temporary file is appended to as
+            soon as it is created.
+        :return: The form fields.
+        """
+        form: MultiDict[str, str] = MultiDict()
+        delimiter = b"\r\n--" + boundary.encode("latin-1")
+        # Prefixing a CRLF lets the first boundary be matched with the
+        # same delimiter as every later one.
+        buffer = b"\r\n"
+        eof = False
+        parts = 0
+
+        def fill() -> bool:
+            nonlocal buffer, eof
+            if eof:
+                return False
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer += chunk
+            return True
+
+        while (index := buffer.find(delimiter)) < 0:
+            buffer = buffer[-len(delimiter) :]
+            if not fill():
+                raise BadRequestError("Multipart body has no boundary")
+        buffer = buffer[index + len(delimiter) :]
+        while True:
+            while len(buffer) < 2 and fill():
+                pass
+            marker = buffer[:2]
+            if marker == b"--":
+                break
+            if marker != b"\r\n":
+                raise BadRequestError("Multipart body ended early")
+            buffer = buffer[2:]
+            while (end := buffer.find(b"\r\n\r\n")) < 0:
+                if len(buffer) > MAX_HEADER_SIZE:
+                    raise RequestEntityTooLargeError(
+                        "Multipart part headers are too large"
+                    )
+                if not fill():
+                    raise BadRequestError("Multipart body ended early")
+            headers = self._parse_part_headers(buffer[:end])
+            buffer = buffer[end + 4 :]
+            parts += 1
+            if self.max_parts is not None and parts > self.max_parts:
+                raise RequestEntityTooLargeError("Too many multipart parts")
+            _, disposition = parse_options_header(
+                headers.get("content-disposition", "")
+            )
+            name = disposition.get("name", "")
+            filename = disposition.get("filename")
+            container: t.Any
+            limit = self.max_part_size
+            if filename is not None:
+                # Closed by ``parse`` on error, otherwise by ``close`` on
+                # the request the upload belongs to.
+                spill = self.spill_threshold
+                container = tempfile.SpooledTemporaryFile(spill)  # noqa: SIM115
+                spooled.append(container)
+            else:
+                container = bytearray()
+                memory = self.max_memory_size
+                if memory is not None and (limit is None or memory < limit):
+                    limit = memory
+            size = 0
+            while True:
+                index = buffer.find(delimiter)
+                if index >= 0:
+                    data, buffer = buffer[:index], buffer[index:]
+                else:
+                    keep = len(delimiter) - 1
+                    data, buffer = buffer[:-keep], buffer[-keep:]
+                if data:
+                    size += len(data)
+                    if limit is not None and size > limit:
+                        raise RequestEntityTooLargeError(
+                            f"Multipart part {name!r} is too large"
+                        )
+                    if filename is not None:
+                        container.write(data)
+                    else:
+                        container += data
+                if index >= 0:
+                    buffer = buffer[len(delimiter) :]
+                    break
+                if not fill():
+                    raise BadRequestError("Multipart body ended early")
+            if filename is not None:
+                container.seek(0)
+                files.add(
+                    name,
+                    FileStorage(
+                        container,
+                        filename=filename,
+                        name=name,
+                        content_type=headers.get("content-type"),
+                        content_length=size,
+                        headers=headers,
+                    ),
+                )
+            else:
+                _, options = parse_options_header(
+                    headers.get("content-type", "")
+                )
+                form.add(
+                    name,
+                    bytes(container).decode(
+                        options.get("charset", charset), "replace"
+                    ),
+                )
+        return form
+
+    @staticmethod
+    def _parse_part_headers(block: bytes) -> dict[str, str]:
+        """Parse the header block of a single part.
+
+        :param block: Raw header lines without the trailing blank line.
+        :return: Mapping of lowercased header names to values.
+        """
+        headers: dict[str, str] = {}
+        for line in block.decode("utf-8", "replace").split("\r\n"):
+            key, sep, value = line.partition(":")
+            if sep:
+                headers[key.strip().lower()] = value.strip()
+        return headers
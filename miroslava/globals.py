@@ -4,7 +4,7 @@ Miroslava's Globals
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 28 January, 2026
-Last updated on: 02 February, 2026
+Last updated on: 18 October, 2026
 
 This module exposes the global proxies. Each proxy uses ``contextvars``
 to resolve to the appropriate object for the active request or
@@ -14,7 +14,9 @@ a ``ContextVar`` or returned by a callable.
 
 This design keeps globals like ``request`` or ``current_app`` safe
 across threads and asynchronous tasks while preserving a natural
-attribute-based API for developers.
+attribute-based API for developers. Code that reads the current request
+or application many times per call can skip the proxy altogether with
+``get_current_request`` and ``get_current_app``.
 
 Finally, it also has the ``AppContext``, which stores the application
 instance and a namespace object for user data. While, the
@@ -23,6 +25,12 @@ data. Each context is pushed to ``contextvars`` so access remains
 isolated per thread or asynchronous task, mirroring Flask's context
 management model.
 
+Every ``RequestContext`` carries its own ``AppContext``, so pushing a
+request context is a single ``ContextVar.set``. The application proxies
+use a pushed ``AppContext`` when there is one and fall back to the one
+of the active request otherwise. The server keeps finished request
+contexts in a pool and reuses them, clearing ``g`` in between.
+
 .. note::
 
     Attempting to access a proxy outside its required context raises a
@@ -118,6 +126,14 @@ class RequestContext:
     proxies like request and session resolve correctly for the
     active task.
 
+    The request context owns an ``AppContext`` for the same app, which
+    the application proxies resolve to while the request is active. It
+    is only pushed separately when another application's context is
+    active at the time, so the common case costs a single
+    ``ContextVar`` push. A finished context can be prepared for another
+    request with ``reset``, which keeps both context objects and only
+    clears ``g``.
+
     :param app: Application instance.
     :param environ: WSGI environment created by the server. This is
         currently unused.
@@ -138,7 +154,8 @@ class RequestContext:
             request = app.request_class(environ)
         self.request: Request = request
         self.session: SessionMixin | None = session
-        self._cv_tokens: list[Token[RequestContext]] = []
+        self.app_ctx = AppContext(app)
+        self._cv_tokens: list[tuple[Token[RequestContext], bool]] = []
 
     def __enter__(self) -> t.Self:
         """Push context when entering a ``with`` block."""
@@ -156,17 +173,37 @@ class RequestContext:
 
     def push(self) -> None:
         """Push the context to the current context variable stack."""
-        self._cv_tokens.append(_cv_request.set(self))
+        app_ctx = _cv_app.get(None)
+        push_app = app_ctx is not None and app_ctx.app is not self.app
+        if push_app:
+            self.app_ctx.push()
+        self._cv_tokens.append((_cv_request.set(self), push_app))
 
     def pop(self) -> None:
         """Pop the context from the current context variable stack."""
         if self._cv_tokens:
-            _cv_request.reset(self._cv_tokens.pop())
+            token, pushed_app = self._cv_tokens.pop()
+            _cv_request.reset(token)
+            if pushed_app:
+                self.app_ctx.pop()
 
+    def reset(
+        self,
+        request: Request | None,
+        session: SessionMixin | None = None,
+    ) -> None:
+        """Prepare the context to be reused for another request.
+
+        The user namespace ``g`` of the owned application context is
+        emptied, so nothing leaks from the previous request.
 
-def _identity[T](o: T) -> T:
-    """Return itself."""
-    return o
+        :param request: Request to hold in, or ``None`` to drop the
+            previous one while the context sits unused.
+        :param session: Simplified fake session, defaults to ``None``.
+        """
+        self.request = request
+        self.session = session
+        vars(self.app_ctx.g).clear()
 
 
 class LocalProxy[T]:
@@ -176,6 +213,12 @@ class LocalProxy[T]:
     and callable behaviour to the underlying object looked up at access
     time.
 
+    The lookup function is specialised when the proxy is created, for
+    either a ``ContextVar`` or a callable and with or without an
+    attribute name, so an access does no type checks of its own.
+    Attribute reads are forwarded from ``__getattribute__`` directly,
+    rather than from ``__getattr__`` after a failed lookup on the proxy.
+
     :param local: The context-local variable carrying the target object
         or a zero-argument callable returning it.
     :param name: Optional attribute (name) to fetch from the target
@@ -194,18 +237,36 @@ class LocalProxy[T]:
         unbound_message: str | None = None,
     ) -> None:
         """Initialise the proxy wrapper."""
-        get_name = _identity if name is None else attrgetter(name)
         if unbound_message is None:
             unbound_message = "object is not bound"
-
-        def _get_current_object() -> T:
-            if isinstance(local, ContextVar):
-                try:
-                    obj = local.get()
-                except LookupError:
-                    raise RuntimeError(unbound_message) from None
-                return get_name(obj)
-            return get_name(local())
+        _get_current_object: t.Callable[[], T]
+        if isinstance(local, ContextVar):
+            get = local.get
+            if name is None:
+
+                def _get_current_object() -> T:
+                    try:
+                        return get()
+                    except LookupError:
+                        raise RuntimeError(unbound_message) from None
+
+            else:
+                get_name = attrgetter(name)
+
+                def _get_current_object() -> T:
+                    try:
+                        obj = get()
+                    except LookupError:
+                        raise RuntimeError(unbound_message) from None
+                    return get_name(obj)
+
+        elif name is None:
+            _get_current_object = local
+        else:
+            get_name = attrgetter(name)
+
+            def _get_current_object() -> T:
+                return get_name(local())
 
         object.__setattr__(self, "_LocalProxy__wrapped", local)
         object.__setattr__(
@@ -215,7 +276,7 @@ class LocalProxy[T]:
     def __repr__(self) -> str:
         """Human-readable representation of the proxy object."""
         try:
-            obj = self._get_current_object()
+            obj = _proxied(self)()
         except RuntimeError:
             return f"<{type(self).__name__} unbound>"
         return repr(obj)
@@ -223,70 +284,73 @@ class LocalProxy[T]:
     def __str__(self) -> str:
         """Delegate string conversion to the proxied object."""
         try:
-            return str(self._get_current_object())
+            return str(_proxied(self)())
         except RuntimeError:
             return repr(self)
 
-    def __getattr__(self, name: str) -> t.Any:
-        """Delegate attribute access to the proxied object."""
+    def __getattribute__(self, name: str) -> t.Any:
+        """Delegate attribute access to the proxied object.
+
+        ``_get_current_object`` is the only name served by the proxy
+        itself and returns the function which looks up the target.
+        """
+        get_current_object = _proxied(self)
         if name == "_get_current_object":
-            return object.__getattribute__(
-                self, "_LocalProxy__get_current_object"
-            )
-        return getattr(self._get_current_object(), name)
+            return get_current_object
+        return getattr(get_current_object(), name)
 
     def __setattr__(self, name: str, value: t.Any) -> None:
         """Delegate attribute setting to the proxied object."""
-        setattr(self._get_current_object(), name, value)
+        setattr(_proxied(self)(), name, value)
 
     def __delattr__(self, name: str) -> None:
         """Delegate attribute deletion to the proxied object."""
-        delattr(self._get_current_object(), name)
+        delattr(_proxied(self)(), name)
 
     def __call__(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
         """Delegate calling to the proxied object."""
-        return self._get_current_object()(*args, **kwargs)
+        return _proxied(self)()(*args, **kwargs)
 
     def __getitem__(self, key: t.Any) -> t.Any:
         """Delegate item access to the proxied object."""
-        return self._get_current_object()[key]
+        return _proxied(self)()[key]
 
     def __setitem__(self, key: t.Any, value: t.Any) -> None:
         """Delegate item assignment to the proxied object."""
-        self._get_current_object()[key] = value
+        _proxied(self)()[key] = value
 
     def __delitem__(self, key: t.Any) -> None:
         """Delegate item deletion to the proxied object."""
-        del self._get_current_object()[key]
+        del _proxied(self)()[key]
 
     def __iter__(self) -> t.Iterator[t.Any]:
         """Delegate iteration to the proxied object."""
-        return iter(self._get_current_object())
+        return iter(_proxied(self)())
 
     def __len__(self) -> int:
         """Delegate length queries to the proxied object."""
-        return len(self._get_current_object())
+        return len(_proxied(self)())
 
     def __bool__(self) -> bool:
         """Delegate truthiness to the proxied object."""
         try:
-            return bool(self._get_current_object())
+            return bool(_proxied(self)())
         except RuntimeError:
             return False
 
     def __eq__(self, other: object) -> bool:
         """Compare equality against the proxied object."""
         try:
-            return self._get_current_object() == other
+            return _proxied(self)() == other
         except RuntimeError:
             return False
 
-    def _get_current_object(self) -> T:
-        """Return the current object this proxy is pointing to."""
-        return object.__getattribute__(
-            self, "_LocalProxy__get_current_object"
-        )()
 
+# Reads the lookup function stored on a proxy straight from its slot,
+# without going through the proxy's ``__getattribute__``.
+_proxied: t.Callable[[LocalProxy[t.Any]], t.Callable[[], t.Any]] = (
+    LocalProxy.__dict__["_LocalProxy__get_current_object"].__get__
+)
 
 _no_app_msg = """\
 Working outside of application context.
@@ -297,9 +361,22 @@ context with app.app_context() before accessing this proxy.
 """
 
 _cv_app: ContextVar[AppContext] = ContextVar("miroslava.app_ctx")
-app_ctx: AppContext = LocalProxy(_cv_app, unbound_message=_no_app_msg)
-current_app: Miroslava = LocalProxy(_cv_app, "app", unbound_message=_no_app_msg)
-g: _AppCtxGlobals = LocalProxy(_cv_app, "g", unbound_message=_no_app_msg)
+
+
+def _find_app_ctx() -> AppContext:
+    """Return the pushed application context or the request's one."""
+    ctx = _cv_app.get(None)
+    if ctx is not None:
+        return ctx
+    request_ctx = _cv_request.get(None)
+    if request_ctx is None:
+        raise RuntimeError(_no_app_msg)
+    return request_ctx.app_ctx
+
+
+app_ctx: AppContext = LocalProxy(_find_app_ctx)
+current_app: Miroslava = LocalProxy(_find_app_ctx, "app")
+g: _AppCtxGlobals = LocalProxy(_find_app_ctx, "g")
 
 _no_req_msg = """\
 Working outside of request context.
@@ -319,3 +396,37 @@ request: Request = LocalProxy(
 session: SessionMixin = LocalProxy(
     _cv_request, "session", unbound_message=_no_req_msg
 )
+
+
+def get_current_app() -> Miroslava:
+    """Return the application handling the current context.
+
+    This is the object ``current_app`` points to, fetched without going
+    through the proxy. Prefer it on hot paths that read the application
+    many times per request.
+
+    :raises RuntimeError: When no application context is active.
+    """
+    return _find_app_ctx().app
+
+
+def get_current_request() -> Request:
+    """Return the request being handled in the current context.
+
+    This is the object ``request`` points to, fetched without going
+    through the proxy. Prefer it in views that read the request many
+    times per call.
+
+    .. code-block:: python
+
+        @app.route("/search")
+        def search():
+            req = get_current_request()
+            return {"q": req.args.get("q"), "page": req.args.get("page")}
+
+    :raises RuntimeError: When no request context is active.
+    """
+    try:
+        return _cv_request.get().request
+    except LookupError:
+        raise RuntimeError(_no_req_msg) from None
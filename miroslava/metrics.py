@@ -0,0 +1,324 @@
+"""\
+Miroslava's Metrics
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module collects request metrics for the development server.
+
+For every endpoint it keeps a latency histogram over fixed log-scale
+buckets, counts of responses by status code, and the bytes received
+and sent. An in-flight gauge tracks the requests being handled at any
+moment. Everything is stored in preallocated lists and small integer
+keyed dictionaries, so recording a request allocates nothing once an
+endpoint and status code have been seen.
+
+Updates are guarded by a single lock, which keeps the counters exact
+under the threaded server. The collected numbers can be rendered in
+the Prometheus text exposition format, which the application serves
+from ``METRICS_ENDPOINT`` when it is configured.
+
+With ``PHASE_TIMING`` enabled, a ``PhaseTimer`` additionally splits
+each request into parse, route, view, serialise, and send phases. The
+durations are added up per endpoint and reported in the
+``Server-Timing`` response header.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from bisect import bisect_left
+from collections import deque
+
+#: Upper bounds of the latency buckets in nanoseconds, on a 1-2.5-5
+#: scale from 100 microseconds to 60 seconds. Observations above the
+#: last bound fall into an implicit ``+Inf`` bucket.
+LATENCY_BUCKETS: t.Final[tuple[int, ...]] = (
+    *(int(base * 10**power) for power in range(5, 10) for base in (1, 2.5, 5)),
+    10_000_000_000,
+    30_000_000_000,
+    60_000_000_000,
+)
+
+#: Phases a request is split into by the server when timed.
+PHASES: t.Final[tuple[str, ...]] = (
+    "parse",
+    "route",
+    "view",
+    "serialise",
+    "send",
+)
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for a single endpoint.
+
+    :param name: Name of the endpoint.
+    """
+
+    __slots__ = (
+        "buckets",
+        "bytes_received",
+        "bytes_sent",
+        "count",
+        "name",
+        "phases",
+        "statuses",
+        "total_ns",
+    )
+
+    def __init__(self, name: str) -> None:
+        """Initialise empty metrics for an endpoint."""
+        self.name = name
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.statuses: dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.phases: dict[str, list[int]] = {}
+
+
+class PhaseTimer:
+    """Measure how long each phase of a request takes.
+
+    The timer starts when it is created and every call to ``mark``
+    closes the current phase, so phases are contiguous and add up to
+    the time spent handling the request. Timestamps come from
+    ``time.perf_counter_ns``; ``wall_start_ns`` anchors them to the
+    wall clock for exporting spans to a tracing system.
+    """
+
+    __slots__ = ("_last", "spans", "start_ns", "wall_start_ns")
+
+    def __init__(self) -> None:
+        """Start timing."""
+        self.wall_start_ns = time.time_ns()
+        self.start_ns = self._last = time.perf_counter_ns()
+        self.spans: list[tuple[str, int, int]] = []
+
+    def mark(self, phase: str) -> None:
+        """End the current phase and start the next one.
+
+        :param phase: Name of the phase that just ended.
+        """
+        now = time.perf_counter_ns()
+        self.spans.append((phase, self._last, now))
+        self._last = now
+
+    def durations(self) -> dict[str, int]:
+        """Return the duration of each phase in nanoseconds."""
+        return {name: end - start for name, start, end in self.spans}
+
+    def server_timing(self) -> str:
+        """Return the phases as a ``Server-Timing`` header value."""
+        return ", ".join(
+            f"{name};dur={(end - start) / 1e6:.3f}"
+            for name, start, end in self.spans
+        )
+
+
+class Metrics:
+    """Thread-safe registry of request metrics for an application.
+
+    A request takes the registry's lock once, when it finishes.
+    Starting a request only appends to a ``deque``, which is atomic,
+    and the request is removed from it under the lock when it is
+    recorded, so ``in_flight`` is the length of the ``deque``.
+
+    .. code-block:: python
+
+        metrics.request_started()
+        ...
+        metrics.request_finished("index", 200, duration_ns, 512, 2048)
+    """
+
+    #: Endpoint name used for requests which matched no URL rule.
+    unmatched: t.ClassVar[str] = "<unmatched>"
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self._active: deque[None] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests being handled."""
+        return len(self._active)
+
+    def request_started(self) -> None:
+        """Record that a request has started being handled."""
+        self._active.append(None)
+
+    def request_finished(
+        self,
+        endpoint: str | None,
+        status: int,
+        duration_ns: int,
+        bytes_received: int = 0,
+        bytes_sent: int = 0,
+    ) -> None:
+        """Record a handled request.
+
+        :param endpoint: Endpoint which handled the request, or
+            ``None`` if no URL rule matched.
+        :param status: Status code of the response.
+        :param duration_ns: Time taken to handle the request, in
+            nanoseconds.
+        :param bytes_received: Size of the request head and body,
+            defaults to ``0``.
+        :param bytes_sent: Size of the response written to the client,
+            defaults to ``0``.
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, duration_ns)
+        if endpoint is None:
+            endpoint = self.unmatched
+        lock = self._lock
+        lock.acquire()
+        try:
+            if self._active:
+                self._active.pop()
+            metrics = self.endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self.endpoints[endpoint] = EndpointMetrics(endpoint)
+            metrics.buckets[bucket] += 1
+            metrics.count += 1
+            metrics.total_ns += duration_ns
+            metrics.bytes_received += bytes_received
+            metrics.bytes_sent += bytes_sent
+            statuses = metrics.statuses
+            statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            lock.release()
+
+    def record_phases(self, endpoint: str | None, timer: PhaseTimer) -> None:
+        """Add the phase durations of a request to its endpoint.
+
+        :param endpoint: Endpoint which handled the request, or
+            ``None`` if no URL rule matched.
+        :param timer: Timer of the finished request.
+        """
+        if endpoint is None:
+            endpoint = self.unmatched
+        lock = self._lock
+        lock.acquire()
+        try:
+            metrics = self.endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self.endpoints[endpoint] = EndpointMetrics(endpoint)
+            phases = metrics.phases
+            for name, start, end in timer.spans:
+                phase = phases.get(name)
+                if phase is None:
+                    phase = phases[name] = [0, 0]
+                phase[0] += end - start
+                phase[1] += 1
+        finally:
+            lock.release()
+
+    def phase_breakdown(self) -> dict[str, dict[str, float]]:
+        """Return the mean duration of each phase per endpoint in ms."""
+        with self._lock:
+            return {
+                metrics.name: {
+                    name: total / count / 1e6
+                    for name, (total, count) in metrics.phases.items()
+                }
+                for metrics in self.endpoints.values()
+                if metrics.phases
+            }
+
+    def render_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            in_flight = self.in_flight
+            endpoints = [
+                (
+                    metrics.name,
+                    list(metrics.buckets),
+                    metrics.count,
+                    metrics.total_ns,
+                    dict(metrics.statuses),
+                    metrics.bytes_received,
+                    metrics.bytes_sent,
+                    {
+                        name: tuple(phase)
+                        for name, phase in metrics.phases.items()
+                    },
+                )
+                for metrics in self.endpoints.values()
+            ]
+        bounds = [f"{bound / 1e9:g}" for bound in LATENCY_BUCKETS]
+        bounds.append("+Inf")
+        name = "miroslava_request_duration_seconds"
+        latency = [
+            f"# HELP {name} Time taken to handle a request.",
+            f"# TYPE {name} histogram",
+        ]
+        requests = [
+            "# HELP miroslava_requests_total Requests handled.",
+            "# TYPE miroslava_requests_total counter",
+        ]
+        received = [
+            "# HELP miroslava_request_bytes_total Bytes received.",
+            "# TYPE miroslava_request_bytes_total counter",
+        ]
+        sent = [
+            "# HELP miroslava_response_bytes_total Bytes sent.",
+            "# TYPE miroslava_response_bytes_total counter",
+        ]
+        phase = "miroslava_request_phase_seconds"
+        phases = [
+            f"# HELP {phase} Time spent in each phase of a request.",
+            f"# TYPE {phase} summary",
+        ]
+        for (
+            endpoint,
+            buckets,
+            count,
+            total,
+            statuses,
+            inb,
+            outb,
+            phase_totals,
+        ) in endpoints:
+            label = f'endpoint="{_escape_label(endpoint)}"'
+            cumulative = 0
+            for bound, observations in zip(bounds, buckets, strict=True):
+                cumulative += observations
+                latency.append(
+                    f'{name}_bucket{{{label},le="{bound}"}} {cumulative}'
+                )
+            latency.append(f"{name}_sum{{{label}}} {total / 1e9:.9f}")
+            latency.append(f"{name}_count{{{label}}} {count}")
+            for status, value in sorted(statuses.items()):
+                requests.append(
+                    f'miroslava_requests_total{{{label},status="{status}"}} '
+                    f"{value}"
+                )
+            received.append(f"miroslava_request_bytes_total{{{label}}} {inb}")
+            sent.append(f"miroslava_response_bytes_total{{{label}}} {outb}")
+            for phase_name, (value, timed) in phase_totals.items():
+                labels = f'{label},phase="{phase_name}"'
+                phases.append(f"{phase}_sum{{{labels}}} {value / 1e9:.9f}")
+                phases.append(f"{phase}_count{{{labels}}} {timed}")
+        gauge = [
+            "# HELP miroslava_requests_in_flight Requests being handled.",
+            "# TYPE miroslava_requests_in_flight gauge",
+            f"miroslava_requests_in_flight {in_flight}",
+        ]
+        if len(phases) == 2:
+            phases.clear()
+        return "\n".join(
+            [*latency, *requests, *received, *sent, *phases, *gauge, ""]
+        )
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
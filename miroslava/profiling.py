@@ -0,0 +1,459 @@
+"""\
+Miroslava's Profiling
+=====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides on-demand CPU and memory profiling for the
+development server.
+
+The ``StackSampler`` runs a background thread which periodically reads
+``sys._current_frames`` and records the stack of every thread that is
+currently handling a request. Samples are keyed by endpoint and kept as
+collapsed stacks, the plain text format understood by ``flamegraph.pl``,
+speedscope, and most other flame graph viewers. As the sampler only
+reads frames from its own thread, the request threads pay for a single
+dictionary update when a request starts and ends.
+
+The ``RequestProfiler`` runs one in every ``N`` calls to a chosen
+endpoint under ``cProfile`` and merges the results into a single
+``pstats`` report, for the cases where exact call counts matter more
+than the shape of the stacks.
+
+The ``AllocationProfiler`` takes ``tracemalloc`` snapshots around
+sampled calls to selected endpoints and reports the allocation sites
+and the net bytes retained by each of them, to track memory growth
+down to the view responsible for it.
+
+All of them are started by the application when ``PROFILING_ENABLED``
+is set and the app runs in debug mode, and their output is served from
+``PROFILING_ENDPOINT``.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import itertools
+import os
+import pstats
+import signal
+import sys
+import threading
+import tracemalloc
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import CodeType
+    from types import FrameType
+
+    from miroslava.wrappers import Request
+
+type ViewCallable = t.Callable[..., t.Any]
+
+
+class StackSampler:
+    """Sample the stacks of threads which are handling requests.
+
+    .. code-block:: python
+
+        sampler = StackSampler(interval=0.005)
+        sampler.start()
+        ...
+        open("profile.collapsed", "w").write(sampler.collapsed())
+
+    :param interval: Seconds between two samples, defaults to ``0.005``.
+    :param max_depth: Maximum number of frames kept per stack, counted
+        from the innermost frame, defaults to ``128``.
+    """
+
+    #: Endpoint name used for requests which matched no URL rule.
+    unmatched: t.ClassVar[str] = "<unmatched>"
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128) -> None:
+        """Initialise a stopped sampler."""
+        self.interval = interval
+        self.max_depth = max_depth
+        self.requests: dict[int, Request] = {}
+        self.samples = 0
+        self._counts: dict[tuple[str, ...], int] = {}
+        self._labels: dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return ``True`` if the sampling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="miroslava-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def track(self, request: Request) -> None:
+        """Sample the current thread while it handles a request.
+
+        :param request: Request being handled by the current thread.
+        """
+        self.requests[threading.get_ident()] = request
+
+    def untrack(self) -> None:
+        """Stop sampling the current thread."""
+        self.requests.pop(threading.get_ident(), None)
+
+    def _run(self) -> None:
+        """Take samples until the sampler is stopped."""
+        interval = self.interval
+        while not self._stopped.wait(interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every tracked thread."""
+        if not self.requests:
+            return
+        frames = sys._current_frames()
+        stacks = []
+        for ident, request in list(self.requests.items()):
+            frame = frames.get(ident)
+            if frame is not None:
+                stacks.append(
+                    (request.endpoint or self.unmatched, *self._walk(frame))
+                )
+        lock = self._lock
+        lock.acquire()
+        try:
+            counts = self._counts
+            for stack in stacks:
+                counts[stack] = counts.get(stack, 0) + 1
+            self.samples += 1
+        finally:
+            lock.release()
+
+    def _walk(self, frame: FrameType | None) -> list[str]:
+        """Return the labels of a stack, outermost frame first."""
+        labels = self._labels
+        stack = []
+        depth = self.max_depth
+        while frame is not None and depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = (
+                    f"{code.co_qualname} "
+                    f"({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+            stack.append(label)
+            frame = frame.f_back
+            depth -= 1
+        stack.reverse()
+        return stack
+
+    def collapsed(self, endpoint: str | None = None) -> str:
+        """Return the samples as collapsed stacks.
+
+        Each line holds the frames of a stack joined by semicolons,
+        rooted at the endpoint, followed by the number of samples in
+        which it was seen.
+
+        :param endpoint: Only include samples of this endpoint,
+            defaults to ``None``.
+        """
+        with self._lock:
+            counts = list(self._counts.items())
+        return "".join(
+            f"{';'.join(stack)} {count}\n"
+            for stack, count in sorted(counts)
+            if endpoint is None or stack[0] == endpoint
+        )
+
+    def clear(self) -> None:
+        """Discard the samples taken so far."""
+        with self._lock:
+            self._counts.clear()
+            self.samples = 0
+
+
+class RequestProfiler:
+    """Profile one in every ``every`` calls to an endpoint's view.
+
+    Only one request is profiled at a time. Calls which are due while
+    another one is being profiled run without the profiler. Since
+    Python 3.12, ``cProfile`` observes every thread, so work done by
+    other threads while a request is profiled shows up in the report
+    as well.
+
+    :param endpoint: Endpoint whose view should be profiled.
+    :param every: Profile one call out of this many, defaults to
+        ``100``.
+    """
+
+    def __init__(self, endpoint: str, every: int = 100) -> None:
+        """Initialise an empty profile."""
+        self.endpoint = endpoint
+        self.every = max(1, every)
+        self.profiled = 0
+        self.stats: pstats.Stats | None = None
+        self._calls = itertools.count()
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+
+    def wrap(self, view_func: ViewCallable) -> ViewCallable:
+        """Return the view wrapped so it is profiled when sampled.
+
+        :param view_func: View, or view chain, of the endpoint.
+        """
+        calls = self._calls
+        every = self.every
+        active = self._active
+
+        @functools.wraps(view_func)
+        def profiled(**kwargs: t.Any) -> t.Any:
+            if next(calls) % every or not active.acquire(blocking=False):
+                return view_func(**kwargs)
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(view_func, **kwargs)
+            finally:
+                active.release()
+                self.add(profile)
+
+        return profiled
+
+    def add(self, profile: cProfile.Profile) -> None:
+        """Merge a finished profile into the report.
+
+        :param profile: Profile of a single request.
+        """
+        with self._lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)
+            else:
+                self.stats.add(profile)
+            self.profiled += 1
+
+    def report(self, sort: str = "cumulative", limit: int = 50) -> str:
+        """Return the merged profile as ``pstats`` text.
+
+        :param sort: Key to sort the functions by, defaults to
+            ``cumulative``.
+        :param limit: Number of functions to list, defaults to ``50``.
+        """
+        stream = io.StringIO()
+        with self._lock:
+            if self.stats is None:
+                return f"No calls to {self.endpoint!r} profiled yet.\n"
+            self.stats.stream = stream
+            self.stats.sort_stats(sort).print_stats(limit)
+        return (
+            f"{self.profiled} calls to {self.endpoint!r} profiled.\n"
+            f"{stream.getvalue()}"
+        )
+
+    def clear(self) -> None:
+        """Discard the profiles collected so far."""
+        with self._lock:
+            self.stats = None
+            self.profiled = 0
+
+
+class AllocationProfiler:
+    """Attribute memory allocations to endpoints with ``tracemalloc``.
+
+    One in every ``every`` calls to each selected endpoint is wrapped
+    in a pair of ``tracemalloc`` snapshots. The difference between the
+    two is grouped by allocation site and added up per endpoint, along
+    with the net number of bytes still held when the view returned.
+    Memory held by the response counts as retained, since the response
+    is alive when the second snapshot is taken.
+
+    Snapshots cover the whole process, so allocations made by other
+    threads during a sampled request are attributed to it as well. One
+    request is sampled at a time to keep such overlaps rare.
+
+    .. code-block:: python
+
+        profiler = AllocationProfiler(["upload"], every=10)
+        profiler.start()
+        ...
+        print(profiler.report())
+
+    :param endpoints: Endpoints whose views should be sampled, or the
+        name of a single endpoint.
+    :param every: Sample one call out of this many per endpoint,
+        defaults to ``10``.
+    :param limit: Number of allocation sites listed per endpoint in
+        the report, defaults to ``10``.
+    :param nframes: Frames stored per allocation by ``tracemalloc``,
+        defaults to ``1``.
+    """
+
+    def __init__(
+        self,
+        endpoints: str | Iterable[str],
+        every: int = 10,
+        limit: int = 10,
+        nframes: int = 1,
+    ) -> None:
+        """Initialise empty allocation statistics."""
+        if isinstance(endpoints, str):
+            endpoints = (endpoints,)
+        self.endpoints = frozenset(endpoints)
+        self.every = max(1, every)
+        self.limit = limit
+        self.nframes = nframes
+        self.sites: dict[str, dict[tuple[str, int], list[int]]] = {}
+        self.retained: dict[str, list[int]] = {}
+        self._filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+        self._started = False
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start tracing allocations, unless tracing already."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations if this profiler started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def wrap(self, endpoint: str, view_func: ViewCallable) -> ViewCallable:
+        """Return the view wrapped so sampled calls are traced.
+
+        :param endpoint: Endpoint of the view.
+        :param view_func: View, or view chain, of the endpoint.
+        """
+        calls = itertools.count()
+        every = self.every
+        active = self._active
+
+        @functools.wraps(view_func)
+        def traced(**kwargs: t.Any) -> t.Any:
+            if next(calls) % every or not active.acquire(blocking=False):
+                return view_func(**kwargs)
+            try:
+                before = tracemalloc.take_snapshot()
+                try:
+                    return view_func(**kwargs)
+                finally:
+                    self.add(endpoint, before, tracemalloc.take_snapshot())
+            finally:
+                active.release()
+
+        return traced
+
+    def add(
+        self,
+        endpoint: str,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> None:
+        """Add the allocations made between two snapshots.
+
+        :param endpoint: Endpoint which handled the request.
+        :param before: Snapshot taken before the view was called.
+        :param after: Snapshot taken after the view returned.
+        """
+        filters = self._filters
+        stats = after.filter_traces(filters).compare_to(
+            before.filter_traces(filters), "lineno"
+        )
+        with self._lock:
+            sites = self.sites.setdefault(endpoint, {})
+            retained = self.retained.setdefault(endpoint, [0, 0])
+            for stat in stats:
+                if not stat.size_diff and not stat.count_diff:
+                    continue
+                frame = stat.traceback[0]
+                site = sites.get((frame.filename, frame.lineno))
+                if site is None:
+                    site = sites[frame.filename, frame.lineno] = [0, 0]
+                site[0] += stat.size_diff
+                site[1] += stat.count_diff
+                retained[0] += stat.size_diff
+            retained[1] += 1
+
+    def report(self, endpoint: str | None = None) -> str:
+        """Return the top allocation sites of each endpoint as text.
+
+        Sites are ordered by the number of bytes they retained across
+        all sampled requests.
+
+        :param endpoint: Only report this endpoint, defaults to
+            ``None``.
+        """
+        lines = []
+        with self._lock:
+            for name, (size, samples) in sorted(self.retained.items()):
+                if endpoint is not None and name != endpoint:
+                    continue
+                lines.append(
+                    f"{name}: {samples} requests sampled, {size:+,} bytes "
+                    f"retained, {size / samples:+,.0f} per request"
+                )
+                sites = sorted(
+                    self.sites[name].items(),
+                    key=lambda item: abs(item[1][0]),
+                    reverse=True,
+                )
+                for (filename, lineno), (diff, count) in sites[: self.limit]:
+                    lines.append(
+                        f"  {diff:>+14,} B {count:>+9,} blocks  "
+                        f"{filename}:{lineno}"
+                    )
+                lines.append("")
+        if not lines:
+            return "No requests sampled yet.\n"
+        return "\n".join(lines)
+
+    def dump_on_signal(
+        self, signum: int, stream: t.TextIO | None = None
+    ) -> None:
+        """Write the report whenever the process receives a signal.
+
+        Must be called from the main thread.
+
+        .. code-block:: python
+
+            profiler.dump_on_signal(signal.SIGUSR1)
+
+        :param signum: Signal which triggers the dump.
+        :param stream: Stream to write to, defaults to ``None`` which
+            uses ``sys.stderr``.
+        """
+
+        def dump(_signum: int, _frame: FrameType | None) -> None:
+            (stream or sys.stderr).write(self.report())
+
+        signal.signal(signum, dump)
+
+    def clear(self) -> None:
+        """Discard the statistics collected so far."""
+        with self._lock:
+            self.sites.clear()
+            self.retained.clear()
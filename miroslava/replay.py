@@ -0,0 +1,382 @@
+"""\
+Miroslava's Traffic Replay
+==========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module records real traffic and plays it back, so changes to the
+framework can be measured against the actual request mix of an app,
+with its header sizes and path distribution, rather than against
+synthetic load.
+
+The ``TrafficRecorder`` appends the raw bytes of requests to a file,
+together with the time they arrived. It is enabled by setting
+``TRAFFIC_RECORD_FILE``, records one in every ``TRAFFIC_RECORD_EVERY``
+requests, and stops once the file reaches ``TRAFFIC_RECORD_MAX_BYTES``.
+Multipart uploads, which are streamed rather than read into memory,
+are not recorded.
+
+The file starts with a short magic string followed by one record per
+request: an 8-byte arrival time in nanoseconds and a 4-byte length,
+both big-endian, and then the request itself. Records are only ever
+appended, so a file can be recorded across several runs. Arrival times
+come from a monotonic clock, and each run carries on from the last
+arrival in the file, so the time between two runs is not replayed.
+
+The ``TrafficReplayer`` sends the recorded requests again, at their
+original pace or faster, either to a server over loopback or straight
+to an app's dispatcher in-process::
+
+    python -m miroslava.replay traffic.bin --url http://127.0.0.1:9001
+    python -m miroslava.replay traffic.bin --app myapp:app --speed 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from miroslava.bench import Results
+from miroslava.bench import read_response
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+    from miroslava.app import Miroslava
+
+#: Bytes every recording starts with.
+MAGIC: t.Final[bytes] = b"MIROSLAVA-TRAFFIC-1\n"
+RECORD_HEADER: t.Final[struct.Struct] = struct.Struct(">QI")
+
+
+class TrafficRecorder:
+    """Append sampled requests to a recording.
+
+    .. code-block:: python
+
+        recorder = TrafficRecorder("traffic.bin", every=10)
+        recorder.record(head, body)
+
+    :param filename: File to append the requests to.
+    :param every: Record one request out of this many, defaults to
+        ``1``.
+    :param max_bytes: Stop recording once the file reaches this size,
+        defaults to 64 MiB.
+    :param max_request_size: Skip requests larger than this many bytes,
+        defaults to 1 MiB.
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        every: int = 1,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_request_size: int = 1024 * 1024,
+    ) -> None:
+        """Open the recording for appending.
+
+        A record cut short at the end of an existing recording is
+        dropped, so new records are not appended after it.
+
+        :raises ValueError: If the file exists but is not a recording.
+        """
+        self.filename = filename
+        self.every = max(1, every)
+        self.max_bytes = max_bytes
+        self.max_request_size = max_request_size
+        self.recorded = 0
+        self._seen = 0
+        self._lock = threading.Lock()
+        # The recording stays open across requests until ``close`` is
+        # called, so it cannot be opened in a ``with`` block.
+        f = open(filename, "a+b")  # noqa: SIM115
+        last = 0
+        if f.seek(0, os.SEEK_END) == 0:
+            f.write(MAGIC)
+        else:
+            f.seek(0)
+            try:
+                end, last = scan_records(f)
+            except ValueError:
+                f.close()
+                raise
+            f.truncate(end)
+        self._file: t.BinaryIO | None = f
+        self.size = f.seek(0, os.SEEK_END)
+        self._offset = last - time.monotonic_ns()
+
+    @property
+    def full(self) -> bool:
+        """Return ``True`` once nothing more will be recorded."""
+        return self._file is None
+
+    def record(self, head: bytes, body: bytes = b"") -> bool:
+        """Record a request if it is sampled and fits in the file.
+
+        Returns ``True`` if the request was recorded.
+
+        :param head: Request line and headers, without the blank line
+            which ends them.
+        :param body: Body of the request, defaults to ``b""``.
+        """
+        size = len(head) + 4 + len(body)
+        if size > self.max_request_size:
+            return False
+        arrived = time.monotonic_ns() + self._offset
+        lock = self._lock
+        lock.acquire()
+        try:
+            f = self._file
+            self._seen += 1
+            if f is None or (self._seen - 1) % self.every:
+                return False
+            if self.size + RECORD_HEADER.size + size > self.max_bytes:
+                self.close()
+                return False
+            f.write(RECORD_HEADER.pack(arrived, size))
+            f.write(head)
+            f.write(b"\r\n\r\n")
+            f.write(body)
+            f.flush()
+            self.size += RECORD_HEADER.size + size
+            self.recorded += 1
+            return True
+        finally:
+            lock.release()
+
+    def close(self) -> None:
+        """Close the recording."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def scan_records(f: t.BinaryIO) -> tuple[int, int]:
+    """Return where the last complete record ends and when it arrived.
+
+    The arrival time is ``0`` if the recording holds no records.
+
+    :param f: Recording opened for reading, positioned at its start.
+    :raises ValueError: If the file is not a recording.
+    """
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{f.name} is not a traffic recording")
+    total = os.fstat(f.fileno()).st_size
+    end = f.tell()
+    last = 0
+    while True:
+        header = f.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return end, last
+        arrived, size = RECORD_HEADER.unpack(header)
+        if end + RECORD_HEADER.size + size > total:
+            return end, last
+        end = f.seek(size, os.SEEK_CUR)
+        last = arrived
+
+
+def read_records(
+    filename: str | os.PathLike[str],
+) -> Iterator[tuple[int, bytes]]:
+    """Yield the arrival time in ns and raw bytes of recorded requests.
+
+    A record cut short, for example by a crash while writing it, ends
+    the recording.
+
+    :param filename: Recording to read.
+    :raises ValueError: If the file is not a recording.
+    """
+    with open(filename, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{filename} is not a traffic recording")
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            arrived, size = RECORD_HEADER.unpack(header)
+            data = f.read(size)
+            if len(data) < size:
+                return
+            yield arrived, data
+
+
+class TrafficReplayer:
+    """Send recorded requests again, keeping their relative timing.
+
+    Requests are due at the offset they arrived at in the recording,
+    divided by ``speed``, and are sent by a pool of threads so a slow
+    response does not hold up the requests after it. Latencies are
+    reported both from when a request was sent and from when it was
+    due, as in ``miroslava.bench``.
+
+    :param filename: Recording to replay.
+    :param speed: How many times faster than recorded to replay, or
+        ``0`` to send every request as soon as a thread is free,
+        defaults to ``1.0``.
+    :param concurrency: Requests in flight at most, defaults to
+        ``32``.
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        speed: float = 1.0,
+        concurrency: int = 32,
+    ) -> None:
+        """Load the recording."""
+        self.records = list(read_records(filename))
+        self.speed = speed
+        self.concurrency = concurrency
+
+    def replay_to(self, url: str, timeout: float = 10.0) -> Results:
+        """Replay the requests to a server.
+
+        Every request is sent over a new connection.
+
+        :param url: URL of the server, only its host and port are used.
+        :param timeout: Seconds to wait on a socket, defaults to
+            ``10.0``.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Only http:// URLs are supported, not {url!r}")
+        address = (parts.hostname, parts.port or 80)
+
+        def send(raw: bytes) -> int:
+            with socket.create_connection(address, timeout) as sock:
+                sock.sendall(raw)
+                return read_response(sock, bytearray())[0]
+
+        return self.replay(send)
+
+    def replay_app(self, app: Miroslava) -> Results:
+        """Replay the requests to an app's dispatcher in-process.
+
+        Requests go through ``make_environ`` and are dispatched by the
+        app's ``test_client``, so streamed response bodies are consumed
+        but nothing is sent over a socket.
+
+        :param app: Application to dispatch the requests to.
+        """
+        client = app.test_client(use_cookies=False)
+
+        def send(raw: bytes) -> int:
+            head, _, body = raw.partition(b"\r\n\r\n")
+            environ = app.make_environ(head)
+            environ["miroslava.request_body"] = body
+            return client.dispatch(environ).status_code
+
+        return self.replay(send)
+
+    def replay(self, send: t.Callable[[bytes], int]) -> Results:
+        """Replay the requests with a function which sends one.
+
+        :param send: Function sending raw request bytes and returning
+            the status code of the response.
+        """
+        latencies: list[int] = []
+        service: list[int] = []
+        statuses: dict[int, int] = {}
+        errors = 0
+        lock = threading.Lock()
+
+        def run(raw: bytes, due: int) -> None:
+            nonlocal errors
+            sent = time.perf_counter_ns()
+            try:
+                status = send(raw)
+            except Exception:
+                with lock:
+                    errors += 1
+                return
+            done = time.perf_counter_ns()
+            with lock:
+                latencies.append(done - due)
+                service.append(done - sent)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        records = self.records
+        first = records[0][0] if records else 0
+        slots = threading.BoundedSemaphore(self.concurrency)
+        start = time.perf_counter_ns()
+        with ThreadPoolExecutor(self.concurrency) as pool:
+            for arrived, raw in records:
+                due = start
+                if self.speed:
+                    due += int((arrived - first) / self.speed)
+                    now = time.perf_counter_ns()
+                    if due > now:
+                        time.sleep((due - now) / 1e9)
+                slots.acquire()
+                if not self.speed:
+                    due = time.perf_counter_ns()
+                future = pool.submit(run, raw, due)
+                future.add_done_callback(lambda _: slots.release())
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        return Results(service, latencies, statuses, errors, elapsed)
+
+
+def load_app(path: str) -> Miroslava:
+    """Import an app from a ``module:attribute`` path.
+
+    :param path: Module and attribute of the app, separated by a colon.
+    """
+    module, _, name = path.partition(":")
+    return getattr(importlib.import_module(module), name or "app")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Replay a recording from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m miroslava.replay",
+        description="Replay recorded traffic against a server or an app.",
+    )
+    parser.add_argument("recording", help="file written by TrafficRecorder")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("-u", "--url", help="server to send requests to")
+    target.add_argument("-a", "--app", help="app to dispatch to, module:app")
+    parser.add_argument(
+        "-s",
+        "--speed",
+        type=float,
+        default=1.0,
+        help="times faster than recorded, 0 for as fast as possible",
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=32, help="requests in flight"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as JSON"
+    )
+    args = parser.parse_args(argv)
+    try:
+        replayer = TrafficReplayer(args.recording, args.speed, args.concurrency)
+        if args.url:
+            results = replayer.replay_to(args.url)
+        else:
+            sys.path.insert(0, os.getcwd())
+            results = replayer.replay_app(load_app(args.app))
+    except (OSError, ValueError, ImportError, AttributeError) as err:
+        parser.error(str(err))
+    if args.json:
+        print(json.dumps(results.summary(), indent=2))
+    else:
+        print(results.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""\
+Miroslava's Serving Helpers
+===========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module holds the low-level pieces used by the development server
+to put a ``Response`` on the wire.
+
+Everything that does not change between responses is encoded once.
+Status lines for every known status are prepared at import time, and
+the ``Date`` and ``Server`` headers are rendered at most once per
+second and shared by all the responses sent within it. The response
+head and the body chunks are then handed to the kernel together with
+``socket.sendmsg``, so the body is never copied just to prepend the
+headers. Streamed responses use chunked transfer encoding, writing each
+chunk as soon as it is produced.
+"""
+
+from __future__ import annotations
+
+import platform
+import time
+import typing as t
+from email.utils import formatdate
+from http import HTTPStatus
+
+from miroslava.wrappers import HTTP_STATUS_CODES
+
+if t.TYPE_CHECKING:
+    import socket
+    from collections.abc import Iterable
+
+    from miroslava.wrappers import Response
+
+SERVER_SOFTWARE: t.Final[str] = f"Miroslava Python/{platform.python_version()}"
+SERVER_HEADER: t.Final[bytes] = f"Server: {SERVER_SOFTWARE}\r\n".encode(
+    "latin-1"
+)
+IOV_MAX: t.Final[int] = 1024
+
+STATUS_LINES: dict[str, bytes] = {
+    f"{status.value} {status.phrase}": (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n".encode("latin-1")
+    )
+    for status in HTTPStatus
+}
+STATUS_LINES.update(
+    {
+        f"{code} {phrase}": f"HTTP/1.1 {code} {phrase}\r\n".encode("latin-1")
+        for code, phrase in HTTP_STATUS_CODES.items()
+    }
+)
+
+_date_block: tuple[int, bytes, bytes] = (0, b"", b"")
+
+
+def get_status_line(status: str) -> bytes:
+    """Return the encoded status line for a status string.
+
+    :param status: Status as stored on the response, for example
+        ``200 OK``.
+    """
+    line = STATUS_LINES.get(status)
+    if line is None:
+        line = f"HTTP/1.1 {status}\r\n".encode("latin-1")
+    return line
+
+
+def get_date_block(server: bool = True) -> bytes:
+    """Return the encoded ``Date`` and ``Server`` header lines.
+
+    The block is rebuilt at most once per second. Concurrent callers
+    may occasionally both rebuild it, which is harmless since they
+    produce the same bytes.
+
+    :param server: Include the ``Server`` line, defaults to ``True``.
+    """
+    global _date_block
+    now = int(time.time())
+    second, date, block = _date_block
+    if second != now:
+        date = f"Date: {formatdate(now, usegmt=True)}\r\n".encode("latin-1")
+        block = date + SERVER_HEADER
+        _date_block = (now, date, block)
+    return block if server else date
+
+
+def serialise_head(response: Response, content_length: int | None) -> bytes:
+    """Return the status line and headers of a response as bytes.
+
+    ``Content-Length`` is always written from ``content_length``, the
+    size of the body actually sent, replacing any value set on the
+    response, so a stale header cannot break the framing of the
+    connection. When ``content_length`` is ``None`` the body is
+    announced as chunked instead and no ``Content-Length`` is written,
+    as the two must not be combined. ``Date`` and ``Server`` are each
+    only added when the view has not set them.
+
+    :param response: The response object to serialise.
+    :param content_length: Size of the body in bytes, or ``None`` for
+        a streamed body.
+    """
+    headers = response.headers
+    if "Content-Length" in headers:
+        wire = headers.to_wire("Content-Length")
+    else:
+        wire = headers.to_wire()
+    parts = [get_status_line(response.status), wire]
+    if "Date" not in headers:
+        parts.append(get_date_block("Server" not in headers))
+    elif "Server" not in headers:
+        parts.append(SERVER_HEADER)
+    if content_length is None:
+        if "Transfer-Encoding" not in headers:
+            parts.append(b"Transfer-Encoding: chunked\r\n")
+    else:
+        parts.append(f"Content-Length: {content_length}\r\n".encode("latin-1"))
+    parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+def send_buffers(sock: socket.socket, buffers: Iterable[bytes]) -> int:
+    """Write several buffers to a socket without concatenating them.
+
+    Uses scatter-gather I/O where the platform supports it, resuming
+    after partial writes, and falls back to one ``sendall`` per buffer
+    elsewhere. Returns the number of bytes written.
+
+    :param sock: Connected socket to write to.
+    :param buffers: Byte buffers to send, in order.
+    """
+    views = [memoryview(buffer).cast("B") for buffer in buffers if buffer]
+    total = sum(view.nbytes for view in views)
+    if not hasattr(sock, "sendmsg"):
+        for view in views:
+            sock.sendall(view)
+        return total
+    index = 0
+    while index < len(views):
+        sent = sock.sendmsg(views[index : index + IOV_MAX])
+        while sent:
+            size = views[index].nbytes
+            if sent >= size:
+                sent -= size
+                index += 1
+            else:
+                views[index] = views[index][sent:]
+                sent = 0
+    return total
+
+
+def send_chunked(
+    sock: socket.socket,
+    head: bytes,
+    chunks: Iterable[bytes],
+) -> int:
+    """Write a head followed by a body in chunked transfer encoding.
+
+    Every chunk is sent as soon as the iterable yields it, so only one
+    chunk is held in memory at a time. Returns the number of bytes
+    written, including the chunk framing.
+
+    :param sock: Connected socket to write to.
+    :param head: Serialised status line and headers.
+    :param chunks: Body chunks, in order.
+    """
+    total = send_buffers(sock, (head,))
+    for chunk in chunks:
+        if chunk:
+            total += send_buffers(
+                sock, (f"{len(chunk):x}\r\n".encode("latin-1"), chunk, b"\r\n")
+            )
+    sock.sendall(b"0\r\n\r\n")
+    return total + 5
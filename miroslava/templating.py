@@ -0,0 +1,656 @@
+"""\
+Miroslava's Templating
+======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module implements a small compiled template engine.
+
+A template is tokenised once and translated into the source of a plain
+Python function which appends literal text and evaluated expressions to
+a list before joining them with ``"".join``. The function is compiled
+with ``exec`` and reused for every render, so rendering costs neither
+I/O nor repeated string searches. A generator variant of the function
+is compiled alongside it for streaming large pages.
+
+The syntax is a tiny subset of Jinja's::
+
+    <h1>{{ title }}</h1>
+    {# comments are dropped #}
+    {% for user in users %}
+      {% if user.active %}<li>{{ user.name }}</li>{% endif %}
+    {% endfor %}
+
+Expressions are Python expressions whose names are looked up in the
+render context. Attribute access falls back to item access, so
+``user.name`` works for both objects and dictionaries. Output is HTML
+escaped when autoescaping is enabled, unless the value provides an
+``__html__`` method or is marked with the ``safe`` filter.
+
+Template names are resolved to files by a ``TemplateLoader``, which
+indexes its search path once, and compiled templates are kept in a
+``TemplateCache``, a bounded LRU keyed by the resolved path.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import html
+import os
+import re
+import threading
+import typing as t
+from collections import OrderedDict
+
+from miroslava.utils import TemplateNotFoundError
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+_missing: t.Final = object()
+_undefined: t.Final[str] = ""
+_token_re: t.Final = re.compile(r"({{.*?}}|{%.*?%}|{#.*?#})", re.DOTALL)
+_safe_re: t.Final = re.compile(r"\|\s*safe\s*$")
+_autoescape_extensions: t.Final = frozenset((".htm", ".html", ".xhtml", ".xml"))
+_builtins: t.Final[dict[str, t.Any]] = {
+    name: getattr(builtins, name)
+    for name in (
+        "abs",
+        "bool",
+        "dict",
+        "enumerate",
+        "float",
+        "int",
+        "len",
+        "list",
+        "max",
+        "min",
+        "range",
+        "reversed",
+        "round",
+        "sorted",
+        "str",
+        "sum",
+        "tuple",
+        "zip",
+    )
+}
+
+
+class TemplateSyntaxError(Exception):
+    """Error raised when a template cannot be compiled.
+
+    :param message: Description of the problem.
+    :param name: Name of the template, defaults to ``None``.
+    :param lineno: Line on which the problem was found, defaults to
+        ``None``.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        name: str | None = None,
+        lineno: int | None = None,
+    ) -> None:
+        """Initialise the error with its location."""
+        location = f"{name or '<template>'}, line {lineno}" if lineno else ""
+        super().__init__(f"{message} ({location})" if location else message)
+        self.name = name
+        self.lineno = lineno
+
+
+class Markup(str):
+    """String which is already safe to insert into HTML."""
+
+    __slots__ = ()
+
+    def __html__(self) -> Markup:
+        """Return itself, as no escaping is needed."""
+        return self
+
+
+def escape(value: t.Any) -> str:
+    """Return ``value`` as a string that is safe to insert into HTML.
+
+    Objects with an ``__html__`` method are trusted to escape
+    themselves; everything else is converted to ``str`` and escaped.
+
+    :param value: Value to escape.
+    """
+    if type(value) is str:
+        return html.escape(value)
+    if hasattr(value, "__html__"):
+        return value.__html__()
+    return html.escape(str(value))
+
+
+def select_autoescape(filename: str | None) -> bool:
+    """Return ``True`` if the template file should be autoescaped.
+
+    :param filename: Name or path of the template file.
+    """
+    if filename is None:
+        return False
+    return os.path.splitext(filename)[1].lower() in _autoescape_extensions
+
+
+def _resolve(context: t.Mapping[str, t.Any], name: str) -> t.Any:
+    """Look up a name in the render context, then in the builtins."""
+    value = context.get(name, _missing)
+    if value is _missing:
+        return _builtins.get(name, _undefined)
+    return value
+
+
+def _getattr(obj: t.Any, attribute: str) -> t.Any:
+    """Return an attribute of an object, falling back to its items."""
+    if type(obj) is dict:
+        value = obj.get(attribute, _missing)
+        if value is not _missing:
+            return value
+    try:
+        return getattr(obj, attribute)
+    except AttributeError:
+        try:
+            return obj[attribute]
+        except (LookupError, TypeError):
+            return _undefined
+
+
+class _Rewriter(ast.NodeTransformer):
+    """Rewrite template expressions to use the compiled locals.
+
+    Every name is renamed to a prefixed local variable, which is bound
+    once from the render context at the top of the compiled function,
+    and attribute reads are routed through ``_getattr``.
+    """
+
+    def __init__(self, names: set[str]) -> None:
+        """Initialise the rewriter with the set of collected names."""
+        self.names = names
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        """Rename a variable to its local counterpart."""
+        self.names.add(node.id)
+        return ast.copy_location(ast.Name(f"l_{node.id}", node.ctx), node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        """Replace attribute reads with a call to ``_getattr``."""
+        self.generic_visit(node)
+        if not isinstance(node.ctx, ast.Load):
+            return node
+        call = ast.Call(
+            func=ast.Name("_getattr", ast.Load()),
+            args=[node.value, ast.Constant(node.attr)],
+            keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+
+class _Compiler:
+    """Translate template source into the source of a Python function.
+
+    :param source: Template source to compile.
+    :param name: Name of the template used in error messages, defaults
+        to ``None``.
+    :param autoescape: If ``True``, escape the output of expressions,
+        defaults to ``False``.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        name: str | None = None,
+        autoescape: bool = False,
+    ) -> None:
+        """Initialise the compiler."""
+        self.source = source
+        self.name = name
+        self.autoescape = autoescape
+        self.names: set[str] = set()
+        self.lines: list[tuple[int, str, bool]] = []
+        self.literal: list[str] = []
+        self.blocks: list[str] = []
+        self.lineno = 1
+
+    def fail(self, message: str) -> t.NoReturn:
+        """Raise a syntax error at the current line."""
+        raise TemplateSyntaxError(message, self.name, self.lineno)
+
+    def write(self, line: str) -> None:
+        """Write a line of code at the current block depth."""
+        self.lines.append((len(self.blocks) + 1, line, False))
+
+    def emit(self, expression: str) -> None:
+        """Write code which outputs the result of an expression."""
+        self.lines.append((len(self.blocks) + 1, expression, True))
+
+    def flush(self) -> None:
+        """Output the literal text collected since the last tag."""
+        text = "".join(self.literal)
+        if text:
+            self.emit(repr(text))
+        self.literal.clear()
+
+    def expression(self, source: str) -> str:
+        """Compile a template expression into Python source."""
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError:
+            self.fail(f"Invalid expression {source.strip()!r}")
+        return ast.unparse(_Rewriter(self.names).visit(tree))
+
+    def output(self, source: str) -> None:
+        """Compile a ``{{ ... }}`` tag."""
+        safe = _safe_re.search(source)
+        if safe:
+            source = source[: safe.start()]
+        code = self.expression(source)
+        if self.autoescape and not safe:
+            self.emit(f"_escape({code})")
+        else:
+            self.emit(f"_str({code})")
+
+    def statement(self, source: str) -> None:
+        """Compile a ``{% ... %}`` tag."""
+        keyword, _, rest = source.strip().partition(" ")
+        if keyword == "for":
+            try:
+                node = ast.parse(f"for {rest}: pass").body[0]
+            except SyntaxError:
+                self.fail(f"Invalid for loop {rest!r}")
+            assert isinstance(node, ast.For)
+            rewriter = _Rewriter(self.names)
+            target = ast.unparse(rewriter.visit(node.target))
+            iterable = ast.unparse(rewriter.visit(node.iter))
+            self.write(f"for {target} in {iterable}:")
+            self.blocks.append("for")
+            self.write("pass")
+        elif keyword == "if":
+            self.write(f"if {self.expression(rest)}:")
+            self.blocks.append("if")
+            self.write("pass")
+        elif keyword in ("elif", "else"):
+            if not self.blocks or self.blocks[-1] != "if":
+                self.fail(f"Unexpected {keyword!r}")
+            self.blocks.pop()
+            if keyword == "elif":
+                self.write(f"elif {self.expression(rest)}:")
+            else:
+                self.write("else:")
+            self.blocks.append("if")
+            self.write("pass")
+        elif keyword in ("endfor", "endif"):
+            if not self.blocks or self.blocks[-1] != keyword[3:]:
+                self.fail(f"Unexpected {keyword!r}")
+            self.blocks.pop()
+        else:
+            self.fail(f"Unknown tag {keyword!r}")
+
+    def function(self, name: str, stream: bool = False) -> str:
+        """Return the source of one compiled function.
+
+        The ``render`` variant appends every part to a list and joins
+        it, while the ``stream`` variant yields the parts one by one.
+
+        :param name: Name of the function.
+        :param stream: If ``True``, compile a generator function,
+            defaults to ``False``.
+        """
+        head = [f"def {name}(context):"]
+        if not stream:
+            head.append("    _buf = []")
+            head.append("    _append = _buf.append")
+        head.extend(
+            f"    l_{variable} = _resolve(context, {variable!r})"
+            for variable in sorted(self.names)
+        )
+        body = []
+        for depth, code, emit in self.lines:
+            if emit:
+                code = f"yield {code}" if stream else f"_append({code})"
+            body.append("    " * depth + code)
+        tail = "    yield from ()" if stream else "    return ''.join(_buf)"
+        return "\n".join([*head, *body, tail])
+
+    def compile(self) -> str:
+        """Return the source of the ``render`` and ``generate`` functions."""
+        for token in _token_re.split(self.source):
+            if token.startswith("{{") and token.endswith("}}"):
+                self.flush()
+                self.output(token[2:-2])
+            elif token.startswith("{%") and token.endswith("%}"):
+                self.flush()
+                self.statement(token[2:-2])
+            elif not (token.startswith("{#") and token.endswith("#}")):
+                self.literal.append(token)
+            self.lineno += token.count("\n")
+        self.flush()
+        if self.blocks:
+            self.fail(f"Unclosed {self.blocks[-1]!r} block")
+        render = self.function("render")
+        return f"{render}\n\n{self.function('generate', stream=True)}"
+
+
+class Template:
+    """Compiled template which renders a context into a string.
+
+    .. code-block:: python
+
+        template = Template("<p>Hello, {{ user.name }}!</p>")
+        template.render(user={"name": "Akshay"})
+
+    :param source: Template source to compile.
+    :param name: Name of the template, defaults to ``None``.
+    :param filename: Path to the file the template was loaded from,
+        defaults to ``None``.
+    :param autoescape: If ``True``, HTML escape the output of every
+        expression, defaults to ``False``.
+    :raises TemplateSyntaxError: When the source cannot be compiled.
+    """
+
+    __slots__ = ("_generate", "_render", "autoescape", "filename", "name")
+    stream_chunk_size: t.ClassVar[int] = 8192
+
+    def __init__(
+        self,
+        source: str,
+        name: str | None = None,
+        filename: str | None = None,
+        autoescape: bool = False,
+    ) -> None:
+        """Initialise the template by compiling its source."""
+        self.name = name
+        self.filename = filename
+        self.autoescape = autoescape
+        code = _Compiler(source, name, autoescape).compile()
+        namespace: dict[str, t.Any] = {
+            "_escape": escape,
+            "_getattr": _getattr,
+            "_resolve": _resolve,
+            "_str": str,
+        }
+        # The code is generated by ``_Compiler``, which only emits the
+        # two functions around expressions taken from the template. Like
+        # Jinja, this trusts templates as code, so they must come from
+        # the application and never from users.
+        compiled = compile(code, filename or "<template>", "exec")
+        exec(compiled, namespace)  # noqa: S102
+        self._render: t.Callable[[t.Mapping[str, t.Any]], str] = namespace[
+            "render"
+        ]
+        self._generate: t.Callable[[t.Mapping[str, t.Any]], Iterator[str]] = (
+            namespace["generate"]
+        )
+
+    @classmethod
+    def from_file(cls, filename: str) -> Template:
+        """Load and compile a template file.
+
+        Autoescaping is enabled based on the file extension.
+
+        :param filename: Path to the template file.
+        """
+        with open(filename, encoding="utf-8") as template:
+            source = template.read()
+        return cls(
+            source,
+            name=os.path.basename(filename),
+            filename=filename,
+            autoescape=select_autoescape(filename),
+        )
+
+    def render(self, *args: t.Any, **kwargs: t.Any) -> str:
+        """Render the template with the given context.
+
+        Accepts the same arguments as the ``dict`` constructor.
+        """
+        return self._render(dict(*args, **kwargs))
+
+    def generate(self, *args: t.Any, **kwargs: t.Any) -> Iterator[str]:
+        """Render the template piece by piece as a generator.
+
+        Output is produced while the template runs, in chunks of about
+        ``stream_chunk_size`` characters, so the start of a page can be
+        sent before the rest of it has been rendered. Accepts the same
+        arguments as the ``dict`` constructor.
+        """
+        size = self.stream_chunk_size
+        buffer: list[str] = []
+        length = 0
+        for part in self._generate(dict(*args, **kwargs)):
+            buffer.append(part)
+            length += len(part)
+            if length >= size:
+                yield "".join(buffer)
+                buffer.clear()
+                length = 0
+        if buffer:
+            yield "".join(buffer)
+
+    def __repr__(self) -> str:
+        """Return a representation of the template."""
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class TemplateCache:
+    """Bounded LRU cache of compiled templates keyed by file path.
+
+    Each entry remembers the modification time of its file. Lookups
+    only check the file again when ``auto_reload`` is set, in which
+    case a changed file is compiled afresh and a deleted one is
+    evicted.
+
+    :param maxsize: Maximum number of templates to keep, defaults to
+        ``400``.
+    """
+
+    def __init__(self, maxsize: int = 400) -> None:
+        """Initialise an empty cache."""
+        self.maxsize = maxsize
+        self._templates: OrderedDict[str, tuple[int, Template]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filename: str, auto_reload: bool = False) -> Template:
+        """Return the compiled template for a file.
+
+        :param filename: Resolved path to the template file.
+        :param auto_reload: If ``True``, recompile the template when the
+            file has changed since it was cached, defaults to ``False``.
+        :raises TemplateNotFoundError: When the file no longer exists.
+        """
+        entry = self._templates.get(filename)
+        try:
+            if entry is not None:
+                mtime, template = entry
+                if not auto_reload or os.stat(filename).st_mtime_ns == mtime:
+                    with self._lock:
+                        if filename in self._templates:
+                            self._templates.move_to_end(filename)
+                    return template
+            mtime = os.stat(filename).st_mtime_ns
+            template = Template.from_file(filename)
+        except FileNotFoundError:
+            with self._lock:
+                self._templates.pop(filename, None)
+            raise TemplateNotFoundError(
+                f"Template file {filename!r} no longer exists"
+            ) from None
+        with self._lock:
+            self._templates[filename] = (mtime, template)
+            self._templates.move_to_end(filename)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Remove every template from the cache."""
+        with self._lock:
+            self._templates.clear()
+
+    def __contains__(self, filename: object) -> bool:
+        """Return ``True`` if the file's template is cached."""
+        return filename in self._templates
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._templates)
+
+
+class TemplateLoader:
+    """Resolve template names to files through a precomputed index.
+
+    Every folder on the search path is walked once and each template
+    found is recorded under its name relative to that folder, such as
+    ``admin/users.html``. Folders earlier on the search path take
+    precedence over later ones. Resolving a name is then a dictionary
+    lookup; the filesystem is only probed again for names missing from
+    the index, for instance templates created after the scan.
+
+    Names which are not found are remembered as well, so looking them
+    up again, as a ``404`` page might, does not touch the filesystem.
+    A template created later under such a name is only found after
+    the next ``scan``, or when resolving with ``auto_reload``.
+
+    :param searchpath: Folders to load templates from, in order of
+        precedence.
+    :param max_missing: Number of missing names to remember, defaults
+        to ``1024``.
+    """
+
+    def __init__(
+        self,
+        searchpath: Iterable[str | os.PathLike[str]],
+        max_missing: int = 1024,
+    ) -> None:
+        """Initialise the loader with its search path."""
+        self.searchpath = [os.fspath(path) for path in searchpath]
+        self.max_missing = max_missing
+        self._index: dict[str, str] | None = None
+        self._missing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def add_searchpath(
+        self,
+        path: str | os.PathLike[str],
+        prepend: bool = False,
+    ) -> None:
+        """Add a folder to the search path and drop the current index.
+
+        :param path: Folder to load templates from.
+        :param prepend: If ``True``, give the folder precedence over
+            the existing ones, defaults to ``False``.
+        """
+        with self._lock:
+            if prepend:
+                self.searchpath.insert(0, os.fspath(path))
+            else:
+                self.searchpath.append(os.fspath(path))
+            self._index = None
+            self._missing = set()
+
+    def scan(self) -> dict[str, str]:
+        """Build the name to path index from the search path."""
+        index: dict[str, str] = {}
+        for folder in self.searchpath:
+            folder = os.path.abspath(folder)
+            for dirpath, _, filenames in os.walk(folder):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    name = os.path.relpath(path, folder)
+                    index.setdefault(name.replace(os.sep, "/"), path)
+        with self._lock:
+            self._index = index
+            self._missing = set()
+        return index
+
+    def resolve(self, name: str, auto_reload: bool = False) -> str | None:
+        """Return the path of a template, or ``None`` if not found.
+
+        :param name: Template name relative to a search path folder.
+        :param auto_reload: If ``True``, probe the filesystem for a
+            name even when it was missing before, defaults to
+            ``False``.
+        """
+        index = self._index
+        if index is None:
+            index = self.scan()
+        path = index.get(name)
+        if path is not None:
+            return path
+        missing = self._missing
+        if name in missing and not auto_reload:
+            return None
+        for folder in self.searchpath:
+            candidate = os.path.abspath(os.path.join(folder, name))
+            if os.path.isfile(candidate):
+                index[name] = candidate
+                missing.discard(name)
+                return candidate
+        if len(missing) >= self.max_missing:
+            missing.clear()
+        missing.add(name)
+        return None
+
+    def discard(self, name: str) -> None:
+        """Forget the indexed path of a template, after it was deleted.
+
+        :param name: Template name relative to a search path folder.
+        """
+        index = self._index
+        if index is not None:
+            index.pop(name, None)
+
+    def list_templates(self) -> list[str]:
+        """Return the sorted names of every indexed template."""
+        index = self._index
+        if index is None:
+            index = self.scan()
+        return sorted(index)
+
+
+_default_loader: t.Final[TemplateLoader] = TemplateLoader(["templates"])
+_default_cache: t.Final[TemplateCache] = TemplateCache()
+
+
+def get_template(template_name_or_list: str | list[str]) -> Template:
+    """Return the compiled template for the first name that exists.
+
+    Names are resolved through the application's ``template_loader``
+    and compiled templates are served from its ``template_cache``.
+    Outside of an application context, templates are loaded from
+    ``templates`` relative to the working directory.
+
+    :param template_name_or_list: Template filename or list of fallback
+        names to try in order.
+    :raises TemplateNotFoundError: When no templates are found.
+    """
+    templates = (
+        [template_name_or_list]
+        if isinstance(template_name_or_list, str)
+        else template_name_or_list
+    )
+    try:
+        from miroslava.globals import get_current_app
+
+        app = get_current_app()
+        loader = app.template_loader
+        cache = app.template_cache
+        auto_reload = app.templates_auto_reload
+    except Exception:
+        loader = _default_loader
+        cache = _default_cache
+        auto_reload = False
+    for template in templates:
+        path = loader.resolve(template, auto_reload)
+        if path is None:
+            continue
+        try:
+            return cache.get(path, auto_reload)
+        except TemplateNotFoundError:
+            loader.discard(template)
+    raise TemplateNotFoundError(f"Template(s) not found: {templates}")
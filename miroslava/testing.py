@@ -0,0 +1,315 @@
+"""\
+Miroslava's Test Client
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides a client for testing an application without a
+server.
+
+The ``TestClient`` turns a method, path, and body into a raw request
+head, parses it with the app's own ``make_environ``, and dispatches the
+``Request`` inside a pooled request context, exactly like
+``handle_client`` does after reading from the socket. The response is
+returned as the ``Response`` object the app produced, so nothing is
+serialised or sent over the network.
+
+Bodies can be given as bytes, text, form fields, files for multipart
+uploads, JSON, or a stream. Cookies set by responses are stored and
+sent back with later requests, like a browser would.
+"""
+
+from __future__ import annotations
+
+import io
+import typing as t
+import uuid
+from http.cookies import SimpleCookie
+from urllib.parse import quote
+from urllib.parse import urlencode
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from miroslava.app import Miroslava
+    from miroslava.app import WSGIEnvironment
+    from miroslava.wrappers import Response
+
+type FileValue = (
+    tuple[str, bytes | t.BinaryIO] | tuple[str, bytes | t.BinaryIO, str]
+)
+
+
+class IterableStream(io.RawIOBase):
+    """Readable binary stream over an iterable of byte chunks.
+
+    :param chunks: Chunks making up the stream.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """Initialise the stream."""
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        """Return ``True``, the stream can be read."""
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:
+        """Read the next bytes of the stream into a buffer."""
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class TestClient:
+    """Send requests to an application in-process.
+
+    Usually created with ``app.test_client()``.
+
+    .. code-block:: python
+
+        client = app.test_client()
+        response = client.post("/login", data={"user": "akshay"})
+        assert response.status_code == 200
+        assert client.get("/profile").get_data(as_text=True) == "akshay"
+
+    :param app: Application to send requests to.
+    :param use_cookies: Store cookies set by responses and send them
+        with later requests, defaults to ``True``.
+    """
+
+    __test__: t.ClassVar[bool] = False
+
+    def __init__(self, app: Miroslava, use_cookies: bool = True) -> None:
+        """Initialise a client for an application."""
+        self.app = app
+        self.use_cookies = use_cookies
+        self.cookies: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        """Human-readable representation of the client."""
+        return f"<{type(self).__name__} {self.app.name!r}>"
+
+    def set_cookie(self, key: str, value: str) -> None:
+        """Store a cookie to send with later requests.
+
+        :param key: Name of the cookie.
+        :param value: Value of the cookie.
+        """
+        self.cookies[key] = value
+
+    def delete_cookie(self, key: str) -> None:
+        """Stop sending a cookie.
+
+        :param key: Name of the cookie.
+        """
+        self.cookies.pop(key, None)
+
+    def open(
+        self,
+        path: str = "/",
+        method: str = "GET",
+        query_string: str | Mapping[str, t.Any] | None = None,
+        headers: Mapping[str, str] | Iterable[tuple[str, str]] | None = None,
+        data: (
+            bytes
+            | str
+            | Mapping[str, str | FileValue]
+            | t.BinaryIO
+            | Iterable[bytes]
+            | None
+        ) = None,
+        json: t.Any = None,
+        content_type: str | None = None,
+    ) -> Response:
+        """Send a request to the application and return its response.
+
+        Streamed responses are consumed while the request context is
+        still active, as the server does when writing them, and keep
+        their chunks so they can be inspected afterwards.
+
+        :param path: Path of the request, which may include a query
+            string, defaults to ``/``.
+        :param method: HTTP method of the request, defaults to ``GET``.
+        :param query_string: Query string, or a mapping encoded as one,
+            defaults to ``None``.
+        :param headers: Headers of the request, defaults to ``None``.
+        :param data: Body of the request. A mapping is sent as a form,
+            as multipart when any value is a ``(filename, content)``
+            tuple. A file-like object or any other iterable of bytes
+            is streamed to the app, defaults to ``None``.
+        :param json: Object to send serialised as JSON, defaults to
+            ``None``.
+        :param content_type: Content type of the body, defaults to
+            ``None``.
+        """
+        if query_string is not None:
+            if not isinstance(query_string, str):
+                query_string = urlencode(query_string, doseq=True)
+            path = f"{path}?{query_string}"
+        path, _, query = path.partition("?")
+        target = quote(path, safe="/:@!$&'()*+,;=-._~")
+        if query:
+            target = f"{target}?{query}"
+        lines = [f"{method.upper()} {target} HTTP/1.1", "Host: localhost"]
+        if headers:
+            items = headers.items() if hasattr(headers, "items") else headers
+            lines.extend(f"{key}: {value}" for key, value in items)
+        if self.use_cookies and self.cookies:
+            lines.append(
+                "Cookie: "
+                + "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+            )
+        body: bytes | None = b""
+        stream: t.BinaryIO | None = None
+        if json is not None:
+            body = self.app.json.dumps(json).encode()
+            content_type = content_type or "application/json"
+        elif isinstance(data, str):
+            body = data.encode()
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            body = bytes(data)
+        elif hasattr(data, "items"):
+            if any(isinstance(value, tuple) for value in data.values()):
+                boundary = uuid.uuid4().hex
+                body = encode_multipart(data, boundary)
+                content_type = f"multipart/form-data; boundary={boundary}"
+            else:
+                body = urlencode(data, doseq=True).encode()
+                content_type = (
+                    content_type or "application/x-www-form-urlencoded"
+                )
+        elif data is not None:
+            stream = data if hasattr(data, "read") else IterableStream(data)
+            body = None
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        if body:
+            lines.append(f"Content-Length: {len(body)}")
+        environ = self.app.make_environ("\r\n".join(lines).encode())
+        if stream is not None:
+            environ["wsgi.input"] = stream
+        else:
+            environ["miroslava.request_body"] = body
+        response = self.dispatch(environ)
+        if self.use_cookies:
+            self._store_cookies(response)
+        return response
+
+    def dispatch(self, environ: WSGIEnvironment) -> Response:
+        """Dispatch a request built from an environment.
+
+        The request goes through a pooled request context and the
+        ``teardown_request`` hooks, as on the server.
+
+        :param environ: Environment of the request.
+        """
+        app = self.app
+        request = app.request_class(environ)
+        ctx = app.request_context(request)
+        ctx.push()
+        error: BaseException | None = None
+        try:
+            response = app.dispatch_request(request)
+            if response.is_streamed:
+                try:
+                    chunks = list(response.iter_encoded())
+                finally:
+                    response.close()
+                response.response = iter(chunks)
+        except BaseException as err:
+            error = err
+            raise
+        else:
+            return response
+        finally:
+            try:
+                if app.teardown_request_funcs:
+                    app.do_teardown_request(error)
+            finally:
+                request.close()
+                ctx.pop()
+                app.release_context(ctx)
+
+    def _store_cookies(self, response: Response) -> None:
+        """Update the stored cookies from a response's headers."""
+        for header in response.headers.getlist("Set-Cookie"):
+            cookie = SimpleCookie()
+            cookie.load(header)
+            for key, morsel in cookie.items():
+                if morsel["max-age"] in ("0", "-1") or not morsel.value:
+                    self.cookies.pop(key, None)
+                else:
+                    self.cookies[key] = morsel.value
+
+    def get(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send a ``GET`` request, see ``open`` for the arguments."""
+        return self.open(path, "GET", **kwargs)
+
+    def post(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send a ``POST`` request, see ``open`` for the arguments."""
+        return self.open(path, "POST", **kwargs)
+
+    def put(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send a ``PUT`` request, see ``open`` for the arguments."""
+        return self.open(path, "PUT", **kwargs)
+
+    def patch(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send a ``PATCH`` request, see ``open`` for the arguments."""
+        return self.open(path, "PATCH", **kwargs)
+
+    def delete(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send a ``DELETE`` request, see ``open`` for the arguments."""
+        return self.open(path, "DELETE", **kwargs)
+
+    def head(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send a ``HEAD`` request, see ``open`` for the arguments."""
+        return self.open(path, "HEAD", **kwargs)
+
+    def options(self, path: str = "/", **kwargs: t.Any) -> Response:
+        """Send an ``OPTIONS`` request, see ``open`` for the arguments."""
+        return self.open(path, "OPTIONS", **kwargs)
+
+
+def encode_multipart(
+    fields: Mapping[str, str | FileValue],
+    boundary: str,
+) -> bytes:
+    """Encode form fields and files as a ``multipart/form-data`` body.
+
+    Files are given as ``(filename, content)`` or ``(filename, content,
+    content_type)`` tuples, where the content is bytes or a binary file.
+
+    :param fields: Names mapped to values or files.
+    :param boundary: Boundary separating the parts.
+    """
+    parts = []
+    for name, value in fields.items():
+        if isinstance(value, tuple):
+            filename, content, *rest = value
+            if not isinstance(content, bytes):
+                content = content.read()
+            mimetype = rest[0] if rest else "application/octet-stream"
+            head = (
+                f'Content-Disposition: form-data; name="{name}"; '
+                f'filename="{filename}"\r\nContent-Type: {mimetype}'
+            )
+        else:
+            head = f'Content-Disposition: form-data; name="{name}"'
+            content = str(value).encode()
+        parts.append(f"--{boundary}\r\n{head}\r\n\r\n".encode())
+        parts.append(content)
+        parts.append(b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts)
@@ -4,12 +4,12 @@ Miroslava's Utilities
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 27 January, 2026
-Last updated on: 04 February, 2026
+Last updated on: 18 October, 2026
 
 This module provides small helper functions that are used throughout
-the project. It includes some JSON serialisation helpers, a simple
-template renderer for demonstration purposes, and path helpers for
-locating application roots.
+the project. It includes some JSON serialisation helpers, including a
+compact provider for serving traffic, a template rendering helper, and
+path helpers for locating application roots.
 
 The intent is to keep behaviour familiar while remaining easy to follow
 for pedagogical purposes.
@@ -17,14 +17,24 @@ for pedagogical purposes.
 
 from __future__ import annotations
 
+import calendar
+import dataclasses
+import decimal
+import functools
 import json
 import os
 import sys
 import typing as t
+import uuid
+from datetime import date
+from datetime import datetime
+from email.utils import formatdate
 from http import HTTPStatus
 
 if t.TYPE_CHECKING:
+    import socket
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Mapping
     from collections.abc import Sequence
 
@@ -37,7 +47,7 @@ type HeadersValue = (
     "Headers" | Mapping[str, HeaderValue] | Sequence[tuple[str, HeaderValue]]
 )
 type JSONValue = (
-    str | int | float | bool | None | dict[str, t.Any] | list[t.Any]
+    str | int | float | bool | dict[str, t.Any] | list[t.Any] | None
 )
 type ResponseValue = Response | str | bytes | list[t.Any] | Mapping[str, t.Any]
 type WSGIEnvironment = dict[str, t.Any]
@@ -48,6 +58,7 @@ _charset_mimetypes: set[str] = {
 }
 
 
+@functools.lru_cache(maxsize=128)
 def get_content_type(mimetype: str, charset: str) -> str:
     """Return a content type string with charset when appropriate.
 
@@ -60,11 +71,28 @@ def get_content_type(mimetype: str, charset: str) -> str:
     return mimetype
 
 
+def _coalesce(parts: Iterable[str], size: int) -> Iterator[bytes]:
+    """Join small pieces of text into UTF-8 chunks of about ``size``."""
+    buffer: list[str] = []
+    length = 0
+    for part in parts:
+        buffer.append(part)
+        length += len(part)
+        if length >= size:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            length = 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
 class DefaultJSONProvider:
     """Base class which provides JSON serialisation."""
 
     mimetype: t.ClassVar[str] = "application/json"
+    ndjson_mimetype: t.ClassVar[str] = "application/x-ndjson"
     compact: t.ClassVar[bool | None] = None
+    stream_chunk_size: t.ClassVar[int] = 16 * 1024
 
     def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
         """Deserialise a Python object as JSON."""
@@ -80,6 +108,19 @@ class DefaultJSONProvider:
             kwargs["ensure_ascii"] = False
         return json.dumps(obj, **kwargs)
 
+    def _indented(self) -> bool:
+        """Return ``True`` if responses should be indented.
+
+        When ``compact`` is ``None``, output is only indented while the
+        current app is in debug mode, so production responses are not
+        padded with whitespace.
+        """
+        if self.compact is None:
+            from miroslava.globals import current_app
+
+            return bool(current_app) and current_app.debug
+        return not self.compact
+
     def _prepare_response_obj(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
         """Return valid keywords/arguments for the response."""
         if args and kwargs:
@@ -93,18 +134,184 @@ class DefaultJSONProvider:
         from miroslava.wrappers import Response
 
         obj = self._prepare_response_obj(*args, **kwargs)
-        if self.compact:
-            kwargs.setdefault("separators", (",", ":"))
-        else:
-            kwargs.setdefault("indent", 2)
-        return Response(self.dumps(obj), mimetype=self.mimetype)
+        options: dict[str, t.Any] = (
+            {"indent": 2} if self._indented() else {"separators": (",", ":")}
+        )
+        return Response(self.dumps(obj, **options), mimetype=self.mimetype)
+
+    def _stream_encoder(self) -> json.JSONEncoder:
+        """Return the encoder used for streamed responses."""
+        if self._indented():
+            return json.JSONEncoder(ensure_ascii=False, indent=2)
+        return json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def iter_dumps(self, obj: t.Any) -> Iterator[bytes]:
+        """Serialise a Python object to JSON as a stream of chunks.
+
+        The document is produced incrementally with
+        ``JSONEncoder.iterencode`` and grouped into chunks of about
+        ``stream_chunk_size`` bytes. A top-level list or tuple with a
+        compact encoder is encoded item by item instead, which keeps
+        the fast C encoder in use for every item.
+
+        :param obj: Object to serialise.
+        """
+        encoder = self._stream_encoder()
+        # Typeshed declares ``indent`` without ``None``, its default.
+        indent: int | str | None = encoder.indent
+        if isinstance(obj, (list, tuple)) and indent is None:
+            separator = encoder.item_separator
+
+            def parts() -> Iterator[str]:
+                yield "["
+                for index, item in enumerate(obj):
+                    if index:
+                        yield separator
+                    yield encoder.encode(item)
+                yield "]"
+
+            return _coalesce(parts(), self.stream_chunk_size)
+        return _coalesce(encoder.iterencode(obj), self.stream_chunk_size)
+
+    def iter_ndjson(self, records: Iterable[t.Any]) -> Iterator[bytes]:
+        """Serialise records as newline-delimited JSON chunks.
+
+        Each record is written compactly on its own line, regardless
+        of the ``compact`` setting, as required by the format.
+
+        :param records: Iterable of JSON serialisable records.
+        """
+        encode = self._stream_encoder().encode
+        if self._indented():
+            encode = json.JSONEncoder(
+                ensure_ascii=False, separators=(",", ":")
+            ).encode
+        lines = (f"{encode(record)}\n" for record in records)
+        return _coalesce(lines, self.stream_chunk_size)
+
+    def response_stream(self, obj: t.Any) -> Response:
+        """Create a streamed JSON Response.
+
+        Lists, tuples, and dictionaries are streamed as a single JSON
+        document. Any other iterable, such as a generator of records,
+        is streamed as newline-delimited JSON.
+
+        :param obj: Document or iterable of records to serialise.
+        """
+        from miroslava.wrappers import Response
+
+        if isinstance(obj, (list, tuple, dict)):
+            return Response(self.iter_dumps(obj), mimetype=self.mimetype)
+        return Response(self.iter_ndjson(obj), mimetype=self.ndjson_mimetype)
+
+
+def _default(o: t.Any) -> t.Any:
+    """Serialise objects the standard JSON encoder does not support."""
+    if isinstance(o, datetime):
+        return formatdate(calendar.timegm(o.utctimetuple()), usegmt=True)
+    if isinstance(o, date):
+        return formatdate(calendar.timegm(o.timetuple()), usegmt=True)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(
+        f"Object of type {type(o).__name__} is not JSON serialisable"
+    )
+
+
+class CompactJSONProvider(DefaultJSONProvider):
+    """JSON provider tuned for serving traffic.
+
+    The output uses compact separators and non-ASCII characters are
+    kept as they are. A single ``json.JSONEncoder`` is configured once
+    per provider and reused for every call, which keeps the C
+    accelerated encoder on the fast path, and responses are handed to
+    ``Response`` as UTF-8 bytes so the payload is not encoded twice.
+    Dates, decimals, UUIDs, and dataclasses are serialised as well.
+
+    Select it by setting the ``json_provider_class`` of the app::
+
+        class App(Miroslava):
+            json_provider_class = CompactJSONProvider
+    """
+
+    compact: t.ClassVar[bool | None] = True
+    ensure_ascii: t.ClassVar[bool] = False
+    sort_keys: t.ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        """Initialise the provider and its shared encoder."""
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=self.ensure_ascii,
+            sort_keys=self.sort_keys,
+            separators=(",", ":"),
+            default=_default,
+        )
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        """Serialise a Python object to a JSON string.
+
+        Calls without extra options reuse the shared encoder.
+        """
+        if kwargs:
+            kwargs.setdefault("default", _default)
+            return super().dumps(obj, **kwargs)
+        return self._encoder.encode(obj)
+
+    def _stream_encoder(self) -> json.JSONEncoder:
+        """Return the shared encoder for streamed responses."""
+        return self._encoder
+
+    def dumpb(self, obj: t.Any) -> bytes:
+        """Serialise a Python object to UTF-8 encoded JSON bytes."""
+        return self._encoder.encode(obj).encode()
+
+    def response(self, *args: t.Any, **kwargs: t.Any) -> Response:
+        """Create a JSON Response from UTF-8 bytes."""
+        from miroslava.wrappers import Response
+
+        obj = self._prepare_response_obj(*args, **kwargs)
+        return Response(self.dumpb(obj), mimetype=self.mimetype)
 
 
 def jsonify(*args: t.Any, **kwargs: t.Any) -> Response:
-    """Create a JSON response using the default provider."""
+    """Create a JSON response using the app's JSON provider.
+
+    Outside of an application context, the default provider is used.
+    """
+    from miroslava.globals import current_app
+
+    if current_app:
+        return current_app.json.response(*args, **kwargs)
     return DefaultJSONProvider().response(*args, **kwargs)
 
 
+def jsonify_stream(obj: t.Any) -> Response:
+    """Create a streamed JSON response using the app's JSON provider.
+
+    The payload is encoded and sent in chunks as it is produced, so the
+    full document is never held in memory. Generators and other
+    iterables of records are sent as ``application/x-ndjson``, one
+    record per line.
+
+    .. code-block:: python
+
+        @app.route("/export")
+        def export():
+            return jsonify_stream(row for row in fetch_rows())
+
+    :param obj: Document or iterable of records to serialise.
+    """
+    from miroslava.globals import current_app
+
+    if current_app:
+        return current_app.json.response_stream(obj)
+    return DefaultJSONProvider().response_stream(obj)
+
+
 class TemplateNotFoundError(IOError):
     """Error raised when a template file cannot be located on disk."""
 
@@ -113,51 +320,45 @@ def render_template(
     template_name_or_list: str | list[str],
     **context: t.Any,
 ) -> str:
-    """Render a template string by naive substitution.
+    """Render a template with the given context.
 
-    The function walks a list of possible template names, picking the
-    first file present under a templates directory. It then performs a
-    simple string replacement for context variables of the form {{ key }}.
-    This is intentionally minimal and intended for teaching rather than
-    production use.
+    The first template found is compiled once and kept in the
+    application's template cache, so later renders only call the
+    compiled function. See ``miroslava.templating`` for the syntax.
 
     :param template_name_or_list: Template filename or list of fallback
         names to try in order.
     :raises TemplateNotFoundError: When no templates are found.
     """
-    templates = (
-        [template_name_or_list]
-        if isinstance(template_name_or_list, str)
-        else template_name_or_list
-    )
-    content: str | None = None
-    try:
-        from miroslava.globals import current_app
-
-        root_dir = current_app.root_path
-        template_dir = current_app.template_folder or "templates"
-    except Exception:
-        root_dir = os.getcwd()
-        template_dir = "templates"
-
-    for template in templates:
-        candidates = [
-            os.path.join(root_dir, template_dir, template),
-            os.path.join("templates", template),
-        ]
-        for candidate in candidates:
-            if os.path.exists(candidate):
-                with open(candidate) as html:
-                    content = html.read()
-                break
-        if content is not None:
-            break
-    if content is None:
-        raise TemplateNotFoundError(f"Template(s) not found: {templates}")
-    for key, value in context.items():
-        content = content.replace(f"{{{{ {key} }}}}", str(value))
-        content = content.replace(f"{{{{{key}}}}}", str(value))
-    return content
+    from miroslava.templating import get_template
+
+    return get_template(template_name_or_list).render(context)
+
+
+def stream_template(
+    template_name_or_list: str | list[str],
+    **context: t.Any,
+) -> Iterator[str]:
+    """Render a template as a stream of chunks.
+
+    The template is looked up straight away, but rendered lazily as the
+    returned generator is consumed. Returning the generator from a view
+    sends the page with chunked transfer encoding, so the browser gets
+    the ``<head>`` of a large page while the rest is still rendering.
+
+    .. code-block:: python
+
+        @app.route("/report")
+        def report():
+            return stream_template("report.html", rows=fetch_rows())
+
+    :param template_name_or_list: Template filename or list of fallback
+        names to try in order.
+    :raises TemplateNotFoundError: When no templates are found.
+    """
+    from miroslava.templating import get_template
+
+    return get_template(template_name_or_list).generate(context)
 
 
 def get_root_path(import_name: str) -> str:
@@ -195,14 +396,41 @@ def get_current_url(
     if root_path is None:
         return f"{''.join(url)}/"
     url.append(root_path.rstrip("/"))
+    url.append("/")
     if path is None:
-        return f"{''.join(url)}/"
+        return "".join(url)
     url.append(path.lstrip("/"))
     if query_string:
         url.extend(["?", query_string])
     return "".join(url)
 
 
+def get_host(
+    scheme: str,
+    host_header: str | None,
+    server: tuple[str, int | None] | None = None,
+) -> str:
+    """Return the host for the given parameters.
+
+    The ``Host`` header is preferred when present. Otherwise, the host
+    is built from the server name and port, leaving out the port when
+    it is the default one for the scheme.
+
+    :param scheme: Protocol of the request used.
+    :param host_header: Value of the ``Host`` header, if any.
+    :param server: Address of the server as a ``(host, port)`` tuple,
+        defaults to ``None``.
+    """
+    if host_header:
+        return host_header
+    if server is None:
+        return ""
+    host, port = server
+    if port is None or (scheme, port) in (("http", 80), ("https", 443)):
+        return host
+    return f"{host}:{port}"
+
+
 class Rule:
     """Represent a single URL mapping.
 
@@ -217,6 +445,8 @@ class Rule:
     :param methods: Sequence of http methods this rule applied to,
         defaults to ``None``.
     :param endpoint: Endpoint for this rule, defaults to ``None``.
+    :param timeout: Seconds a request to this rule may run before the
+        watchdog reports it, defaults to ``None``.
     """
 
     def __init__(
@@ -225,6 +455,7 @@ class Rule:
         defaults: Mapping[str, t.Any] | None = None,
         methods: Iterable[str] | None = None,
         endpoint: str | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Initialise a rule with URL string."""
         if not string.startswith("/"):
@@ -233,6 +464,7 @@ class Rule:
         self.endpoint = endpoint or string
         self.methods = set(methods or [])
         self.defaults = dict(defaults or {})
+        self.timeout = timeout
 
     def __repr__(self) -> str:
         """Human-readable representation of the rule object."""
@@ -271,6 +503,69 @@ class Map:
         self._rules.append(rule)
 
 
+class LimitedStream:
+    """Read-only stream over a socket, limited to the request body.
+
+    The bytes received together with the request headers are served
+    first and the remainder is pulled from the socket on demand, so a
+    body is never read past its ``Content-Length`` and never has to be
+    buffered as a whole.
+
+    :param sock: Connected client socket to read from.
+    :param prefix: Body bytes already received with the headers.
+    :param limit: Total length of the body in bytes.
+    """
+
+    def __init__(self, sock: socket.socket, prefix: bytes, limit: int) -> None:
+        """Initialise the stream over the socket."""
+        self._sock = sock
+        self._prefix = prefix[:limit]
+        self.limit = limit
+        self.pos = 0
+
+    @property
+    def is_exhausted(self) -> bool:
+        """Return ``True`` when the whole body has been read."""
+        return self.pos >= self.limit
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes, or the rest of the body.
+
+        :param size: Maximum number of bytes to return; negative values
+            read until the end of the body, defaults to ``-1``.
+        """
+        remaining = self.limit - self.pos
+        if remaining <= 0:
+            return b""
+        if size < 0 or size > remaining:
+            size = remaining
+        chunks: list[bytes] = []
+        received = 0
+        if self._prefix:
+            chunks.append(self._prefix[:size])
+            self._prefix = self._prefix[size:]
+            received = len(chunks[0])
+        while received < size:
+            chunk = self._sock.recv(min(size - received, 65536))
+            if not chunk:
+                self.limit = self.pos + received
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+        self.pos += received
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def exhaust(self, chunk_size: int = 65536) -> None:
+        """Read and discard the rest of the body.
+
+        :param chunk_size: Size of each discarded read, defaults to
+            ``65536``.
+        """
+        while not self.is_exhausted:
+            if not self.read(chunk_size):
+                break
+
+
 def make_response(*args: t.Any) -> Response:
     """Make a response to return."""
     from miroslava.globals import current_app
@@ -0,0 +1,222 @@
+"""\
+Miroslava's Watchdog
+====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module watches for requests which take too long to handle.
+
+The development server handles every connection on its own thread and
+puts no deadline on a view, so a view stuck on I/O holds its thread
+indefinitely without any sign of it. The ``Watchdog`` keeps the start
+time of every in-flight request and a background thread checks them at
+a fixed interval. When a request runs past its threshold, the route
+and the current stack of the thread handling it are logged, and the
+client can optionally be answered with a ``503`` and disconnected.
+
+Request threads only add and remove an entry in a dictionary, and the
+watchdog wakes up at a fixed interval regardless of how many requests
+are served, so the overhead does not grow with the request rate.
+"""
+
+from __future__ import annotations
+
+import socket
+import sys
+import threading
+import time
+import traceback
+import typing as t
+
+from miroslava.serving import serialise_head
+from miroslava.wrappers import Response
+
+if t.TYPE_CHECKING:
+    from types import FrameType
+
+    from miroslava.wrappers import Request
+
+
+class WatchedRequest:
+    """In-flight request tracked by a ``Watchdog``.
+
+    :param request: Request being handled.
+    :param client: Socket connected to the client.
+    :param start_ns: Monotonic time the request started at.
+    """
+
+    __slots__ = ("client", "reported", "request", "sending", "start_ns")
+
+    def __init__(
+        self, request: Request, client: socket.socket, start_ns: int
+    ) -> None:
+        """Initialise a tracked request."""
+        self.request = request
+        self.client = client
+        self.start_ns = start_ns
+        self.reported = False
+        self.sending = False
+
+
+class Watchdog:
+    """Report, and optionally abort, requests running past a deadline.
+
+    A URL rule registered with a ``timeout`` uses that number of
+    seconds instead of the watchdog's ``timeout``. Each slow request
+    is reported once.
+
+    .. code-block:: python
+
+        watchdog = Watchdog(timeout=30.0, abort=True)
+        watchdog.start()
+
+    :param timeout: Seconds a request may run before it is reported,
+        defaults to ``30.0``.
+    :param interval: Seconds between two checks, defaults to ``1.0``.
+    :param abort: Answer slow requests with a ``503`` and close their
+        connection, defaults to ``False``.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        interval: float = 1.0,
+        abort: bool = False,
+    ) -> None:
+        """Initialise a stopped watchdog."""
+        self.timeout = timeout
+        self.interval = interval
+        self.abort = abort
+        self.requests: dict[int, WatchedRequest] = {}
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._unavailable: Response | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return ``True`` if the watchdog thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start checking requests in a background thread."""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="miroslava-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking and wait for the thread to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def watch(self, request: Request, client: socket.socket) -> None:
+        """Start watching the request handled by the current thread.
+
+        :param request: Request being handled.
+        :param client: Socket connected to the client.
+        """
+        self.requests[threading.get_ident()] = WatchedRequest(
+            request, client, time.monotonic_ns()
+        )
+
+    def sending(self) -> None:
+        """Note that the current thread started writing its response.
+
+        From then on, a slow request is still reported but is no longer
+        answered with a ``503``, as the response head has been sent.
+        The flag is set under the lock ``disconnect`` holds while it
+        writes, so the two responses never interleave on the socket.
+        """
+        watched = self.requests.get(threading.get_ident())
+        if watched is not None:
+            with self._lock:
+                watched.sending = True
+
+    def unwatch(self) -> None:
+        """Stop watching the current thread."""
+        self.requests.pop(threading.get_ident(), None)
+
+    def _run(self) -> None:
+        """Check requests until the watchdog is stopped."""
+        interval = self.interval
+        while not self._stopped.wait(interval):
+            self.check()
+
+    def check(self) -> None:
+        """Report every request which has run past its timeout."""
+        if not self.requests:
+            return
+        now = time.monotonic_ns()
+        frames = None
+        for ident, watched in list(self.requests.items()):
+            if watched.reported:
+                continue
+            rule = watched.request.url_rule
+            timeout = self.timeout
+            if rule is not None and rule.timeout is not None:
+                timeout = rule.timeout
+            elapsed = (now - watched.start_ns) / 1e9
+            if elapsed < timeout:
+                continue
+            if frames is None:
+                frames = sys._current_frames()
+            watched.reported = True
+            self.report(watched, elapsed, frames.get(ident))
+            if self.abort:
+                self.disconnect(watched)
+
+    def report(
+        self,
+        watched: WatchedRequest,
+        elapsed: float,
+        frame: FrameType | None,
+    ) -> None:
+        """Log a slow request with the stack of its thread.
+
+        :param watched: Request which ran past its timeout.
+        :param elapsed: Seconds the request has been running for.
+        :param frame: Current frame of the thread handling it, or
+            ``None`` if the thread has finished in the meantime.
+        """
+        request = watched.request
+        stack = "".join(traceback.format_stack(frame)) if frame else ""
+        print(
+            f"Slow request: {request.method} {request.path} "
+            f"(endpoint {request.endpoint!r}) has been running for "
+            f"{elapsed:.1f}s\n{stack}",
+            end="",
+        )
+
+    def disconnect(self, watched: WatchedRequest) -> None:
+        """Answer a slow request with a ``503`` and close its socket.
+
+        The socket is shut down rather than closed, so the thread
+        handling the request fails on its next read or write and then
+        releases the connection as usual. If that thread has already
+        started writing its own response, the socket is only shut down.
+
+        :param watched: Request which ran past its timeout.
+        """
+        response = self._unavailable
+        if response is None:
+            response = Response("Service Unavailable", status=503)
+            response.headers["Connection"] = "close"
+            self._unavailable = response
+        client = watched.client
+        with self._lock:
+            try:
+                if not watched.sending:
+                    watched.sending = True
+                    head = serialise_head(response, response.content_length)
+                    client.sendall(head + response.get_data())
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
@@ -4,13 +4,15 @@ Miroslava's Wrappers
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 26 January, 2026
-Last updated on: 03 February, 2026
+Last updated on: 18 October, 2026
 
 This module provides the public ``Request`` and ``Response`` classes.
 
 The ``Request`` class turns a WSGI environment mapping into a
-friendlier object that exposes parsed query arguments, form data, and
-JSON bodies.
+friendlier object that exposes parsed query arguments, form data,
+uploaded files, and JSON bodies. It is deliberately lean; it uses
+``__slots__`` and only does the work a view actually asks for, caching
+the result so that repeated access is cheap.
 
 The ``Response`` class holds outgoing HTTP payloads, status metadata,
 and headers, keeping its interface close to Flask's base response type
@@ -20,21 +22,33 @@ constructed ``Response`` objects.
 
 from __future__ import annotations
 
+import io
 import json
 import typing as t
 from http import HTTPStatus
 from urllib.parse import parse_qsl
 
+from miroslava.datastructures import EnvironHeaders
+from miroslava.datastructures import FileStorage
 from miroslava.datastructures import Headers
 from miroslava.datastructures import MultiDict
+from miroslava.datastructures import QueryArgs
+from miroslava.formparser import MultiPartParser
+from miroslava.formparser import RequestEntityTooLargeError
+from miroslava.formparser import parse_options_header
+from miroslava.globals import current_app
 from miroslava.utils import get_content_type
 from miroslava.utils import get_current_url
+from miroslava.utils import get_host
 
 if t.TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
     from collections.abc import Mapping
 
+    from miroslava.metrics import PhaseTimer
+    from miroslava.utils import Rule
+
 type WSGIEnvironment = dict[str, t.Any]
 
 HTTP_STATUS_CODES: dict[int, str] = {
@@ -103,7 +117,12 @@ HTTP_STATUS_CODES: dict[int, str] = {
     510: "Not Extended",
     511: "Network Authentication Failed",
 }
-EnvironHeaders = Headers
+_statuses: dict[int, str] = {
+    code: f"{code} {phrase}" for code, phrase in HTTP_STATUS_CODES.items()
+}
+_statuses.update(
+    {status.value: f"{status.value} {status.phrase}" for status in HTTPStatus}
+)
 
 
 def _get_server(environ: WSGIEnvironment) -> tuple[str, int] | None:
@@ -122,50 +141,117 @@ class Request:
     body.
 
     Instances are created per request during dispatch and should be
-    treated as read-only representations of the inbound message.
+    treated as read-only representations of the inbound message. Only
+    the method, path, and query string are read eagerly. The
+    headers are a read-only view over the environment, and derived
+    values like ``args``, ``host``, and ``url`` are computed on first
+    access and cached for the rest of the request.
 
     :param environ: Mapping containing the CGI-style WSGI keys for
         the active request.
     """
 
+    __slots__: tuple[str, ...] = (
+        "_args",
+        "_data",
+        "_files",
+        "_form",
+        "_headers",
+        "_host",
+        "_json",
+        "_url",
+        "environ",
+        "method",
+        "path",
+        "query_string",
+        "timer",
+        "url_rule",
+    )
+
     parameter_storage_class: type[MultiDict[str, str]] = MultiDict
+    args_class: type[QueryArgs] = QueryArgs
+    form_parser_class: type[MultiPartParser] = MultiPartParser
 
     def __init__(self, environ: WSGIEnvironment) -> None:
         """Initialise a request object from the WSGI environment."""
         self.environ: WSGIEnvironment = environ
         self.method: str = environ.get("REQUEST_METHOD", "GET").upper()
-        self.scheme: str = environ.get("wsgi.url_scheme", "http")
-        self.server: tuple[str, int | None] | None = _get_server(environ)
-        self.root_path: str = environ.get("SCRIPT_NAME", "")
         self.path: str = environ.get("PATH_INFO", "/")
         self.query_string: str = environ.get("QUERY_STRING", "")
-        self.headers: EnvironHeaders = EnvironHeaders()
-        for key, value in environ.items():
-            if key.startswith("HTTP_"):
-                header = key[5:].replace("_", "-").title()
-                self.headers[header] = value
-            elif key in ("CONTENT_LENGTH", "CONTENT_TYPE"):
-                header = key.replace("_", "-").title()
-                self.headers[header] = value
-        self.remote_addr: str | None = environ.get("REMOTE_ADDR")
-        self.data: bytes = environ.get("miroslava.request_body", b"")
+        self._data: bytes | None = environ.get("miroslava.request_body")
+        self._headers: EnvironHeaders | None = None
+        self._args: QueryArgs | None = None
+        self._host: str | None = None
+        self._url: str | None = None
         self._form: MultiDict[str, str] | None = None
+        self._files: MultiDict[str, FileStorage] | None = None
         self._json: dict[str, t.Any] | None = None
+        self.url_rule: Rule | None = None
+        self.timer: PhaseTimer | None = None
 
     def __repr__(self) -> str:
         """Human-readable representation of the `Request` object."""
         return f"<{type(self).__name__} {self.url} [{self.method}]>"
 
     @property
-    def args(self) -> MultiDict[str, str]:
+    def endpoint(self) -> str | None:
+        """Endpoint of the matched URL rule, once dispatched."""
+        if self.url_rule is None:
+            return None
+        return self.url_rule.endpoint
+
+    @property
+    def scheme(self) -> str:
+        """URL scheme of the request, ``http`` or ``https``."""
+        return self.environ.get("wsgi.url_scheme", "http")
+
+    @property
+    def server(self) -> tuple[str, int | None] | None:
+        """Address of the server as a ``(host, port)`` tuple."""
+        return _get_server(self.environ)
+
+    @property
+    def root_path(self) -> str:
+        """Prefix that the application is mounted under."""
+        return self.environ.get("SCRIPT_NAME", "")
+
+    @property
+    def remote_addr(self) -> str | None:
+        """Address of the client sending the request."""
+        return self.environ.get("REMOTE_ADDR")
+
+    @property
+    def headers(self) -> EnvironHeaders:
+        """Read-only view of the request headers.
+
+        Nothing is copied out of the environment; each lookup reads the
+        matching ``HTTP_*`` key directly.
+        """
+        if self._headers is None:
+            self._headers = EnvironHeaders(self.environ)
+        return self._headers
+
+    @property
+    def args(self) -> QueryArgs:
         """Return parsed query parameters from the URL.
 
-        The query string is decoded into a MultiDict so repeated keys
-        remain accessible.
+        The arguments are a read-only ``MultiDict``-like view so that
+        repeated keys remain accessible. The view is created once per
+        request and only decodes the values of the keys that are looked
+        up, with typed access through ``args.get(key, default, type_)``.
         """
-        return self.parameter_storage_class(
-            parse_qsl(self.query_string, keep_blank_values=True)
-        )
+        if self._args is None:
+            self._args = self.args_class(self.query_string)
+        return self._args
+
+    @property
+    def host(self) -> str:
+        """Host the request was made to, including a non-default port."""
+        if self._host is None:
+            self._host = get_host(
+                self.scheme, self.environ.get("HTTP_HOST"), self.server
+            )
+        return self._host
 
     @property
     def full_path(self) -> str:
@@ -182,21 +268,86 @@ class Request:
         """Properly formatted request URL with scheme, host, and path
         details.
         """
-        return get_current_url(
-            self.scheme,
-            self.host,
-            self.root_path,
-            self.path,
-            self.query_string,
-        )
+        if self._url is None:
+            self._url = get_current_url(
+                self.scheme,
+                self.host,
+                self.root_path,
+                self.path,
+                self.query_string,
+            )
+        return self._url
+
+    @property
+    def max_content_length(self) -> int | None:
+        """Maximum accepted body size, from ``MAX_CONTENT_LENGTH``."""
+        if current_app:
+            return current_app.config.get("MAX_CONTENT_LENGTH")
+        return None
+
+    @property
+    def max_form_part_size(self) -> int | None:
+        """Maximum size of a multipart part, from
+        ``MAX_FORM_PART_SIZE``.
+        """
+        if current_app:
+            return current_app.config.get("MAX_FORM_PART_SIZE")
+        return None
+
+    @property
+    def max_form_memory_size(self) -> int | None:
+        """Maximum size of a multipart text part, from
+        ``MAX_FORM_MEMORY_SIZE``.
+        """
+        if current_app:
+            return current_app.config.get("MAX_FORM_MEMORY_SIZE", 500_000)
+        return 500_000
+
+    @property
+    def max_form_parts(self) -> int | None:
+        """Maximum number of multipart parts, from ``MAX_FORM_PARTS``."""
+        if current_app:
+            return current_app.config.get("MAX_FORM_PARTS", 1000)
+        return 1000
+
+    @property
+    def form_spill_threshold(self) -> int:
+        """Size after which uploads are moved to disk, from
+        ``FORM_SPILL_THRESHOLD``.
+        """
+        if current_app:
+            return current_app.config.get("FORM_SPILL_THRESHOLD", 512 * 1024)
+        return 512 * 1024
+
+    @property
+    def stream(self) -> t.BinaryIO:
+        """Readable stream over the raw request body.
+
+        When the server left the body on the socket, this reads it
+        from there; otherwise it wraps the buffered body.
+        """
+        stream = self.environ.get("wsgi.input")
+        if stream is None or self._data is not None:
+            return io.BytesIO(self.data)
+        return stream
+
+    @property
+    def data(self) -> bytes:
+        """Raw request body as bytes, read in full on first access."""
+        if self._data is None:
+            stream = self.environ.get("wsgi.input")
+            self._data = stream.read() if stream is not None else b""
+        return self._data
 
     @property
     def form(self) -> MultiDict[str, str]:
-        """Return parsed form data for URL-encoded bodies.
+        """Return parsed form data for URL-encoded and multipart bodies.
 
         When the ``Content-Type`` header indicates form submission, the
         cached body is decoded as UTF-8 and split into a ``MultiDict``.
-        When the body is absent or parsing fails, an empty
+        Multipart bodies are parsed incrementally from the stream, and
+        their text fields end up here while uploads end up in
+        ``files``. When the body is absent or parsing fails, an empty
         ``MultiDict`` is provided.
 
         .. note::
@@ -204,19 +355,74 @@ class Request:
             Accessing this property does not mutate the request.
         """
         if self._form is None:
-            if "application/x-www-form-urlencoded" in self.headers.get(
-                "Content-Type", ""
-            ):
-                try:
-                    self._form = self.parameter_storage_class(
-                        parse_qsl(self.data.decode(), keep_blank_values=True)
-                    )
-                except Exception:
-                    self._form = MultiDict()
-            else:
-                self._form = MultiDict()
+            return self._load_form_data()[0]
         return self._form
 
+    @property
+    def files(self) -> MultiDict[str, FileStorage]:
+        """Return files uploaded with a ``multipart/form-data`` body.
+
+        Each value is a ``FileStorage``; small files are held in memory
+        while larger ones are spilled to a temporary file on disk.
+        """
+        if self._files is None:
+            return self._load_form_data()[1]
+        return self._files
+
+    def _load_form_data(
+        self,
+    ) -> tuple[MultiDict[str, str], MultiDict[str, FileStorage]]:
+        """Parse the body into ``form`` and ``files`` once.
+
+        Nothing is cached when parsing fails, so the error is raised
+        again if the view accesses ``form`` or ``files`` a second time.
+
+        :raises BadRequestError: When a multipart body is cut short.
+        :raises RequestEntityTooLargeError: When the body exceeds any
+            of the configured size limits.
+        """
+        form: MultiDict[str, str]
+        files: MultiDict[str, FileStorage] = MultiDict()
+        mimetype, options = parse_options_header(
+            self.headers.get("Content-Type", "")
+        )
+        if mimetype == "application/x-www-form-urlencoded":
+            try:
+                form = self.parameter_storage_class(
+                    parse_qsl(self.data.decode(), keep_blank_values=True)
+                )
+            except Exception:
+                form = MultiDict()
+        elif mimetype == "multipart/form-data" and options.get("boundary"):
+            max_length = self.max_content_length
+            length = self.headers.get("Content-Length", 0, type_=int)
+            if max_length is not None and length > max_length:
+                raise RequestEntityTooLargeError
+            parser = self.form_parser_class(
+                max_part_size=self.max_form_part_size,
+                max_parts=self.max_form_parts,
+                max_memory_size=self.max_form_memory_size,
+                spill_threshold=self.form_spill_threshold,
+            )
+            form, files = parser.parse(self.stream, options["boundary"])
+        else:
+            form = MultiDict()
+        self._form = form
+        self._files = files
+        return form, files
+
+    def close(self) -> None:
+        """Close the files uploaded with the request.
+
+        Called once the response has been sent, so uploads spilled to
+        disk do not outlive the request.
+        """
+        files = self._files
+        if files:
+            for name in files:
+                for storage in files.getlist(name):
+                    storage.close()
+
     @property
     def json(self) -> dict[str, t.Any] | None:
         """Return parsed JSON content when the request body is JSON.
@@ -236,6 +442,12 @@ class Request:
         return self._json
 
 
+def _encode_chunks(chunks: Iterable[bytes] | Iterable[str]) -> Iterator[bytes]:
+    """Yield chunks of a body as bytes, encoding text as UTF-8."""
+    for chunk in chunks:
+        yield chunk if isinstance(chunk, bytes) else str(chunk).encode()
+
+
 class Response:
     """Represents an outgoing WSGI response.
 
@@ -246,6 +458,17 @@ class Response:
     decoded text, and the status line is normalised to include an
     integer code and phrase.
 
+    The body is encoded exactly once, when the response is created, and
+    kept as a single buffer along with its length. Reading ``data``,
+    computing the length for the ``Content-Length`` header, and writing
+    the body to the socket all reuse that buffer. Statuses given as
+    integers are resolved through a precomputed table.
+
+    When the body is an iterator or generator rather than a list, the
+    response is streamed instead. Chunks are encoded and written to the
+    client one at a time as they are produced, and nothing is buffered
+    unless ``data`` is read explicitly.
+
     :param response: Payload content as a string, bytes, iterable of
         bytes, or None for an empty body.
     :param status: HTTP status code or string; integers are matched
@@ -256,10 +479,18 @@ class Response:
     :param content_type: Explicit content type overriding mimetype.
     """
 
+    __slots__: tuple[str, ...] = (
+        "_body",
+        "_iterable",
+        "_length",
+        "_status",
+        "_status_code",
+        "direct_passthrough",
+        "headers",
+    )
+
     default_status: t.ClassVar[int] = 200
     default_mimetype: t.ClassVar[str | None] = "text/html"
-    headers: Headers
-    response: Iterable[str] | Iterable[bytes]
 
     def __init__(
         self,
@@ -273,36 +504,85 @@ class Response:
         direct_passthrough: bool = False,
     ) -> None:
         """Initialise the response object from flexible inputs."""
-        self.headers: Headers = Headers(headers or {})
+        self.headers: Headers = Headers(headers) if headers else Headers()
         if status is None:
             status = self.default_status
-        self.status = status
+        self._status, self._status_code = self._clean_status(status)
         if content_type is None:
-            if mimetype is None and "Content-Type" not in self.headers:
+            if mimetype is None and (
+                not headers or "Content-Type" not in self.headers
+            ):
                 mimetype = self.default_mimetype
             if mimetype is not None:
                 mimetype = get_content_type(mimetype, "utf-8")
             content_type = mimetype
         if content_type:
             self.headers["Content-Type"] = content_type
+        # ``_iterable`` is set while the body is streamed, and ``_body``
+        # then stays empty until ``get_data`` buffers it.
+        self._iterable: Iterable[bytes] | Iterable[str] | None = None
+        self._body: bytes = b""
+        self._length: int | None = None
+        self.direct_passthrough = direct_passthrough
         if response is None:
-            self.response = [b""]
-        elif isinstance(response, str):
-            self.response = [response.encode()]
+            self._set_body(b"")
         elif isinstance(response, bytes):
-            self.response = [response]
+            self._set_body(response)
         else:
-            self.response = [
-                chunk if isinstance(chunk, bytes) else str(chunk).encode()
-                for chunk in response
-            ]
-        self.direct_passthrough = direct_passthrough
+            self.response = response
 
     def __repr__(self) -> str:
         """Human-readable representation of the response object."""
-        body = f"{sum(map(len, self.iter_encoded()))} bytes"
+        if self._iterable is not None:
+            body = "streamed"
+        else:
+            body = f"{self._length} bytes"
         return f"<{type(self).__name__} {body} [{self.status}]>"
 
+    @property
+    def response(self) -> Iterable[bytes] | Iterable[str]:
+        """Return the body as an iterable of chunks."""
+        if self._iterable is not None:
+            return self._iterable
+        return [self._body]
+
+    @response.setter
+    def response(self, value: Iterable[bytes] | Iterable[str] | str) -> None:
+        """Replace the body with a string or an iterable of chunks.
+
+        Lists and tuples are joined into a single buffer right away,
+        while any other iterable is kept as is and streamed. A streamed
+        body has no known length, so any ``Content-Length`` header is
+        removed.
+        """
+        if isinstance(value, str):
+            self._set_body(value.encode())
+        elif isinstance(value, (list, tuple)):
+            self._set_body(b"".join(_encode_chunks(value)))
+        else:
+            self._iterable = value
+            self._body = b""
+            self._length = None
+            self.headers.pop("Content-Length", None)
+
+    def _set_body(self, body: bytes) -> None:
+        """Store a fully encoded body and its length."""
+        self._iterable = None
+        self._body = body
+        self._length = len(body)
+
+    @property
+    def is_streamed(self) -> bool:
+        """Return ``True`` if the body is produced by an iterator."""
+        return self._iterable is not None
+
+    @property
+    def content_length(self) -> int | None:
+        """Return the length of the body in bytes, or ``None`` when the
+        response is streamed.
+        """
+        return self._length
+
     @property
     def status_code(self) -> int:
         """Return HTTP status code as a number."""
@@ -326,40 +606,37 @@ class Response:
     @staticmethod
     def _clean_status(value: int | str | HTTPStatus) -> tuple[str, int]:
         """Normalise status inputs to a numeric code and phrase."""
-        if isinstance(value, HTTPStatus):
-            return f"{value.value} {value.phrase}", value.value
         if isinstance(value, int):
-            try:
-                status = HTTPStatus(value)
-            except ValueError:
-                return str(value), value
-            else:
-                return f"{value} {status.phrase}", value
+            status = _statuses.get(value)
+            if status is None:
+                return str(int(value)), int(value)
+            return status, int(value)
         if isinstance(value, str):
-            parts = value.split(" ", 1)
+            code, _, phrase = value.strip().partition(" ")
             try:
-                status_code = int(parts[0])
-                phrase = parts[1] if len(parts) > 1 else ""
-                if not phrase:
-                    try:
-                        phrase = HTTPStatus(status_code).phrase
-                    except ValueError:
-                        phrase = ""
-                status = f"{status_code} {phrase}".strip()
+                status_code = int(code)
             except ValueError as err:
                 raise ValueError(
                     "Status must start with an integer code"
                 ) from err
-            else:
-                return (
-                    f"{status_code} {HTTP_STATUS_CODES[status_code].upper()}"
-                ), status_code
+            if not phrase:
+                status = _statuses.get(status_code)
+                return status or str(status_code), status_code
+            return f"{status_code} {phrase.strip()}", status_code
         raise TypeError("Invalid status value type")
 
     def iter_encoded(self) -> Iterator[bytes]:
         """Iterate over the response and yield them as bytes."""
-        for item in self.response:
-            yield item if isinstance(item, bytes) else str(item).encode()
+        if self._iterable is not None:
+            yield from _encode_chunks(self._iterable)
+        else:
+            yield self._body
+
+    def close(self) -> None:
+        """Close the body iterable if it supports closing."""
+        close = getattr(self._iterable, "close", None)
+        if close is not None:
+            close()
 
     def get_data(self, as_text: bool = False) -> str | bytes:
         """Return the stored payload as bytes or text.
@@ -367,16 +644,21 @@ class Response:
         :param as_text: When ``True``, decode the body using the
             supplied charset.
         :return: Decoded payload based on passed argument.
+
+        .. note::
+
+            Reading the data of a streamed response consumes the
+            iterator and buffers the whole body.
         """
-        data = b"".join(self.iter_encoded())
-        return data.decode() if as_text else data
+        if self._iterable is not None:
+            self._set_body(b"".join(self.iter_encoded()))
+        return self._body.decode() if as_text else self._body
 
     def set_data(self, value: str | bytes) -> None:
         """Replace the payload data on the response."""
         if isinstance(value, str):
-            self.response = [value.encode()]
-        else:
-            self.response = [value]
-        self.headers["Content-Length"] = str(len(value))
+            value = value.encode()
+        self._set_body(value)
+        self.headers["Content-Length"] = str(self._length)
 
     data = property(get_data, set_data)
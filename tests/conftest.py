@@ -0,0 +1,35 @@
+"""\
+Miroslava's Test Fixtures
+=========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Fixtures shared by the test suite. Every test gets a fresh application
+rooted in a temporary directory, so templates written by one test are
+never seen by another, and a test client for it.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from miroslava import Miroslava
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from miroslava.testing import TestClient
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Miroslava:
+    return Miroslava("tests", root_path=str(tmp_path))
+
+
+@pytest.fixture
+def client(app: Miroslava) -> TestClient:
+    return app.test_client()
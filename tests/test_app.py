@@ -0,0 +1,83 @@
+"""\
+Miroslava's Application Tests
+=============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests for dispatching requests through the ``before_request`` and
+``after_request`` hooks, for views, routing errors, and static files.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from miroslava import Miroslava
+    from miroslava.testing import TestClient
+    from miroslava.wrappers import Response
+
+
+@pytest.fixture
+def hooks(app: Miroslava, tmp_path: Path) -> list[str]:
+    calls: list[str] = []
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "style.css").write_text("body {}")
+
+    @app.before_request
+    def before() -> None:
+        calls.append("before")
+
+    @app.after_request
+    def after(response: Response) -> Response:
+        calls.append("after")
+        response.headers["X-Hooked"] = "yes"
+        return response
+
+    @app.route("/")
+    def index() -> str:
+        return "Hello"
+
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "status", "expected"),
+    (
+        ("GET", "/", 200, ["before", "after"]),
+        ("GET", "/static/style.css", 200, ["before", "after"]),
+        ("GET", "/static/missing.css", 404, ["before", "after"]),
+        ("GET", "/missing", 404, ["after"]),
+        ("POST", "/", 405, ["after"]),
+    ),
+)
+def test_hooks(
+    client: TestClient,
+    hooks: list[str],
+    method: str,
+    path: str,
+    status: int,
+    expected: list[str],
+) -> None:
+    response = client.open(path, method)
+    assert response.status_code == status
+    assert response.headers["X-Hooked"] == "yes"
+    assert hooks == expected
+
+
+def test_before_request_covers_static(
+    app: Miroslava, client: TestClient, hooks: list[str]
+) -> None:
+    @app.before_request
+    def refuse() -> tuple[str, int]:
+        return "Forbidden", 403
+
+    response = client.get("/static/style.css")
+    assert response.status_code == 403
+    assert hooks == ["before", "after"]
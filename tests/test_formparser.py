@@ -0,0 +1,134 @@
+"""\
+Miroslava's Form Parser Tests
+=============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests for parsing url-encoded and multipart bodies, and for the ``400``
+and ``413`` responses sent when a body is cut short or too large.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+
+from miroslava import request
+from miroslava.testing import encode_multipart
+
+if t.TYPE_CHECKING:
+    from miroslava import Miroslava
+    from miroslava.testing import TestClient
+
+BOUNDARY: t.Final[str] = "boundary"
+MULTIPART: t.Final[str] = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def echo_form(app: Miroslava) -> None:
+    @app.route("/", methods=["POST"])
+    def index() -> dict[str, t.Any]:
+        return {
+            "form": {key: request.form.getlist(key) for key in request.form},
+            "files": {
+                key: [storage.filename, storage.read().decode()]
+                for key, storage in request.files.items()
+            },
+        }
+
+
+def test_urlencoded(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    response = client.post("/", data={"name": "Akshay", "city": "Zürich"})
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {
+        "form": {"name": ["Akshay"], "city": ["Zürich"]},
+        "files": {},
+    }
+
+
+def test_multipart(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    response = client.post(
+        "/",
+        data={
+            "title": "notes",
+            "upload": ("notes.txt", b"first\r\nsecond", "text/plain"),
+        },
+    )
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {
+        "form": {"title": ["notes"]},
+        "files": {"upload": ["notes.txt", "first\r\nsecond"]},
+    }
+
+
+def test_multipart_spills_large_files(
+    app: Miroslava, client: TestClient
+) -> None:
+    echo_form(app)
+    content = b"x" * (1024 * 1024)
+    response = client.post("/", data={"upload": ("big.bin", content)})
+    assert response.status_code == 200
+    assert (
+        json.loads(response.get_data())["files"]["upload"][1]
+        == content.decode()
+    )
+
+
+def test_truncated_multipart(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    body = encode_multipart({"upload": ("a.txt", b"content")}, BOUNDARY)
+    for cut in (len(body) // 2, len(body) - 10):
+        response = client.post("/", data=body[:cut], content_type=MULTIPART)
+        assert response.status_code == 400
+
+
+def test_multipart_without_boundary(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    response = client.post("/", data=b"no parts", content_type=MULTIPART)
+    assert response.status_code == 400
+
+
+def test_max_content_length(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    app.config["MAX_CONTENT_LENGTH"] = 100
+    response = client.post("/", data={"upload": ("a.bin", b"x" * 200)})
+    assert response.status_code == 413
+
+
+def test_max_form_part_size(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    app.config["MAX_FORM_PART_SIZE"] = 100
+    response = client.post("/", data={"upload": ("a.bin", b"x" * 200)})
+    assert response.status_code == 413
+    response = client.post("/", data={"upload": ("a.bin", b"x" * 50)})
+    assert response.status_code == 200
+
+
+def test_max_form_memory_size(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    text = "x" * 600_000
+    upload = {"upload": ("a.txt", text.encode())}
+    assert client.post("/", data=upload).status_code == 200
+    response = client.post(
+        "/",
+        data=encode_multipart({"title": text}, BOUNDARY),
+        content_type=MULTIPART,
+    )
+    assert response.status_code == 413
+    app.config["MAX_FORM_MEMORY_SIZE"] = None
+    response = client.post(
+        "/",
+        data=encode_multipart({"title": text}, BOUNDARY),
+        content_type=MULTIPART,
+    )
+    assert response.status_code == 200
+
+
+def test_max_form_parts(app: Miroslava, client: TestClient) -> None:
+    echo_form(app)
+    app.config["MAX_FORM_PARTS"] = 2
+    fields = {f"field{n}": ("a.txt", b"x") for n in range(3)}
+    assert client.post("/", data=fields).status_code == 413
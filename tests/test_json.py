@@ -0,0 +1,128 @@
+"""\
+Miroslava's JSON Tests
+======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests for JSON request bodies and responses, including the compact
+output outside debug mode, the serialisation of dates by the
+``CompactJSONProvider``, and streamed documents and records.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+
+from miroslava import jsonify
+from miroslava import jsonify_stream
+from miroslava import request
+from miroslava.utils import CompactJSONProvider
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from miroslava import Miroslava
+    from miroslava.testing import TestClient
+    from miroslava.wrappers import Response
+
+PAYLOAD: t.Final[dict[str, t.Any]] = {"name": "Miroslava", "tags": [1, 2]}
+
+
+def add_views(app: Miroslava) -> None:
+    @app.route("/")
+    def index() -> dict[str, t.Any]:
+        return PAYLOAD
+
+    @app.route("/jsonify")
+    def jsonified() -> Response:
+        return jsonify(PAYLOAD)
+
+    @app.route("/echo", methods=["POST"])
+    def echo() -> dict[str, t.Any] | None:
+        return request.json
+
+
+def test_compact_by_default(app: Miroslava, client: TestClient) -> None:
+    add_views(app)
+    for path in ("/", "/jsonify"):
+        response = client.get(path)
+        assert response.headers["Content-Type"] == "application/json"
+        assert response.get_data() == b'{"name":"Miroslava","tags":[1,2]}'
+
+
+def test_indented_in_debug(app: Miroslava, client: TestClient) -> None:
+    add_views(app)
+    app.debug = True
+    data = client.get("/").get_data(as_text=True)
+    assert data == json.dumps(PAYLOAD, indent=2)
+
+
+def test_request_json(app: Miroslava, client: TestClient) -> None:
+    add_views(app)
+    response = client.post("/echo", json={"city": "Zürich"})
+    assert json.loads(response.get_data()) == {"city": "Zürich"}
+
+
+def test_dates(app: Miroslava, client: TestClient) -> None:
+    app.json = CompactJSONProvider()
+
+    @app.route("/")
+    def index() -> dict[str, t.Any]:
+        return {
+            "aware": datetime(2026, 10, 18, 14, 0, tzinfo=UTC),
+            "naive": datetime(2026, 10, 18, 14, 0),  # noqa: DTZ001
+            "day": date(2026, 10, 18),
+        }
+
+    assert json.loads(client.get("/").get_data()) == {
+        "aware": "Sun, 18 Oct 2026 14:00:00 GMT",
+        "naive": "Sun, 18 Oct 2026 14:00:00 GMT",
+        "day": "Sun, 18 Oct 2026 00:00:00 GMT",
+    }
+
+
+def test_stream_document(app: Miroslava, client: TestClient) -> None:
+    rows = [{"id": n, "name": f"row {n}"} for n in range(1000)]
+
+    @app.route("/")
+    def index() -> Response:
+        return jsonify_stream(rows)
+
+    response = client.get("/")
+    assert response.is_streamed
+    assert response.headers["Content-Type"] == "application/json"
+    assert json.loads(response.get_data()) == rows
+
+
+def test_stream_records(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> Response:
+        def records() -> Iterator[dict[str, int]]:
+            for n in range(3):
+                yield {"id": n}
+
+        return jsonify_stream(records())
+
+    app.debug = True
+    response = client.get("/")
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert response.get_data() == b'{"id":0}\n{"id":1}\n{"id":2}\n'
+
+
+def test_stream_with_compact_provider(
+    app: Miroslava, client: TestClient
+) -> None:
+    app.json = CompactJSONProvider()
+
+    @app.route("/")
+    def index() -> Response:
+        return jsonify_stream([{"day": date(2026, 10, 18)}])
+
+    response = client.get("/")
+    assert response.get_data() == b'[{"day":"Sun, 18 Oct 2026 00:00:00 GMT"}]'
@@ -0,0 +1,100 @@
+"""\
+Miroslava's Serving Tests
+=========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests for serialising response heads, in particular the ``Date`` and
+``Server`` headers added on behalf of views.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from miroslava.serving import SERVER_HEADER
+from miroslava.serving import serialise_head
+
+if t.TYPE_CHECKING:
+    from miroslava import Miroslava
+    from miroslava.testing import TestClient
+    from miroslava.wrappers import Response
+
+DATE: t.Final[str] = "Sun, 18 Oct 2026 12:00:00 GMT"
+
+
+def head_lines(response: Response) -> list[bytes]:
+    head = serialise_head(response, len(response.get_data()))
+    return head.split(b"\r\n")
+
+
+def header_names(lines: list[bytes]) -> list[bytes]:
+    return [line.partition(b":")[0] for line in lines[1:] if line]
+
+
+def add_views(app: Miroslava) -> None:
+    @app.route("/")
+    def index() -> str:
+        return "Hello"
+
+    @app.route("/date")
+    def dated() -> tuple[str, dict[str, str]]:
+        return "Hello", {"Date": DATE}
+
+    @app.route("/server")
+    def served() -> tuple[str, dict[str, str]]:
+        return "Hello", {"Server": "Custom"}
+
+
+def test_default_head(app: Miroslava, client: TestClient) -> None:
+    add_views(app)
+    lines = head_lines(client.get("/"))
+    assert lines[0] == b"HTTP/1.1 200 OK"
+    assert header_names(lines).count(b"Date") == 1
+    assert SERVER_HEADER.rstrip(b"\r\n") in lines
+    assert b"Content-Length: 5" in lines
+    assert lines[-2:] == [b"", b""]
+
+
+def test_view_date_keeps_server(app: Miroslava, client: TestClient) -> None:
+    add_views(app)
+    lines = head_lines(client.get("/date"))
+    assert f"Date: {DATE}".encode() in lines
+    assert header_names(lines).count(b"Date") == 1
+    assert SERVER_HEADER.rstrip(b"\r\n") in lines
+
+
+def test_view_server_keeps_date(app: Miroslava, client: TestClient) -> None:
+    add_views(app)
+    lines = head_lines(client.get("/server"))
+    assert b"Server: Custom" in lines
+    assert header_names(lines).count(b"Server") == 1
+    assert header_names(lines).count(b"Date") == 1
+
+
+def test_content_length_from_body(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> tuple[str, dict[str, str]]:
+        return "Hello", {"Content-Length": "99"}
+
+    lines = head_lines(client.get("/"))
+    assert b"Content-Length: 5" in lines
+    assert header_names(lines).count(b"Content-Length") == 1
+
+
+def test_streamed_head_is_chunked(client: TestClient, app: Miroslava) -> None:
+    @app.route("/stream")
+    def stream() -> t.Iterator[str]:
+        yield "Hello"
+
+    response = client.get("/stream")
+    lines = serialise_head(response, None).split(b"\r\n")
+    assert b"Transfer-Encoding: chunked" in lines
+    assert b"Content-Length" not in header_names(lines)
+    response = app.response_class(iter([b"Hello"]))
+    response.headers["Content-Length"] = "99"
+    lines = serialise_head(response, None).split(b"\r\n")
+    assert b"Transfer-Encoding: chunked" in lines
+    assert b"Content-Length" not in header_names(lines)
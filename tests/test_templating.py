@@ -0,0 +1,130 @@
+"""\
+Miroslava's Templating Tests
+============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests for rendering and streaming templates from a view, and for how
+templates are found, reloaded, and preloaded.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from miroslava import Markup
+from miroslava import Template
+from miroslava import render_template
+from miroslava import stream_template
+from miroslava.templating import TemplateSyntaxError
+from miroslava.utils import TemplateNotFoundError
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from miroslava import Miroslava
+    from miroslava.testing import TestClient
+
+PAGE: t.Final[str] = """\
+<h1>{{ title }}</h1>{# dropped #}
+{% for user in users %}{% if user.active %}<li>{{ user.name }}</li>{% endif %}\
+{% endfor %}"""
+
+
+@pytest.fixture
+def templates(tmp_path: Path) -> Path:
+    folder = tmp_path / "templates"
+    folder.mkdir()
+    (folder / "page.html").write_text(PAGE)
+    return folder
+
+
+@pytest.mark.usefixtures("templates")
+def test_render(app: Miroslava, client: TestClient) -> None:
+    users = [
+        {"name": "<Akshay>", "active": True},
+        {"name": "Eve", "active": False},
+    ]
+
+    @app.route("/")
+    def index() -> str:
+        return render_template("page.html", title="Users", users=users)
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == (
+        "<h1>Users</h1>\n<li>&lt;Akshay&gt;</li>"
+    )
+
+
+@pytest.mark.usefixtures("templates")
+def test_stream(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> Iterator[str]:
+        return stream_template("page.html", title="Users", users=[])
+
+    response = client.get("/")
+    assert response.is_streamed
+    assert response.get_data(as_text=True) == "<h1>Users</h1>\n"
+
+
+@pytest.mark.usefixtures("templates")
+def test_fallback_names(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> str:
+        return render_template(["missing.html", "page.html"], title="Hi")
+
+    assert client.get("/").get_data(as_text=True) == "<h1>Hi</h1>\n"
+
+
+def test_not_found(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> str:
+        return render_template("missing.html")
+
+    with pytest.raises(TemplateNotFoundError):
+        client.get("/")
+
+
+def test_auto_reload(
+    app: Miroslava, client: TestClient, templates: Path
+) -> None:
+    app.config["TEMPLATES_AUTO_RELOAD"] = True
+
+    @app.route("/")
+    def index() -> str:
+        return render_template("new.html", title="Hi")
+
+    with pytest.raises(TemplateNotFoundError):
+        client.get("/")
+    (templates / "new.html").write_text("<p>{{ title }}</p>")
+    assert client.get("/").get_data(as_text=True) == "<p>Hi</p>"
+    (templates / "new.html").write_text("<p>{{ title }}!</p>")
+    assert client.get("/").get_data(as_text=True) == "<p>Hi!</p>"
+    (templates / "new.html").unlink()
+    with pytest.raises(TemplateNotFoundError):
+        client.get("/")
+
+
+def test_preload_skips_broken(app: Miroslava, templates: Path) -> None:
+    (templates / "broken.html").write_text("{% for x in y %}")
+    (templates / "logo.png").write_bytes(b"\x89PNG\xff\xfe")
+    assert app.preload_templates() == 1
+
+
+def test_safe_and_markup() -> None:
+    template = Template(
+        "{{ raw | safe }}{{ markup }}{{ text }}", autoescape=True
+    )
+    rendered = template.render(raw="<b>", markup=Markup("<i>"), text="<u>")
+    assert rendered == "<b><i>&lt;u&gt;"
+
+
+def test_syntax_error() -> None:
+    with pytest.raises(TemplateSyntaxError):
+        Template("{% for x in y %}")
@@ -0,0 +1,143 @@
+"""\
+Miroslava's Test Client Tests
+=============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests for the in-process test client: building requests, streamed
+request and response bodies, cookies, and the request context being
+released whatever happens in the view.
+"""
+
+from __future__ import annotations
+
+import io
+import typing as t
+
+import pytest
+
+from miroslava import request
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from miroslava import Miroslava
+    from miroslava.testing import TestClient
+    from miroslava.wrappers import Response
+
+
+def test_query_and_headers(app: Miroslava, client: TestClient) -> None:
+    @app.route("/<name>")
+    def index(name: str) -> str:
+        return f"{name} {request.args.get('q')} {request.headers['X-Id']}"
+
+    response = client.get(
+        "/akshay", query_string={"q": "a b"}, headers={"X-Id": "7"}
+    )
+    assert response.get_data(as_text=True) == "akshay a b 7"
+
+
+def test_not_found_and_method(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> str:
+        return "Hello"
+
+    assert client.get("/missing").status_code == 404
+    assert client.post("/").status_code == 405
+
+
+def test_streamed_response(app: Miroslava, client: TestClient) -> None:
+    @app.route("/")
+    def index() -> Iterator[str]:
+        for n in range(3):
+            yield f"{request.path}{n};"
+
+    response = client.get("/")
+    assert response.is_streamed
+    assert response.get_data() == b"/0;/1;/2;"
+    assert response.get_data() == b"/0;/1;/2;"
+
+
+def test_streamed_response_is_closed(
+    app: Miroslava, client: TestClient
+) -> None:
+    closed = []
+
+    @app.route("/")
+    def index() -> Response:
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield b"Hello"
+            finally:
+                closed.append(True)
+
+        return app.response_class(chunks())
+
+    assert client.get("/").get_data() == b"Hello"
+    assert closed == [True]
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b"streamed body",
+        io.BytesIO(b"streamed body"),
+        [b"streamed", b" ", b"body"],
+    ),
+)
+def test_request_body(app: Miroslava, client: TestClient, data: t.Any) -> None:
+    @app.route("/", methods=["PUT"])
+    def index() -> bytes:
+        return request.data
+
+    assert client.put("/", data=data).get_data() == b"streamed body"
+
+
+def test_cookies(app: Miroslava, client: TestClient) -> None:
+    @app.route("/login")
+    def login() -> Response:
+        response = app.response_class("ok")
+        response.headers.add("Set-Cookie", "sid=abc; Path=/; HttpOnly")
+        return response
+
+    @app.route("/logout")
+    def logout() -> Response:
+        response = app.response_class("bye")
+        response.headers.add("Set-Cookie", "sid=; Max-Age=0")
+        return response
+
+    @app.route("/")
+    def index() -> str:
+        return request.headers.get("Cookie", "-")
+
+    client.get("/login")
+    assert client.get("/").get_data() == b"sid=abc"
+    client.get("/logout")
+    assert client.get("/").get_data() == b"-"
+    assert app.test_client(use_cookies=False).get("/").get_data() == b"-"
+
+
+def test_teardown_and_context(app: Miroslava, client: TestClient) -> None:
+    errors: list[BaseException | None] = []
+
+    @app.teardown_request
+    def teardown(error: BaseException | None) -> None:
+        errors.append(error)
+
+    @app.route("/")
+    def index() -> str:
+        return "Hello"
+
+    @app.route("/boom")
+    def boom() -> str:
+        raise RuntimeError("boom")
+
+    client.get("/")
+    with pytest.raises(RuntimeError, match="boom"):
+        client.get("/boom")
+    assert errors[0] is None
+    assert isinstance(errors[1], RuntimeError)
+    assert not request
+    assert client.get("/").status_code == 200